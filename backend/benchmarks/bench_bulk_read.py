@@ -0,0 +1,109 @@
+"""Compare validated and trusted bulk reads for the list queries.
+
+Usage: python benchmarks/bench_bulk_read.py --rows 10000 --rows 100000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import click
+from leettools.common.utils import time_utils
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import Message, ResearchSession
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+SESSION_ID = "bench-session"
+USER_ID = "bench-user"
+
+
+def _settings(root: Path) -> SystemSettings:
+    settings = SystemSettings()
+    settings.DATA_ROOT = str(root / "data")
+    settings.LOG_ROOT = str(root / "logs")
+    settings.DUCKDB_PATH = str(root / "duckdb")
+    return settings
+
+
+async def _populate(stores: StoreRegistryDuckDB, rows: int) -> None:
+    now = time_utils.cur_timestamp_in_ms()
+    await stores.message_store.store.insert_many(
+        [
+            Message(
+                message_id=f"message-{idx}",
+                session_id=SESSION_ID,
+                role="user" if idx % 2 else "assistant",
+                content=f"message body {idx} " * 8,
+                created_at=now + idx,
+            )
+            for idx in range(rows)
+        ]
+    )
+    await stores.session_store.store.insert_many(
+        [
+            ResearchSession(
+                session_id=f"session-{idx:08d}",
+                user_id=USER_ID,
+                prompt=f"research prompt {idx}",
+                status="completed",
+                created_at=now + idx,
+                updated_at=now + idx,
+            )
+            for idx in range(rows)
+        ]
+    )
+
+
+async def _time(fn: Callable[[], Awaitable[list]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def _run(rows: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = StoreRegistryDuckDB(_settings(Path(tmp)))
+        try:
+            await _populate(stores, rows)
+            messages = stores.message_store.store
+            sessions = stores.session_store.store
+            message_query = ("WHERE session_id = ? ORDER BY created_at ASC", [SESSION_ID])
+            session_query = (
+                "WHERE user_id = ? ORDER BY created_at DESC, session_id DESC LIMIT ?",
+                [USER_ID, rows],
+            )
+            cases = {
+                "list_for_session": (messages, message_query),
+                "list_for_user": (sessions, session_query),
+            }
+            for name, (base, (where_clause, values)) in cases.items():
+                validated = await _time(lambda: base.fetch_all(where_clause, values), repeat)
+                trusted = await _time(
+                    lambda: base.fetch_all_trusted(where_clause, values), repeat
+                )
+                click.echo(
+                    f"{name:<18} rows={rows:<7} validated={validated:9.1f}ms "
+                    f"trusted={trusted:9.1f}ms speedup={validated / trusted:5.1f}x"
+                )
+        finally:
+            stores.close()
+
+
+@click.command()
+@click.option("--rows", "row_counts", multiple=True, type=int, default=(10_000, 100_000))
+@click.option("--repeat", default=3, show_default=True, help="Runs per case; best is reported.")
+def main(row_counts: tuple[int, ...], repeat: int) -> None:
+    for rows in row_counts:
+        asyncio.run(_run(rows, repeat))
+
+
+if __name__ == "__main__":
+    main()
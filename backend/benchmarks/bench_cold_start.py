@@ -0,0 +1,125 @@
+"""Cold start of the API: import time, app construction and the first /health response.
+
+Each run is a fresh interpreter so nothing is already imported. The median
+of the runs is compared with ``cold_start_budget.json``; ``--check`` exits
+non-zero when any phase is over budget. The test suite runs that check
+only when ``INFOGRAPH_BENCH_COLD_START=1`` is set.
+
+Usage: python benchmarks/bench_cold_start.py --runs 5 --check
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+BUDGET_PATH = BENCH_DIR / "cold_start_budget.json"
+PHASES = ("import_ms", "create_app_ms", "first_health_ms")
+
+# Runs in the child interpreter. The request is driven through the ASGI
+# interface directly so no HTTP client library is imported before timing.
+CHILD = """
+import asyncio, json, sys, time
+
+start = time.perf_counter()
+from infograph.svc.api_service import create_app
+imported = time.perf_counter()
+app = create_app(store_backend=sys.argv[1])
+created = time.perf_counter()
+
+async def first_health():
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": "/api/v1/health",
+        "raw_path": b"/api/v1/health", "query_string": b"", "root_path": "",
+        "headers": [], "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 80),
+    }
+    await app(scope, receive, send)
+    return sent[0]["status"]
+
+status = asyncio.run(first_health())
+answered = time.perf_counter()
+print(json.dumps({
+    "status": status,
+    "import_ms": (imported - start) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_health_ms": (answered - created) * 1000,
+}))
+"""
+
+
+def measure_once(store_backend: str) -> dict[str, float]:
+    """Time one cold start in a fresh interpreter with its own data directory."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    env.setdefault("GOOGLE_CLIENT_ID", "bench-google")
+    env.setdefault("JWT_SECRET", "bench-secret")
+    with tempfile.TemporaryDirectory() as tmp:
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD, store_backend],
+            cwd=tmp,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Cold start exited with {result.returncode}:\n{result.stderr.strip()}"
+        )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    if timings.pop("status") != 200:
+        raise RuntimeError("/health did not answer 200")
+    return timings
+
+
+def measure(runs: int, store_backend: str) -> dict[str, float]:
+    """Median of each phase over ``runs`` cold starts."""
+    samples = [measure_once(store_backend) for _ in range(runs)]
+    return {phase: statistics.median(s[phase] for s in samples) for phase in PHASES}
+
+
+def over_budget(timings: dict[str, float], budget: dict[str, float]) -> list[str]:
+    return [
+        f"{phase} {timings[phase]:.1f}ms > {budget[phase]:.1f}ms"
+        for phase in PHASES
+        if timings[phase] > budget[phase]
+    ]
+
+
+def load_budget() -> dict[str, float]:
+    return json.loads(BUDGET_PATH.read_text())
+
+
+@click.command()
+@click.option("--runs", default=5, show_default=True, help="Cold starts; the median is reported.")
+@click.option("--store-backend", default="duckdb", show_default=True)
+@click.option("--check", is_flag=True, help="Exit 1 when a phase exceeds the budget.")
+def main(runs: int, store_backend: str, check: bool) -> None:
+    timings = measure(runs, store_backend)
+    budget = load_budget()
+    for phase in PHASES:
+        click.echo(f"{phase:<16} {timings[phase]:8.1f}ms  budget {budget[phase]:8.1f}ms")
+    failures = over_budget(timings, budget)
+    if check and failures:
+        raise click.ClickException("Cold start over budget: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Message ingest throughput with per-message commits vs write-behind batches.
+
+Usage: python benchmarks/bench_message_ingest.py --messages 5000 --batch-size 64
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import MessageCreate
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.duckdb.buffered_message_store_duckdb import BufferedMessageStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+
+
+def _settings(root: Path) -> SystemSettings:
+    settings = SystemSettings()
+    settings.DATA_ROOT = str(root / "data")
+    settings.LOG_ROOT = str(root / "logs")
+    settings.DUCKDB_PATH = str(root / "duckdb")
+    return settings
+
+
+async def _ingest(store: AbstractMessageStore, messages: int, concurrency: int) -> float:
+    async def writer(offset: int) -> None:
+        for idx in range(offset, messages, concurrency):
+            await store.create(
+                MessageCreate(session_id=f"session-{idx % 50}", role="user", content=f"m{idx}")
+            )
+
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(offset) for offset in range(concurrency)))
+    if isinstance(store, BufferedMessageStoreDuckDB):
+        await store.flush()
+    return messages / (time.perf_counter() - start)
+
+
+async def _run(messages: int, batch_sizes: tuple[int, ...], concurrency: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        inner = MessageStoreDuckDB(_settings(Path(tmp)))
+        rate = await _ingest(inner, messages, concurrency)
+        click.echo(f"{'direct':<16} {rate:10.0f} msg/s")
+        for batch_size in batch_sizes:
+            buffered = BufferedMessageStoreDuckDB(inner, batch_size=batch_size)
+            rate = await _ingest(buffered, messages, concurrency)
+            click.echo(f"{f'batch={batch_size}':<16} {rate:10.0f} msg/s")
+        inner.store.executor.shutdown()
+
+
+@click.command()
+@click.option("--messages", default=5000, show_default=True)
+@click.option("--batch-size", "batch_sizes", multiple=True, type=int, default=(16, 64, 256))
+@click.option("--concurrency", default=16, show_default=True)
+def main(messages: int, batch_sizes: tuple[int, ...], concurrency: int) -> None:
+    asyncio.run(_run(messages, batch_sizes, concurrency))
+
+
+if __name__ == "__main__":
+    main()
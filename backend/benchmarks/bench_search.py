@@ -0,0 +1,114 @@
+"""Time history search and its matching step, by posting-key probe and by scan.
+
+Usage: python benchmarks/bench_search.py --sessions 100000 --users 1000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import click
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import SearchDocument
+from infograph.stores.duckdb.search_index_store_duckdb import SearchIndexStoreDuckDB
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+from infograph.stores.search_utils import posting_key, tokenize
+
+VOCABULARY = [f"term{idx}" for idx in range(2_000)]
+TERMS_PER_DOCUMENT = 12
+QUERY = "term7 term42 term1999"
+# Documents indexed per index_documents call while seeding.
+SEED_BATCH = 5_000
+
+
+def _settings(root: Path) -> SystemSettings:
+    settings = SystemSettings()
+    settings.DATA_ROOT = str(root / "data")
+    settings.LOG_ROOT = str(root / "logs")
+    settings.DUCKDB_PATH = str(root / "duckdb")
+    return settings
+
+
+async def _populate(index: SearchIndexStoreDuckDB, sessions: int, users: int) -> None:
+    rng = random.Random(0)
+    batch: list[SearchDocument] = []
+    for idx in range(sessions):
+        batch.append(
+            SearchDocument(
+                doc_id=f"prompt:session-{idx:08d}",
+                user_id=f"user-{idx % users:05d}",
+                session_id=f"session-{idx:08d}",
+                kind="prompt",
+                text=" ".join(rng.choices(VOCABULARY, k=TERMS_PER_DOCUMENT)),
+            )
+        )
+        if len(batch) == SEED_BATCH:
+            await index.index_documents(batch)
+            batch = []
+    if batch:
+        await index.index_documents(batch)
+
+
+async def _match_by_columns(index: SearchIndexStoreDuckDB, user_id: str) -> list:
+    """Matching step filtered on the user_id and term columns: a full scan."""
+    return await index.postings.executor.fetch_all(
+        f"SELECT session_id FROM {index.postings.table_name} "
+        "WHERE user_id = ? AND list_contains(?, term)",
+        [user_id, sorted(set(tokenize(QUERY)))],
+    )
+
+
+async def _match_by_key(index: SearchIndexStoreDuckDB, user_id: str) -> list:
+    """Matching step as search runs it: index probes on posting_key."""
+    keys = [posting_key(user_id, term) for term in sorted(set(tokenize(QUERY)))]
+    return await index.postings.executor.fetch_all(
+        f"SELECT session_id FROM {index.postings.table_name} "
+        f"WHERE posting_key IN ({','.join(['?'] * len(keys))})",
+        keys,
+    )
+
+
+async def _time(fn: Callable[[], Awaitable[list]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def _run(sessions: int, users: int, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        stores = StoreRegistryDuckDB(_settings(Path(tmp)))
+        try:
+            index = stores.search_index_store
+            await _populate(index, sessions, users)
+            user_id = "user-00007"
+            scan = await _time(lambda: _match_by_columns(index, user_id), repeat)
+            probe = await _time(lambda: _match_by_key(index, user_id), repeat)
+            search = await _time(lambda: index.search(user_id, QUERY), repeat)
+            click.echo(
+                f"sessions={sessions:<7} users={users:<5} match: scan={scan:8.2f}ms "
+                f"probe={probe:8.2f}ms speedup={scan / probe:5.1f}x | search={search:8.2f}ms"
+            )
+        finally:
+            stores.close()
+
+
+@click.command()
+@click.option("--sessions", "session_counts", multiple=True, type=int, default=(100_000,))
+@click.option("--users", default=1_000, show_default=True, help="Users the sessions spread over.")
+@click.option("--repeat", default=5, show_default=True, help="Runs per case; best is reported.")
+def main(session_counts: tuple[int, ...], users: int, repeat: int) -> None:
+    for sessions in session_counts:
+        asyncio.run(_run(sessions, users, repeat))
+
+
+if __name__ == "__main__":
+    main()
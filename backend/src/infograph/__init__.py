@@ -1,5 +1,14 @@
 """Infograph backend package."""
 
-from .svc.main import main
+from typing import Any
 
 __all__ = ["svc", "main"]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the CLI pulls in click, uvicorn and the app; only do it when asked.
+    if name == "main":
+        from .svc.main import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,21 @@
-from .user import UserCreate, User
-from .research_session import ResearchSessionCreate, ResearchSessionUpdate, ResearchSession
+from .user import UserCreate, User, UserProfile
+from .research_session import (
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    ResearchSession,
+    SessionStatus,
+)
 from .source import SourceCreate, Source
 from .infographic import InfographicCreate, Infographic
 from .message import MessageCreate, Message
+from .search import (
+    SearchDocument,
+    SearchHit,
+    SearchPosting,
+    SearchUserStats,
+    SessionSearchResult,
+)
+from .session_detail import SessionDetail
+from .archive import ArchivedSession
+from .shard import SessionShard, UserShard
+from .schema_version import SchemaVersion
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from leettools.common.utils.obj_utils import add_fieldname_constants
+from pydantic import BaseModel, Field
+
+
+@add_fieldname_constants
+class ArchivedSession(BaseModel):
+    """Index entry for a session moved from the hot tables into a Parquet batch."""
+
+    session_id: str = Field(..., json_schema_extra={"primary_key": True})
+    user_id: str = Field(..., json_schema_extra={"index": True})
+    created_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
+    batch_id: str
+    archived_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
@@ -6,19 +6,25 @@ from leettools.common.utils.obj_utils import add_fieldname_constants
 from pydantic import BaseModel, Field
 
 
+SessionStatus = Literal["pending", "searching", "generating", "completed", "failed"]
+
+
 class ResearchSessionCreate(BaseModel):
     prompt: str
 
 
 class ResearchSessionUpdate(BaseModel):
-    status: Literal["pending", "searching", "generating", "completed", "failed"] | None = None
+    status: SessionStatus | None = None
 
 
 @add_fieldname_constants
 class ResearchSession(BaseModel):
     session_id: str = Field(..., json_schema_extra={"primary_key": True})
-    user_id: str = Field(..., json_schema_extra={"index": True})
+    user_id: str = Field(
+        ...,
+        json_schema_extra={"index": True, "composite_index": ["user_id", "created_at"]},
+    )
     prompt: str
-    status: Literal["pending", "searching", "generating", "completed", "failed"]
+    status: SessionStatus
     created_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
     updated_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
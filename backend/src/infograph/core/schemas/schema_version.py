@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from leettools.common.utils.obj_utils import add_fieldname_constants
+from pydantic import BaseModel, Field
+
+
+@add_fieldname_constants
+class SchemaVersion(BaseModel):
+    """Schema revision a table was last created or migrated to."""
+
+    table_name: str = Field(..., json_schema_extra={"primary_key": True})
+    qualified_name: str
+    version: int
+    fingerprint: str
+    updated_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from leettools.common.utils.obj_utils import add_fieldname_constants
+from pydantic import BaseModel, Field
+
+from infograph.core.schemas.research_session import ResearchSession
+
+
+class SearchDocument(BaseModel):
+    """A piece of a user's history to be made searchable."""
+
+    doc_id: str
+    user_id: str
+    session_id: str
+    kind: Literal["prompt", "source", "message"]
+    text: str
+
+
+class SearchHit(BaseModel):
+    session_id: str
+    score: float
+
+
+class SessionSearchResult(BaseModel):
+    session: ResearchSession
+    score: float
+
+
+@add_fieldname_constants
+class SearchPosting(BaseModel):
+    """One term occurrence count for one document in the inverted index."""
+
+    term: str
+    doc_id: str
+    user_id: str
+    # user_id and term joined by POSTING_KEY_SEPARATOR. Searches probe this
+    # single-column index; DuckDB never uses a (user_id, term) index for them.
+    posting_key: str = Field(
+        ...,
+        json_schema_extra={
+            "composite_index": ["posting_key"],
+            "backfill": "user_id || chr(31) || term",
+        },
+    )
+    session_id: str = Field(..., json_schema_extra={"index": True})
+    term_freq: int
+    doc_length: int
+
+
+@add_fieldname_constants
+class SearchUserStats(BaseModel):
+    """Per-user corpus statistics needed for BM25 normalisation."""
+
+    user_id: str = Field(..., json_schema_extra={"primary_key": True})
+    doc_count: int
+    total_length: int
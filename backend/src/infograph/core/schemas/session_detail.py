@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from infograph.core.schemas.infographic import Infographic
+from infograph.core.schemas.message import Message
+from infograph.core.schemas.research_session import ResearchSession
+from infograph.core.schemas.source import Source
+
+
+class SessionDetail(BaseModel):
+    """Everything the session page needs, loaded in one request."""
+
+    session: ResearchSession
+    sources: list[Source]
+    messages: list[Message]
+    infographic: Infographic | None = None
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from leettools.common.utils.obj_utils import add_fieldname_constants
+from pydantic import BaseModel, Field
+
+
+@add_fieldname_constants
+class UserShard(BaseModel):
+    """The shard that holds everything a user owns."""
+
+    user_id: str = Field(..., json_schema_extra={"primary_key": True})
+    shard: int
+    updated_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
+
+
+@add_fieldname_constants
+class SessionShard(BaseModel):
+    """Directory entry that routes session-keyed lookups to the owner's shard."""
+
+    session_id: str = Field(..., json_schema_extra={"primary_key": True})
+    user_id: str = Field(..., json_schema_extra={"index": True})
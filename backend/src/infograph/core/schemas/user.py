@@ -15,6 +15,17 @@ class User(BaseModel):
     user_id: str = Field(..., json_schema_extra={"primary_key": True})
     email: str = Field(..., json_schema_extra={"index": True})
     name: str
-    google_id: str
+    google_id: str = Field(..., json_schema_extra={"unique": True})
     created_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
     updated_at: int = Field(..., json_schema_extra={"db_type": "UINT64"})
+    # Bumped by every update; tokens embedding an older snapshot are not trusted.
+    profile_version: int | None = None
+
+
+class UserProfile(BaseModel):
+    """The identity fields of a user, as carried by a token's user snapshot."""
+
+    user_id: str
+    email: str
+    name: str
+    profile_version: int | None = None
@@ -0,0 +1,69 @@
+"""Hot/cold tiering of old sessions into Parquet."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Sequence
+
+from leettools.common.utils import time_utils
+
+from infograph.services.purge_service import DAY_MS
+from infograph.stores.duckdb.maintenance_store_duckdb import MaintenanceStoreDuckDB
+
+
+@dataclass
+class ArchivePolicy:
+    """Which sessions are archived and how many go into one Parquet batch.
+
+    ``archive_after_days=None`` disables archiving.
+    """
+
+    archive_after_days: int | None = None
+    batch_size: int = 5000
+
+    @classmethod
+    def from_env(cls) -> ArchivePolicy:
+        days = os.environ.get("INFOGRAPH_ARCHIVE_AFTER_DAYS")
+        return cls(
+            archive_after_days=int(days) if days else None,
+            batch_size=int(os.environ.get("INFOGRAPH_ARCHIVE_BATCH_SIZE", 5000)),
+        )
+
+
+@dataclass
+class ArchiveReport:
+    sessions_archived: int = 0
+    rows_archived: int = 0
+    batches_written: int = 0
+
+
+class ArchiveService:
+    """Move sessions older than the policy allows out of the hot tables."""
+
+    def __init__(
+        self,
+        maintenance: MaintenanceStoreDuckDB | Sequence[MaintenanceStoreDuckDB],
+        policy: ArchivePolicy | None = None,
+    ) -> None:
+        self.maintenance_stores = (
+            [maintenance] if isinstance(maintenance, MaintenanceStoreDuckDB) else list(maintenance)
+        )
+        self.policy = policy or ArchivePolicy.from_env()
+
+    async def run(self, now_ms: int | None = None) -> ArchiveReport:
+        report = ArchiveReport()
+        if self.policy.archive_after_days is None:
+            return report
+        now_ms = now_ms if now_ms is not None else time_utils.cur_timestamp_in_ms()
+        cutoff = now_ms - self.policy.archive_after_days * DAY_MS
+
+        for maintenance in self.maintenance_stores:
+            archived_before = report.batches_written
+            while ids := await maintenance.expired_session_ids(cutoff, self.policy.batch_size):
+                report.rows_archived += await maintenance.archive_sessions(ids)
+                report.sessions_archived += len(ids)
+                report.batches_written += 1
+            if report.batches_written > archived_before:
+                await maintenance.checkpoint()
+        return report
@@ -2,21 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import os
 from typing import Any, Callable
 
-import jwt
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
+from pydantic import ValidationError
 
-from infograph.core.schemas import User, UserCreate
+from infograph.core.schemas import User, UserCreate, UserProfile
+from infograph.services.google_key_store import GoogleKeyStore
+from infograph.services.token_cache import VerifiedTokenCache
 from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.notifying_user_store import NotifyingUserStore
+from infograph.stores.ttl_cache import TTLCache
 
 
 TokenVerifier = Callable[[str, str], dict[str, Any]]
 
+# Claim holding the user snapshot, and the snapshot format it is written in.
+USER_SNAPSHOT_CLAIM = "usr"
+USER_SNAPSHOT_FORMAT = 2
+DEFAULT_PROFILE_VERSION_CACHE_SIZE = 10_000
+
 
 @dataclass
 class AuthSettings:
@@ -24,6 +32,11 @@ class AuthSettings:
     google_client_id: str
     jwt_algorithm: str = "HS256"
     token_expiration_seconds: int = 86400
+    # Embed the user in issued tokens so requests can skip the user store.
+    user_snapshot_claims: bool = False
+    # How long a user's stored profile_version is trusted to judge snapshots;
+    # bounds how long other workers accept a snapshot of a changed user.
+    profile_version_ttl_seconds: float = 30.0
 
 
 class AuthService:
@@ -34,10 +47,23 @@ class AuthService:
         user_store: AbstractUserStore,
         token_verifier: TokenVerifier | None = None,
         settings: AuthSettings | None = None,
+        token_cache: VerifiedTokenCache | None = None,
+        key_store: GoogleKeyStore | None = None,
     ) -> None:
-        self.user_store = user_store
+        # Users updated or deleted through this store are invalidated at once.
+        self.user_store = NotifyingUserStore(user_store, self.invalidate_user)
         self.settings = settings or self._load_settings()
-        self._token_verifier = token_verifier or self._default_token_verifier
+        self._token_verifier = token_verifier
+        # Google credentials are checked locally against cached signing keys.
+        if key_store is None and token_verifier is None:
+            key_store = GoogleKeyStore()
+        self.key_store = key_store
+        self.token_cache = token_cache if token_cache is not None else VerifiedTokenCache.from_env()
+        self._sign_ins: dict[str, asyncio.Future[User]] = {}
+        # Stored profile_version per user; a snapshot is trusted only if it is this new.
+        self._profile_versions: TTLCache[str, int] = TTLCache(
+            DEFAULT_PROFILE_VERSION_CACHE_SIZE, self.settings.profile_version_ttl_seconds
+        )
 
     def _load_settings(self) -> AuthSettings:
         google_client_id = os.environ.get("GOOGLE_CLIENT_ID")
@@ -48,18 +74,24 @@ class AuthService:
         if not jwt_secret:
             raise RuntimeError("JWT_SECRET environment variable is not configured")
 
-        return AuthSettings(jwt_secret=jwt_secret, google_client_id=google_client_id)
-
-    def _default_token_verifier(self, credential: str, audience: str) -> dict[str, Any]:
-        request = google_requests.Request()
-        return id_token.verify_oauth2_token(
-            credential,
-            request,
-            audience=audience,
+        return AuthSettings(
+            jwt_secret=jwt_secret,
+            google_client_id=google_client_id,
+            user_snapshot_claims=os.environ.get("INFOGRAPH_TOKEN_USER_SNAPSHOT", "").lower()
+            in ("1", "true", "yes"),
+            profile_version_ttl_seconds=float(
+                os.environ.get("INFOGRAPH_PROFILE_VERSION_TTL_SECONDS", 30.0)
+            ),
         )
 
+    async def _verify_credential(self, credential: str) -> dict[str, Any]:
+        audience = self.settings.google_client_id
+        if self._token_verifier is not None:
+            return self._token_verifier(credential, audience)
+        return await self.key_store.verify(credential, audience)
+
     async def authenticate(self, credential: str) -> tuple[User, str]:
-        payload = self._token_verifier(credential, self.settings.google_client_id)
+        payload = await self._verify_credential(credential)
         email = payload.get("email")
         name = payload.get("name") or email
         google_id = payload.get("sub")
@@ -67,11 +99,13 @@ class AuthService:
         if not email or not name or not google_id:
             raise ValueError("Google token payload missing required fields")
 
-        user = await self.user_store.get_by_google_id(google_id)
-        if user is None:
-            user = await self.user_store.create(
-                UserCreate(email=email, name=name, google_id=google_id)
-            )
+        user = await self._user_for_sign_in(
+            UserCreate(email=email, name=name, google_id=google_id)
+        )
+        # The user was just read from the store, so its snapshot starts out current.
+        self._profile_versions.set(user.user_id, user.profile_version or 0)
+
+        import jwt
 
         token = jwt.encode(
             self._build_token_payload(user),
@@ -80,14 +114,78 @@ class AuthService:
         )
         return user, token
 
+    async def _user_for_sign_in(self, create: UserCreate) -> User:
+        """Look up or create the user of a sign-in, once for concurrent sign-ins.
+
+        Sign-ins of the same Google account that arrive while a lookup is in
+        flight wait for it instead of querying the store themselves.
+        """
+        in_flight = self._sign_ins.get(create.google_id)
+        if in_flight is None:
+            in_flight = asyncio.ensure_future(self._load_or_create_user(create))
+            self._sign_ins[create.google_id] = in_flight
+            in_flight.add_done_callback(lambda _: self._sign_ins.pop(create.google_id, None))
+        # Shielded so one caller going away does not cancel the others' lookup.
+        return await asyncio.shield(in_flight)
+
+    async def _load_or_create_user(self, create: UserCreate) -> User:
+        user = await self.user_store.get_by_google_id(create.google_id)
+        if user is None:
+            user = await self.user_store.upsert_by_google_id(create)
+        return user
+
     def _build_token_payload(self, user: User) -> dict[str, Any]:
         expiration = datetime.utcnow() + timedelta(seconds=self.settings.token_expiration_seconds)
-        return {
+        payload: dict[str, Any] = {
             "user_id": user.user_id,
             "exp": int(expiration.timestamp()),
         }
+        if self.settings.user_snapshot_claims:
+            # The token is signed, not encrypted: only the profile fields go in.
+            payload[USER_SNAPSHOT_CLAIM] = {
+                "v": USER_SNAPSHOT_FORMAT,
+                "email": user.email,
+                "name": user.name,
+                "profile_version": user.profile_version or 0,
+            }
+        return payload
+
+    def _user_from_snapshot(self, user_id: str, payload: dict[str, Any]) -> User | None:
+        """The user embedded in ``payload``, unless it is missing or may be stale.
+
+        A snapshot is current when its profile_version is at least the one
+        last read from the store, which is kept for
+        ``profile_version_ttl_seconds``; without a known version it is not
+        trusted. The user has only the ``UserProfile`` fields set.
+        """
+        snapshot = payload.get(USER_SNAPSHOT_CLAIM)
+        if not isinstance(snapshot, dict) or snapshot.get("v") != USER_SNAPSHOT_FORMAT:
+            return None
+        current = self._profile_versions.get(user_id)
+        if current is None or snapshot.get("profile_version", 0) < current:
+            return None
+        fields = {name: value for name, value in snapshot.items() if name != "v"}
+        try:
+            profile = UserProfile.model_validate({**fields, "user_id": user_id})
+        except ValidationError:
+            return None
+        return User.model_construct(**profile.model_dump())
 
     async def get_user_from_token(self, token: str) -> User:
+        """Resolve a bearer token to its user.
+
+        Tokens seen before are answered from ``token_cache`` without
+        decoding the JWT or reading the user store. Tokens that embed a
+        current user snapshot skip the user store too; see
+        ``_user_from_snapshot``.
+        """
+        if self.token_cache is not None:
+            cached = self.token_cache.get(token)
+            if cached is not None:
+                return cached.user
+
+        import jwt
+
         try:
             payload = jwt.decode(
                 token,
@@ -101,11 +199,35 @@ class AuthService:
         if not user_id:
             raise ValueError("Token payload missing user_id")
 
-        user = await self.user_store.get(user_id)
+        generation = self.token_cache.generation(user_id) if self.token_cache else 0
+        user = self._user_from_snapshot(user_id, payload)
         if user is None:
-            raise ValueError("User not found for token")
+            version_generation = self._profile_versions.generation(user_id)
+            user = await self.user_store.get(user_id)
+            if user is None:
+                raise ValueError("User not found for token")
+            # Skipped if the user was invalidated while it was being read.
+            self._profile_versions.set(
+                user_id, user.profile_version or 0, generation=version_generation
+            )
 
+        if self.token_cache is not None:
+            self.token_cache.put(token, payload, user, generation)
         return user
 
+    def invalidate_user(self, user_id: str, profile_version: int | None = None) -> None:
+        """Make the next request of ``user_id`` re-verify its token and reload the user.
+
+        Pass the ``profile_version`` of the updated user to keep trusting
+        snapshots that are at least that new; without it, snapshots of the
+        user are not trusted until the user is next read from the store.
+        Other processes notice the change once their stored version expires.
+        """
+        if self.token_cache is not None:
+            self.token_cache.invalidate_user(user_id)
+        self._profile_versions.invalidate(user_id)
+        if profile_version is not None:
+            self._profile_versions.set(user_id, profile_version)
+
     async def refresh_user(self, google_id: str) -> User | None:
         return await self.user_store.get_by_google_id(google_id)
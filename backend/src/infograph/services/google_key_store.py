@@ -0,0 +1,238 @@
+"""Cached Google signing keys for verifying sign-in ID tokens locally."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Protocol
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+DEFAULT_MAX_AGE_SECONDS = 300.0
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class SigningKeys:
+    """Certificates by key id and how long they may be cached."""
+
+    certs: dict[str, str]
+    max_age_seconds: float
+
+
+@dataclass
+class KeyStoreStats:
+    """Point-in-time state of a GoogleKeyStore."""
+
+    key_count: int
+    fetches: int
+    failures: int
+    expires_in_seconds: float
+
+
+class KeySource(Protocol):
+    """Where a GoogleKeyStore loads keys from; a blocking call run off the event loop."""
+
+    def fetch(self) -> SigningKeys: ...
+
+
+def cache_max_age(cache_control: str | None, age: str | None = None) -> float:
+    """Seconds a response may still be cached, from its ``Cache-Control`` and ``Age``."""
+    if cache_control is None:
+        return DEFAULT_MAX_AGE_SECONDS
+    if re.search(r"no-cache|no-store", cache_control, re.IGNORECASE):
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match is None:
+        return DEFAULT_MAX_AGE_SECONDS
+    already = int(age) if age and age.isdigit() else 0
+    return float(max(int(match.group(1)) - already, 0))
+
+
+class GoogleCertsSource:
+    """Google's OAuth2 certificates endpoint, fetched with the standard library."""
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL, timeout_seconds: float = 5.0) -> None:
+        self.url = url
+        self.timeout_seconds = timeout_seconds
+
+    def fetch(self) -> SigningKeys:
+        import urllib.request
+
+        with urllib.request.urlopen(self.url, timeout=self.timeout_seconds) as response:
+            certs = json.loads(response.read())
+            max_age = cache_max_age(
+                response.headers.get("Cache-Control"), response.headers.get("Age")
+            )
+        return SigningKeys(certs=certs, max_age_seconds=max_age)
+
+
+class GoogleKeyStore:
+    """Google's public signing keys, cached for as long as Google allows.
+
+    Keys are kept for the ``max-age`` the source reported. Once
+    ``refresh_ahead`` of that time has passed, the next sign-in starts a
+    refresh in the background and is still verified with the current keys,
+    so only the first sign-in, or one after the keys expired, waits on the
+    source. A token signed with an unknown key id forces a refresh, at most
+    once per ``min_refresh_interval_seconds``, to pick up rotated keys. When
+    a refresh fails the keys already held keep being used, and the source is
+    not asked again for ``min_refresh_interval_seconds``.
+
+    ``start`` fetches the keys and keeps refreshing them on the same
+    schedule from a background task, so with it running sign-ins do not
+    wait on the source at all; the app lifespan starts and closes it.
+    """
+
+    def __init__(
+        self,
+        source: KeySource | None = None,
+        *,
+        refresh_ahead: float = 0.8,
+        min_refresh_interval_seconds: float = 60.0,
+        clock_skew_seconds: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.source = source or GoogleCertsSource()
+        self.refresh_ahead = refresh_ahead
+        self.min_refresh_interval_seconds = min_refresh_interval_seconds
+        self.clock_skew_seconds = clock_skew_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._keys: SigningKeys | None = None
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._fetch_lock = threading.Lock()
+        self._background: asyncio.Task[None] | None = None
+        self._refresher: asyncio.Task[None] | None = None
+        self._fetches = 0
+        self._failures = 0
+
+    async def verify(self, token: str, audience: str) -> dict[str, Any]:
+        """Check the signature, audience, expiry and issuer of a Google ID token."""
+        # google-auth pulls in cryptography; only load it to verify a sign-in.
+        from google.auth import jwt as google_jwt
+
+        certs = await self.certs(google_jwt.decode_header(token).get("kid"))
+        payload = google_jwt.decode(
+            token,
+            certs=certs,
+            audience=audience,
+            clock_skew_in_seconds=self.clock_skew_seconds,
+        )
+        if payload.get("iss") not in GOOGLE_ISSUERS:
+            raise ValueError(f"Wrong issuer: {payload.get('iss')!r}")
+        return payload
+
+    async def certs(self, key_id: str | None = None) -> dict[str, str]:
+        """Current certificates, refreshing them first only when they cannot be used."""
+        keys = self._keys
+        if keys is None:
+            return await asyncio.to_thread(self._refresh, self._fetches)
+        now = self._clock()
+        if now < self._retry_at:
+            return keys.certs
+        rotated = key_id not in keys.certs
+        if now >= self._expires_at(keys) or (
+            rotated and now - self._fetched_at >= self.min_refresh_interval_seconds
+        ):
+            return await asyncio.to_thread(self._refresh, self._fetches)
+        if now >= self._fetched_at + keys.max_age_seconds * self.refresh_ahead:
+            self._refresh_in_background()
+        return keys.certs
+
+    async def start(self) -> None:
+        """Fetch the keys now and refresh them ahead of expiry from a background task."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_periodically())
+
+    async def aclose(self) -> None:
+        """Stop the background refresh started by ``start``."""
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+
+    def stats(self) -> KeyStoreStats:
+        keys = self._keys
+        return KeyStoreStats(
+            key_count=len(keys.certs) if keys else 0,
+            fetches=self._fetches,
+            failures=self._failures,
+            expires_in_seconds=max(self._expires_at(keys) - self._clock(), 0.0) if keys else 0.0,
+        )
+
+    def _expires_at(self, keys: SigningKeys) -> float:
+        return self._fetched_at + keys.max_age_seconds
+
+    def _refresh(self, seen_fetches: int) -> dict[str, str]:
+        with self._fetch_lock:
+            # Another caller refreshed while this one waited for the lock.
+            if self._fetches != seen_fetches:
+                return self._keys.certs
+            try:
+                keys = self.source.fetch()
+            except Exception:
+                self._failures += 1
+                if self._keys is None:
+                    raise
+                self._retry_at = self._clock() + self.min_refresh_interval_seconds
+                logger.warning("Refreshing Google signing keys failed", exc_info=True)
+                return self._keys.certs
+            self._keys, self._fetched_at = keys, self._clock()
+            self._fetches += 1
+            return keys.certs
+
+    def _refresh_in_background(self) -> None:
+        if self._background is not None and not self._background.done():
+            return
+        self._background = asyncio.create_task(self._refresh_later(self._fetches))
+
+    async def _refresh_later(self, seen_fetches: int) -> None:
+        await asyncio.to_thread(self._refresh, seen_fetches)
+
+    def _refresh_due_in(self) -> float:
+        """Seconds until the periodic refresh should fetch; zero or less when due."""
+        keys = self._keys
+        due = self._retry_at
+        if keys is not None:
+            fresh_for = max(
+                keys.max_age_seconds * self.refresh_ahead, self.min_refresh_interval_seconds
+            )
+            due = max(due, self._fetched_at + fresh_for)
+        return due - self._clock()
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            # Re-checked after every sleep: a sign-in may have refreshed meanwhile.
+            delay = self._refresh_due_in()
+            if delay > 0:
+                await self._sleep(delay)
+                continue
+            try:
+                await asyncio.to_thread(self._refresh, self._fetches)
+            except Exception:
+                self._retry_at = self._clock() + self.min_refresh_interval_seconds
+                logger.warning("Fetching Google signing keys failed", exc_info=True)
+
+
+__all__ = [
+    "GOOGLE_CERTS_URL",
+    "GoogleCertsSource",
+    "GoogleKeyStore",
+    "KeySource",
+    "KeyStoreStats",
+    "SigningKeys",
+    "cache_max_age",
+]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infograph.core.schemas import (
+    Message,
+    ResearchSession,
+    SearchDocument,
+    SearchHit,
+    Source,
+)
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+
+
+class HistorySearchService:
+    """Keep the full-text index in step with a user's research history."""
+
+    def __init__(self, index_store: AbstractSearchIndexStore) -> None:
+        self.index_store = index_store
+
+    async def index_session(
+        self, session: ResearchSession, sources: Sequence[Source] = ()
+    ) -> None:
+        """Index a new session's prompt together with its gathered sources."""
+        documents = [
+            SearchDocument(
+                doc_id=f"prompt:{session.session_id}",
+                user_id=session.user_id,
+                session_id=session.session_id,
+                kind="prompt",
+                text=session.prompt,
+            )
+        ]
+        documents.extend(
+            SearchDocument(
+                doc_id=f"source:{source.source_id}",
+                user_id=session.user_id,
+                session_id=session.session_id,
+                kind="source",
+                text=f"{source.title} {source.snippet}",
+            )
+            for source in sources
+        )
+        await self.index_store.index_documents(documents)
+
+    async def index_message(self, session: ResearchSession, message: Message) -> None:
+        await self.index_store.index_documents(
+            [
+                SearchDocument(
+                    doc_id=f"message:{message.message_id}",
+                    user_id=session.user_id,
+                    session_id=session.session_id,
+                    kind="message",
+                    text=message.content,
+                )
+            ]
+        )
+
+    async def remove_session(self, session_id: str) -> None:
+        await self.index_store.delete_for_session(session_id)
+
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        return await self.index_store.search(user_id, query, limit=limit)
@@ -6,8 +6,6 @@ import time
 from pathlib import Path
 from typing import Sequence
 
-from PIL import Image, ImageDraw, ImageFont
-
 from infograph.core.schemas import InfographicCreate, ResearchSession, Source
 from infograph.stores.abstract_infographic_store import AbstractInfographicStore
 from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
@@ -15,6 +13,12 @@ from infograph.stores.duckdb.utils import ensure_duckdb_settings
 from leettools.settings import SystemSettings
 
 
+def infographic_output_dir(settings: SystemSettings) -> Path:
+    """Directory where rendered infographic images are written."""
+    default_output = Path(settings.DATA_ROOT) / "infographics"
+    return Path(os.environ.get("INFOGRAPHIC_PATH", default_output))
+
+
 class InfographicService:
     """Generate infographic artwork from a research session."""
 
@@ -26,8 +30,7 @@ class InfographicService:
         self.settings = ensure_duckdb_settings(settings)
         self.store = store or InfographicStoreDuckDB(self.settings)
 
-        default_output = Path(self.settings.DATA_ROOT) / "infographics"
-        self.output_dir = Path(os.environ.get("INFOGRAPHIC_PATH", default_output))
+        self.output_dir = infographic_output_dir(self.settings)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     async def generate_for_session(
@@ -68,6 +71,8 @@ class InfographicService:
         return points
 
     def _render_image(self, title: str, key_points: list[str], source_count: int) -> Path:
+        from PIL import Image, ImageDraw, ImageFont
+
         width = 1000
         height = 700
         background = (14, 23, 42)
@@ -0,0 +1,143 @@
+"""Retention enforcement and storage compaction."""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from leettools.common.utils import time_utils
+
+from infograph.stores.duckdb.maintenance_store_duckdb import MaintenanceStoreDuckDB
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
+from infograph.stores.duckdb.shard_directory_duckdb import ShardDirectoryDuckDB
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+@dataclass
+class RetentionPolicy:
+    """How long sessions live and how the purge is batched.
+
+    ``retention_days=None`` keeps sessions forever; only rows left behind by
+    deleted sessions and unreferenced images are removed.
+    """
+
+    retention_days: int | None = None
+    batch_size: int = 500
+    # Images younger than this are kept even if unreferenced, so a file that
+    # is rendered but not yet recorded in the database is never removed.
+    file_grace_seconds: int = 3600
+
+    @classmethod
+    def from_env(cls) -> RetentionPolicy:
+        retention = os.environ.get("INFOGRAPH_RETENTION_DAYS")
+        return cls(
+            retention_days=int(retention) if retention else None,
+            batch_size=int(os.environ.get("INFOGRAPH_PURGE_BATCH_SIZE", 500)),
+        )
+
+
+@dataclass
+class PurgeReport:
+    expired_sessions: int = 0
+    orphaned_sessions: int = 0
+    rows_deleted: int = 0
+    files_deleted: int = 0
+    bytes_freed: int = 0
+    batches_deleted: int = 0
+
+
+class PurgeService:
+    """Remove everything that belongs to deleted or expired sessions.
+
+    ``maintenance`` may be a list with one store per shard; images are only
+    removed when no shard references them, and the same goes for archive
+    batches. With sharding, pass the shard ``directory`` too so purged
+    sessions are also dropped from it, and the core database's maintenance
+    store so batches it still indexes are kept.
+    """
+
+    def __init__(
+        self,
+        maintenance: MaintenanceStoreDuckDB | Sequence[MaintenanceStoreDuckDB],
+        output_dir: Path,
+        policy: RetentionPolicy | None = None,
+        directory: ShardDirectoryDuckDB | None = None,
+    ) -> None:
+        self.maintenance_stores = (
+            [maintenance] if isinstance(maintenance, MaintenanceStoreDuckDB) else list(maintenance)
+        )
+        self.output_dir = output_dir
+        self.policy = policy or RetentionPolicy.from_env()
+        self.directory = directory
+
+    async def run(self, now_ms: int | None = None) -> PurgeReport:
+        report = PurgeReport()
+        now_ms = now_ms if now_ms is not None else time_utils.cur_timestamp_in_ms()
+
+        for maintenance in self.maintenance_stores:
+            await self._purge_sessions(maintenance, report, now_ms)
+
+        await self._remove_unreferenced_batches(report)
+        await self._remove_orphaned_files(report)
+        for maintenance in self.maintenance_stores:
+            await maintenance.checkpoint()
+        return report
+
+    async def _purge_sessions(
+        self, maintenance: MaintenanceStoreDuckDB, report: PurgeReport, now_ms: int
+    ) -> None:
+        if self.policy.retention_days is not None:
+            cutoff = now_ms - self.policy.retention_days * DAY_MS
+            while ids := await maintenance.expired_session_ids(cutoff, self.policy.batch_size):
+                report.expired_sessions += len(ids)
+                report.rows_deleted += await self._purge(maintenance, ids)
+            while ids := await maintenance.expired_archived_session_ids(
+                cutoff, self.policy.batch_size
+            ):
+                report.expired_sessions += len(ids)
+                report.rows_deleted += await self._purge(maintenance, ids)
+
+        while ids := await maintenance.orphaned_session_ids(self.policy.batch_size):
+            report.orphaned_sessions += len(ids)
+            report.rows_deleted += await self._purge(maintenance, ids)
+
+    async def _purge(self, maintenance: MaintenanceStoreDuckDB, session_ids: list[str]) -> int:
+        removed = await maintenance.purge_sessions(session_ids)
+        if self.directory is not None:
+            await self.directory.remove_sessions(session_ids)
+        return removed
+
+    async def _remove_unreferenced_batches(self, report: PurgeReport) -> None:
+        # Shards share the archive directory, and a shard move copies index
+        # entries, so a batch is only removed when no shard's index uses it.
+        by_dir: dict[Path, list[SessionArchiveDuckDB]] = {}
+        for maintenance in self.maintenance_stores:
+            if maintenance.archive is not None:
+                by_dir.setdefault(maintenance.archive.archive_dir, []).append(maintenance.archive)
+        cutoff = time.time() - self.policy.file_grace_seconds
+        for archives in by_dir.values():
+            referenced: set[str] = set()
+            for archive in archives:
+                referenced |= await archive.batch_ids()
+            report.batches_deleted += archives[0].remove_batches(referenced, cutoff)
+
+    async def _remove_orphaned_files(self, report: PurgeReport) -> None:
+        if not self.output_dir.is_dir():
+            return
+        referenced = {
+            str(Path(path).resolve())
+            for maintenance in self.maintenance_stores
+            for path in await maintenance.referenced_image_paths()
+        }
+        cutoff = time.time() - self.policy.file_grace_seconds
+        for path in self.output_dir.glob("infographic-*.png"):
+            stat = path.stat()
+            if stat.st_mtime > cutoff or str(path.resolve()) in referenced:
+                continue
+            path.unlink(missing_ok=True)
+            report.files_deleted += 1
+            report.bytes_freed += stat.st_size
@@ -5,14 +5,17 @@ from typing import Iterable, Sequence
 
 from infograph.core.schemas import Source, SourceCreate
 from infograph.stores.abstract_source_store import AbstractSourceStore
-from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
 
 
 class SearchService:
     """Simple web search simulator that persists sources for a session."""
 
     def __init__(self, source_store: AbstractSourceStore | None = None) -> None:
-        self.source_store = source_store or SourceStoreDuckDB()
+        if source_store is None:
+            from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+            source_store = SourceStoreDuckDB()
+        self.source_store = source_store
 
     async def gather_sources(self, session_id: str, prompt: str) -> list[Source]:
         """Generate candidate sources related to the prompt and store them."""
@@ -39,18 +42,18 @@ class SearchService:
             },
         ]
 
-        created_sources: list[Source] = []
-        for data in template_data:
-            payload = SourceCreate(
+        payloads = [
+            SourceCreate(
                 session_id=session_id,
                 title=data["title"],
                 url=data["url"],
                 snippet=data["snippet"],
                 confidence=float(data["confidence"]),
             )
-            created_sources.append(await self.source_store.create(payload))
+            for data in template_data
+        ]
 
-        return created_sources
+        return await self.source_store.create_many(payloads)
 
     def _slugify(self, prompt: str) -> str:
         normalized = prompt.strip().lower()
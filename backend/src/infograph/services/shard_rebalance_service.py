@@ -0,0 +1,95 @@
+"""Move users between DuckDB shards."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from infograph.stores.duckdb.store_registry_sharded_duckdb import StoreRegistryShardedDuckDB
+
+
+@dataclass
+class RebalanceReport:
+    users_moved: int = 0
+    rows_moved: int = 0
+    stray_rows_deleted: int = 0
+    users_imported: int = 0
+
+
+class ShardRebalanceService:
+    """Relocate users so each one lives on the shard the directory expects.
+
+    A move copies the user's rows to the target shard, repoints the
+    directory and then deletes the source copy; each step is one
+    transaction and the sequence can be re-run after an interruption. Run
+    it while the API is stopped: live processes cache user placements.
+    """
+
+    def __init__(self, stores: StoreRegistryShardedDuckDB) -> None:
+        self.stores = stores
+        self.directory = stores.directory
+
+    async def move_user(self, user_id: str, target: int) -> int:
+        """Move ``user_id`` to shard ``target`` and return the number of rows copied."""
+        if not 0 <= target < len(self.stores.shards):
+            raise ValueError(f"Shard {target} does not exist")
+        source = await self.directory.placed_shard(user_id)
+        if source == target:
+            return 0
+        await self.stores.flush()
+        copied = 0
+        if source is not None:
+            rows = await self.stores.shards[source].maintenance_store.fetch_user_rows(user_id)
+            copied = await self.stores.shards[target].maintenance_store.replace_user_rows(
+                user_id, rows
+            )
+        await self.directory.move_user(user_id, target)
+        if source is not None:
+            await self.stores.shards[source].maintenance_store.delete_user_rows(user_id)
+        return copied
+
+    async def run(self) -> RebalanceReport:
+        """Move every user to their hash shard for the current shard count.
+
+        Afterwards, rows left on a shard by an interrupted move are deleted.
+        """
+        report = RebalanceReport()
+        for placement in await self.directory.placements():
+            target = self.directory.default_shard(placement.user_id)
+            if placement.shard == target:
+                continue
+            if placement.shard >= len(self.stores.shards):
+                # The shard was removed; its file must be re-attached to move this user.
+                raise ValueError(
+                    f"User {placement.user_id} is placed on missing shard {placement.shard}"
+                )
+            report.rows_moved += await self.move_user(placement.user_id, target)
+            report.users_moved += 1
+
+        for index, shard in enumerate(self.stores.shards):
+            for user_id in await shard.maintenance_store.user_ids():
+                placed = await self.directory.placed_shard(user_id)
+                if placed is not None and placed != index:
+                    report.stray_rows_deleted += await shard.maintenance_store.delete_user_rows(
+                        user_id
+                    )
+        return report
+
+    async def import_unsharded(self) -> RebalanceReport:
+        """Move session data from the unsharded ``DB_CORE`` tables into the shards.
+
+        Users whose sessions are all archived are moved too; their archive
+        index entries go to the shard and the batches stay where they are.
+        """
+        report = RebalanceReport()
+        home = self.stores.home.maintenance_store
+        for user_id in await home.user_ids():
+            target = await self.directory.place_user(user_id)
+            rows = await home.fetch_user_rows(user_id)
+            report.rows_moved += await self.stores.shards[
+                target
+            ].maintenance_store.replace_user_rows(user_id, rows)
+            # Archived sessions are routed through the directory like hot ones.
+            await self.directory.add_sessions(home.session_ids_in(rows), user_id)
+            await home.delete_user_rows(user_id)
+            report.users_imported += 1
+        return report
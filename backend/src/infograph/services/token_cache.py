@@ -0,0 +1,121 @@
+"""Cache of verified bearer tokens for AuthService."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from infograph.core.schemas import User
+from infograph.stores.ttl_cache import CacheStats, TTLCache
+
+DEFAULT_TOKEN_CACHE_SIZE = 10_000
+DEFAULT_TOKEN_CACHE_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """Decoded claims of a bearer token and the user they resolved to."""
+
+    claims: dict[str, Any]
+    user: User
+    generation: int
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of verified tokens, keyed by a digest of the token.
+
+    An entry lives for ``ttl_seconds`` or until the token's ``exp`` claim,
+    whichever comes first, so a cached token is never accepted after it
+    would fail verification. ``invalidate_user`` drops every cached token of
+    a user in O(1) by bumping that user's generation; older entries are
+    dropped as misses when next looked up. It only reaches this process, so
+    the TTL bounds how long other workers serve a changed or deleted user.
+    Raw tokens are never stored.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        ttl_seconds: float = DEFAULT_TOKEN_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLCache[str, VerifiedToken] = TTLCache(max_size, 0.0, clock=clock)
+        self._wall_clock = wall_clock
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stale = 0
+
+    @classmethod
+    def from_env(cls) -> VerifiedTokenCache | None:
+        """Cache sized by ``INFOGRAPH_TOKEN_CACHE_SIZE``; ``None`` when it is 0.
+
+        ``INFOGRAPH_TOKEN_CACHE_TTL_SECONDS`` caps how long an entry is kept.
+        """
+        size = int(os.environ.get("INFOGRAPH_TOKEN_CACHE_SIZE", DEFAULT_TOKEN_CACHE_SIZE))
+        ttl = float(
+            os.environ.get("INFOGRAPH_TOKEN_CACHE_TTL_SECONDS", DEFAULT_TOKEN_CACHE_TTL_SECONDS)
+        )
+        return cls(size, ttl_seconds=ttl) if size > 0 and ttl > 0 else None
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+
+    def generation(self, user_id: str) -> int:
+        """Current generation of ``user_id``; pass it to ``put`` for a lookup started now."""
+        with self._lock:
+            return self._generations.get(user_id, 0)
+
+    def get(self, token: str) -> VerifiedToken | None:
+        key = self.digest(token)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry.generation != self.generation(entry.user.user_id):
+            self._cache.invalidate(key)
+            with self._lock:
+                self._stale += 1
+            return None
+        return entry
+
+    def put(self, token: str, claims: dict[str, Any], user: User, generation: int) -> None:
+        """Cache ``user`` for ``token`` for ``ttl_seconds``, or until the token expires.
+
+        ``generation`` is read before the user was loaded, so a user
+        invalidated during the lookup is not cached with stale data.
+        """
+        exp = claims.get("exp")
+        if exp is None:
+            return
+        ttl = min(float(exp) - self._wall_clock(), self.ttl_seconds)
+        if ttl <= 0:
+            return
+        self._cache.set(self.digest(token), VerifiedToken(claims, user, generation), ttl)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Stop serving cached tokens of ``user_id``, e.g. after the user changed."""
+        with self._lock:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def invalidate_token(self, token: str) -> None:
+        self._cache.invalidate(self.digest(token))
+
+    def stats(self) -> CacheStats:
+        """Hit/miss counters; lookups that found an invalidated entry count as misses."""
+        stats = self._cache.stats()
+        with self._lock:
+            stale = self._stale
+        return CacheStats(
+            size=stats.size,
+            max_size=stats.max_size,
+            hits=stats.hits - stale,
+            misses=stats.misses + stale,
+            evictions=stats.evictions,
+        )
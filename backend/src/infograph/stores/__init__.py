@@ -3,3 +3,6 @@ from .abstract_session_store import AbstractSessionStore
 from .abstract_source_store import AbstractSourceStore
 from .abstract_infographic_store import AbstractInfographicStore
 from .abstract_message_store import AbstractMessageStore
+from .abstract_search_index_store import AbstractSearchIndexStore
+from .abstract_session_detail_store import AbstractSessionDetailStore
+from .abstract_store_registry import AbstractStoreRegistry
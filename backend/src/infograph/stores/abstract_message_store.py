@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable, Sequence
 
 from infograph.core.schemas import Message, MessageCreate
 
@@ -11,10 +11,25 @@ class AbstractMessageStore(ABC):
     async def create(self, create: MessageCreate) -> Message:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        raise NotImplementedError
+
     @abstractmethod
     async def list_for_session(self, session_id: str) -> Iterable[Message]:
         raise NotImplementedError
 
+    def pending_for_session(self, session_id: str) -> list[Message]:
+        """Messages accepted by ``create`` but not yet persisted."""
+        return []
+
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Message]]:
+        """Yield a session's messages in chunks, in ``list_for_session`` order.
+
+        The default yields a single chunk; stores that can stream override it.
+        """
+        yield list(await self.list_for_session(session_id))
+
     @abstractmethod
     async def delete_for_session(self, session_id: str) -> None:
         raise NotImplementedError
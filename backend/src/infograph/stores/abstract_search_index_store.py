@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from infograph.core.schemas import SearchDocument, SearchHit
+
+
+class AbstractSearchIndexStore(ABC):
+    @abstractmethod
+    async def index_documents(self, documents: Sequence[SearchDocument]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_for_session(self, session_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        """Return the user's sessions ranked by BM25 relevance to ``query``."""
+        raise NotImplementedError
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+from infograph.core.schemas import SessionDetail
+
+
+class AbstractSessionDetailStore(ABC):
+    @abstractmethod
+    async def get_for_user(self, session_id: str, user_id: str) -> SessionDetail | None:
+        """Load a session with its sources, messages and infographic.
+
+        Returns ``None`` when the session does not exist or belongs to
+        another user, so callers need no separate ownership check.
+        """
+        raise NotImplementedError
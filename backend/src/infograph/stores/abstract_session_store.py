@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, Sequence
 
-from infograph.core.schemas import ResearchSession, ResearchSessionCreate, ResearchSessionUpdate
+from infograph.core.schemas import (
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SessionStatus,
+)
 
 
 class AbstractSessionStore(ABC):
@@ -15,6 +20,14 @@ class AbstractSessionStore(ABC):
     async def get(self, session_id: str) -> ResearchSession | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        """The sessions among ``session_ids`` that belong to ``user_id``, in one read.
+
+        Unknown ids and sessions of other users are left out; order is not kept.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def list_for_user(
         self,
@@ -25,13 +38,34 @@ class AbstractSessionStore(ABC):
         search: str | None = None,
         start_timestamp: int | None = None,
         end_timestamp: int | None = None,
+        cursor: str | None = None,
     ) -> Iterable[ResearchSession]:
+        """List a user's sessions newest first.
+
+        ``cursor`` is an opaque token from ``SessionCursor.encode``; when given,
+        the page starts right after that position and ``offset`` is ignored.
+        ``offset`` is kept only for backward compatibility.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
         raise NotImplementedError
 
+    @abstractmethod
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        """Atomically move a session to ``to_status`` if its status is in ``from_statuses``.
+
+        Returns the updated session, or ``None`` when the session does not exist
+        or another writer already moved it out of ``from_statuses``.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete(self, session_id: str) -> None:
         raise NotImplementedError
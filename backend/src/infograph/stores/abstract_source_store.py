@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable, Sequence
 
 from infograph.core.schemas import Source, SourceCreate
 
@@ -11,10 +11,21 @@ class AbstractSourceStore(ABC):
     async def create(self, create: SourceCreate) -> Source:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_many(self, creates: Sequence[SourceCreate]) -> list[Source]:
+        raise NotImplementedError
+
     @abstractmethod
     async def list_for_session(self, session_id: str) -> Iterable[Source]:
         raise NotImplementedError
 
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Source]]:
+        """Yield a session's sources in chunks, in ``list_for_session`` order.
+
+        The default yields a single chunk; stores that can stream override it.
+        """
+        yield list(await self.list_for_session(session_id))
+
     @abstractmethod
     async def delete_for_session(self, session_id: str) -> None:
         raise NotImplementedError
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any
+
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_source_store import AbstractSourceStore
+from infograph.stores.abstract_user_store import AbstractUserStore
+
+if TYPE_CHECKING:
+    from infograph.stores.duckdb.export_store_duckdb import ExportStoreDuckDB
+
+
+class AbstractStoreRegistry(ABC):
+    """One instance of every store, shared by all routers of an app."""
+
+    # Whether ``export_store`` returns a store; checked without building one.
+    supports_export: bool = False
+
+    @property
+    @abstractmethod
+    def user_store(self) -> AbstractUserStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def session_store(self) -> AbstractSessionStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def source_store(self) -> AbstractSourceStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def message_store(self) -> AbstractMessageStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def infographic_store(self) -> AbstractInfographicStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def search_index_store(self) -> AbstractSearchIndexStore:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def session_detail_store(self) -> AbstractSessionDetailStore:
+        raise NotImplementedError
+
+    @property
+    def export_store(self) -> ExportStoreDuckDB | None:
+        """File export support; ``None`` when the backend cannot export."""
+        return None
+
+    def executor_stats(self) -> dict[str, Any]:
+        return {}
+
+    def cache_stats(self) -> dict[str, Any]:
+        return {}
+
+    async def flush(self) -> None:
+        """Write out any buffered writes."""
+
+    async def aclose(self) -> None:
+        await self.flush()
+        self.close()
+
+    def close(self) -> None:
+        """Release connections and threads."""
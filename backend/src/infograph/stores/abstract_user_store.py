@@ -15,6 +15,15 @@ class AbstractUserStore(ABC):
     async def get_by_google_id(self, google_id: str) -> User | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        """The user with ``create.google_id``, created atomically if there is none.
+
+        An existing user is returned unchanged, so concurrent sign-ins of a
+        new Google account all get the same single user.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get(self, user_id: str) -> User | None:
         raise NotImplementedError
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+from infograph.core.schemas import (
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SessionStatus,
+    User,
+    UserCreate,
+)
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.ttl_cache import TTLCache
+
+DEFAULT_CACHE_SIZE = 10_000
+DEFAULT_CACHE_TTL_SECONDS = 30.0
+
+
+class CachedUserStore(AbstractUserStore):
+    """Read-through cache in front of a user store for lookups by ``user_id``.
+
+    Writes made through this wrapper invalidate the cached entry, and a
+    lookup that raced one of them is not cached; writes that bypass it are
+    visible once the entry's TTL expires. Attributes that are
+    not part of the store interface fall through to the wrapped store.
+    """
+
+    def __init__(self, inner: AbstractUserStore, cache: TTLCache[str, User]) -> None:
+        self.inner = inner
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    async def create(self, create: UserCreate) -> User:
+        return await self.inner.create(create)
+
+    async def get_by_google_id(self, google_id: str) -> User | None:
+        return await self.inner.get_by_google_id(google_id)
+
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        return await self.inner.upsert_by_google_id(create)
+
+    async def get(self, user_id: str) -> User | None:
+        user = self.cache.get(user_id)
+        if user is None:
+            generation = self.cache.generation(user_id)
+            user = await self.inner.get(user_id)
+            if user is not None:
+                self.cache.set(user_id, user, generation=generation)
+        return user
+
+    async def list(self) -> Iterable[User]:
+        return await self.inner.list()
+
+    async def update(self, user: User) -> User:
+        try:
+            return await self.inner.update(user)
+        finally:
+            self.cache.invalidate(user.user_id)
+
+    async def delete(self, user_id: str) -> None:
+        try:
+            await self.inner.delete(user_id)
+        finally:
+            self.cache.invalidate(user_id)
+
+
+class CachedSessionStore(AbstractSessionStore):
+    """Read-through cache for ``get`` so ownership checks skip the database.
+
+    ``update``, ``transition`` and ``delete`` invalidate the entry once the
+    write finishes, so the next ``get`` reloads the row that was written. A
+    ``get`` whose read overlapped such a write returns what it read but does
+    not cache it.
+    """
+
+    def __init__(
+        self, inner: AbstractSessionStore, cache: TTLCache[str, ResearchSession]
+    ) -> None:
+        self.inner = inner
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    async def create(self, create: ResearchSessionCreate, user_id: str) -> ResearchSession:
+        return await self.inner.create(create, user_id)
+
+    async def get(self, session_id: str) -> ResearchSession | None:
+        session = self.cache.get(session_id)
+        if session is None:
+            generation = self.cache.generation(session_id)
+            session = await self.inner.get(session_id)
+            if session is not None:
+                self.cache.set(session_id, session, generation=generation)
+        return session
+
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        sessions: list[ResearchSession] = []
+        missing: list[str] = []
+        for session_id in session_ids:
+            session = self.cache.get(session_id)
+            if session is None:
+                missing.append(session_id)
+            elif session.user_id == user_id:
+                sessions.append(session)
+        if missing:
+            sessions.extend(await self.inner.get_many(user_id, missing))
+        return sessions
+
+    async def list_for_user(
+        self,
+        user_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        search: str | None = None,
+        start_timestamp: int | None = None,
+        end_timestamp: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterable[ResearchSession]:
+        return await self.inner.list_for_user(
+            user_id,
+            limit=limit,
+            offset=offset,
+            search=search,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            cursor=cursor,
+        )
+
+    async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
+        try:
+            return await self.inner.update(session_id, update)
+        finally:
+            self.cache.invalidate(session_id)
+
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        try:
+            return await self.inner.transition(session_id, from_statuses, to_status)
+        finally:
+            self.cache.invalidate(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        try:
+            await self.inner.delete(session_id)
+        finally:
+            self.cache.invalidate(session_id)
+
+
+__all__ = [
+    "CachedSessionStore",
+    "CachedUserStore",
+    "DEFAULT_CACHE_SIZE",
+    "DEFAULT_CACHE_TTL_SECONDS",
+]
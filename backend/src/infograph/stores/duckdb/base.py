@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import Any, Generic
+import json
+from types import UnionType
+from typing import Any, AsyncIterator, Generic, Sequence, Union, get_args, get_origin
+
+from duckdb import DuckDBPyConnection
 
-from leettools.common.db.table_schema import pydantic_to_db_schema
 from leettools.common.duckdb.duckdb_client import DuckDBClient
 from leettools.common.duckdb.duckdb_schema_utils import (
     duckdb_data_to_pydantic_obj,
@@ -11,26 +14,253 @@ from leettools.common.duckdb.duckdb_schema_utils import (
 from leettools.common.utils.obj_utils import TypeVar_BaseModel
 from leettools.settings import SystemSettings
 
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.schema_manager import SchemaManager, table_schema
 from infograph.stores.duckdb.utils import ensure_duckdb_settings, strip_db_schema
 
 T = TypeVar_BaseModel
 
+# Rows per multi-row INSERT statement; keeps the parameter list bounded.
+INSERT_BATCH_ROWS = 500
+# Rows fetched per round trip by iter_all.
+ITER_CHUNK_ROWS = 500
+
 
 class DuckDBStoreBase(Generic[T]):
-    """Base class for DuckDB-backed stores."""
+    """Base class for DuckDB-backed stores.
 
-    def __init__(self, model: type[T], table_name: str, settings: SystemSettings | None = None) -> None:
+    The table is created or migrated through the client's ``SchemaManager``;
+    once the registry has bootstrapped the database, constructing a store
+    runs no DDL.
+    """
+
+    def __init__(
+        self,
+        model: type[T],
+        table_name: str,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+    ) -> None:
         self.model = model
         self.settings = ensure_duckdb_settings(settings)
-        self.schema = pydantic_to_db_schema(self.model)
+        self.schema = table_schema(self.model)
         self.insert_schema = strip_db_schema(self.schema)
         self.insert_columns = list(self.insert_schema.keys())
-        self.client = DuckDBClient(self.settings, db_name=self.settings.DB_CORE)
-        self.table_name = self.client.create_table_if_not_exists(
-            db_schema_name=self.settings.DB_CORE,
-            table_name=table_name,
-            columns=self.schema,
+        self.client = client or DuckDBClient(self.settings, db_name=self.settings.DB_CORE)
+        self.table_name = SchemaManager.for_client(self.client, self.settings).ensure(
+            self.model, table_name
+        )
+        self._json_fields = self._find_json_fields()
+        self._select_sql: dict[tuple[tuple[str, ...], tuple[str, ...], bool], str] = {}
+        self.executor = executor or DuckDBExecutor(self.client)
+
+    def _find_json_fields(self) -> frozenset[str]:
+        """Fields stored as JSON text: lists and dicts, optional or not."""
+        names = set()
+        for name, field in self.model.model_fields.items():
+            annotation = field.annotation
+            candidates = (
+                get_args(annotation)
+                if get_origin(annotation) in (Union, UnionType)
+                else (annotation,)
+            )
+            if any(get_origin(arg) in (list, dict) or arg in (list, dict) for arg in candidates):
+                names.add(name)
+        return frozenset(names)
+
+    async def insert(self, obj: T) -> None:
+        """Insert one model instance on the executor."""
+        placeholders = ",".join(["?"] * len(self.insert_columns))
+        await self.executor.execute(
+            f"INSERT INTO {self.table_name} ({','.join(self.insert_columns)}) "
+            f"VALUES ({placeholders})",
+            self._model_values(obj),
+        )
+
+    async def insert_if_absent(self, obj: T) -> T | None:
+        """Insert ``obj`` unless it collides with a key or unique index; None if it did."""
+        placeholders = ",".join(["?"] * len(self.insert_columns))
+        row = await self.executor.fetch_one(
+            f"INSERT INTO {self.table_name} ({','.join(self.insert_columns)}) "
+            f"VALUES ({placeholders}) ON CONFLICT DO NOTHING RETURNING *",
+            self._model_values(obj),
+        )
+        return self._to_model(row)
+
+    async def insert_many(self, objs: Sequence[T]) -> None:
+        """Append a batch of model instances in a single transaction."""
+        if not objs:
+            return
+
+        def _insert_many(cursor: DuckDBPyConnection) -> None:
+            cursor.begin()
+            try:
+                self.insert_many_with_cursor(cursor, objs)
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                raise
+
+        await self.executor.run(_insert_many)
+
+    def insert_many_with_cursor(self, cursor: DuckDBPyConnection, objs: Sequence[T]) -> None:
+        """Multi-row INSERT on ``cursor``; the caller owns the transaction."""
+        row_placeholder = "(" + ",".join(["?"] * len(self.insert_columns)) + ")"
+        rows = [self._model_values(obj) for obj in objs]
+        for start in range(0, len(rows), INSERT_BATCH_ROWS):
+            chunk = rows[start : start + INSERT_BATCH_ROWS]
+            cursor.execute(
+                f"INSERT INTO {self.table_name} ({','.join(self.insert_columns)}) "
+                f"VALUES {','.join([row_placeholder] * len(chunk))}",
+                [value for row in chunk for value in row],
+            )
+
+    async def fetch_one(
+        self, where_clause: str = "", value_list: list[Any] | None = None
+    ) -> T | None:
+        row = await self.executor.fetch_one(
+            f"SELECT * FROM {self.table_name} {where_clause}", value_list
+        )
+        return self._to_model(row)
+
+    async def fetch_all(
+        self, where_clause: str = "", value_list: list[Any] | None = None
+    ) -> list[T]:
+        rows = await self.executor.fetch_all(
+            f"SELECT * FROM {self.table_name} {where_clause}", value_list
         )
+        return [self._to_model(row) for row in rows if row]
+
+    async def fetch_all_trusted(
+        self,
+        where_clause: str = "",
+        value_list: list[Any] | None = None,
+        source: str | None = None,
+    ) -> list[T]:
+        """Bulk read that builds models without per-row validation.
+
+        Rows are only ever written through this store from validated models,
+        so list queries can skip ``duckdb_data_to_pydantic_obj`` and use
+        ``model_construct``; JSON columns are still decoded. ``source``
+        replaces the table in the FROM clause, e.g. with a union over
+        archived rows.
+        """
+        columns, rows = await self.executor.fetch_rows(
+            f"SELECT * FROM {source or self.table_name} {where_clause}", value_list
+        )
+        return self._construct_all(columns, rows)
+
+    def select_sql(
+        self,
+        where: Sequence[str] = (),
+        order_by: Sequence[str] = (),
+        limit: bool = False,
+    ) -> str:
+        """Parameterized SELECT for a query shape, built once and reused.
+
+        ``where`` lists columns compared for equality, ``order_by`` holds
+        column expressions such as ``"created_at DESC"`` and ``limit`` adds a
+        ``LIMIT ?`` placeholder. Only column names from store code belong
+        here; all values are bound as parameters.
+        """
+        shape = (tuple(where), tuple(order_by), limit)
+        sql = self._select_sql.get(shape)
+        if sql is None:
+            parts = [f"SELECT * FROM {self.table_name}"]
+            if where:
+                parts.append("WHERE " + " AND ".join(f"{column} = ?" for column in where))
+            if order_by:
+                parts.append("ORDER BY " + ", ".join(order_by))
+            if limit:
+                parts.append("LIMIT ?")
+            sql = " ".join(parts)
+            self._select_sql[shape] = sql
+        return sql
+
+    async def find_one(self, where: Sequence[str], value_list: Sequence[Any]) -> T | None:
+        """Fetch the first row matching equality predicates on ``where``."""
+        row = await self.executor.fetch_one(self.select_sql(where), list(value_list))
+        return self._to_model(row)
+
+    async def find_all(
+        self,
+        where: Sequence[str] = (),
+        value_list: Sequence[Any] = (),
+        *,
+        order_by: Sequence[str] = (),
+        limit: int | None = None,
+        trusted: bool = False,
+    ) -> list[T]:
+        """Fetch rows for a query shape; ``trusted`` skips per-row validation."""
+        sql = self.select_sql(where, order_by, limit is not None)
+        values = [*value_list, limit] if limit is not None else list(value_list)
+        if trusted:
+            columns, rows = await self.executor.fetch_rows(sql, values)
+            return self._construct_all(columns, rows)
+        rows = await self.executor.fetch_all(sql, values)
+        return [self._to_model(row) for row in rows if row]
+
+    async def iter_all(
+        self,
+        where: Sequence[str] = (),
+        value_list: Sequence[Any] = (),
+        *,
+        order_by: Sequence[str] = (),
+        chunk_rows: int = ITER_CHUNK_ROWS,
+    ) -> AsyncIterator[list[T]]:
+        """Yield trusted models in chunks of ``chunk_rows`` as they are fetched.
+
+        The query runs on a cursor of its own, so executor workers are free
+        between chunks while a slow client drains the stream.
+        """
+        sql = self.select_sql(where, order_by)
+        cursor = self.client.conn.cursor()
+        try:
+            await self.executor.run(lambda _: cursor.execute(sql, list(value_list)))
+            columns = [desc[0] for desc in cursor.description]
+            while rows := await self.executor.run(lambda _: cursor.fetchmany(chunk_rows)):
+                yield self._construct_all(columns, rows)
+        finally:
+            cursor.close()
+
+    async def update(
+        self, column_list: list[str], value_list: list[Any], where_clause: str
+    ) -> None:
+        set_clause = ",".join(f"{column} = ?" for column in column_list)
+        await self.executor.execute(
+            f"UPDATE {self.table_name} SET {set_clause} {where_clause}", value_list
+        )
+
+    async def update_returning(
+        self, column_list: list[str], value_list: list[Any], where_clause: str
+    ) -> T | None:
+        """Update and return the modified row in a single statement."""
+        set_clause = ",".join(f"{column} = ?" for column in column_list)
+        row = await self.executor.fetch_one(
+            f"UPDATE {self.table_name} SET {set_clause} {where_clause} RETURNING *",
+            value_list,
+        )
+        return self._to_model(row)
+
+    async def delete(self, where_clause: str, value_list: list[Any] | None = None) -> None:
+        await self.executor.execute(
+            f"DELETE FROM {self.table_name} {where_clause}", value_list
+        )
+
+    def _construct_all(self, columns: list[str], rows: list[tuple[Any, ...]]) -> list[T]:
+        json_positions = [idx for idx, name in enumerate(columns) if name in self._json_fields]
+        construct = self.model.model_construct
+        if not json_positions:
+            return [construct(**dict(zip(columns, row))) for row in rows]
+        models = []
+        for row in rows:
+            values = list(row)
+            for idx in json_positions:
+                if isinstance(values[idx], str):
+                    values[idx] = json.loads(values[idx])
+            models.append(construct(**dict(zip(columns, values))))
+        return models
 
     def _to_model(self, row: dict[str, Any] | None) -> T | None:
         if row is None:
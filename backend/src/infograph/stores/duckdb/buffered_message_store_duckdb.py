@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Sequence
+
+from infograph.core.schemas import Message, MessageCreate
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL_MS = 50
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedMessageStoreDuckDB(AbstractMessageStore):
+    """Write-behind message store that group-commits buffered inserts.
+
+    ``create`` appends to an in-memory buffer and returns immediately. The
+    buffer is written in one transaction once it holds ``batch_size``
+    messages or ``flush_interval_ms`` after the first buffered write,
+    whichever comes first. ``list_for_session`` merges buffered messages
+    with persisted ones, so a writer always reads its own messages.
+
+    Buffered messages are lost if the process dies before a flush; call
+    ``flush`` on shutdown.
+    """
+
+    def __init__(
+        self,
+        inner: MessageStoreDuckDB,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+    ) -> None:
+        self.inner = inner
+        self.batch_size = batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self._pending: list[Message] = []
+        self._in_flight: list[Message] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task[None] | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending) + len(self._in_flight)
+
+    async def create(self, create: MessageCreate) -> Message:
+        message = self.inner._build_message(create, self.inner._claim_timestamps(1))
+        await self._enqueue([message])
+        return message
+
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        messages = self.inner._build_messages(creates)
+        await self._enqueue(messages)
+        return messages
+
+    async def list_for_session(self, session_id: str) -> list[Message]:
+        # Snapshot the buffer before reading: a flush that lands during the read
+        # moves messages out of the buffer, but they are then still in this copy.
+        pending = self.pending_for_session(session_id)
+        persisted = await self.inner.list_for_session(session_id)
+        seen = {message.message_id for message in persisted}
+        buffered = [
+            message
+            for message in pending
+            if message.message_id not in seen
+        ]
+        if not buffered:
+            return persisted
+        return sorted([*persisted, *buffered], key=lambda message: message.created_at)
+
+    def pending_for_session(self, session_id: str) -> list[Message]:
+        return [
+            message
+            for message in [*self._in_flight, *self._pending]
+            if message.session_id == session_id
+        ]
+
+    async def delete_for_session(self, session_id: str) -> None:
+        # Holding the flush lock means no batch for this session lands after the delete.
+        async with self._flush_lock:
+            self._pending = [m for m in self._pending if m.session_id != session_id]
+            await self.inner.delete_for_session(session_id)
+
+    async def flush(self) -> None:
+        """Write every buffered message in one transaction."""
+        async with self._flush_lock:
+            if self._timer is not None and self._timer is not asyncio.current_task():
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return
+            self._in_flight, self._pending = self._pending, []
+            try:
+                await self.inner.store.insert_many(self._in_flight)
+            except Exception:
+                self._pending[:0] = self._in_flight
+                raise
+            finally:
+                self._in_flight = []
+
+    async def _enqueue(self, messages: list[Message]) -> None:
+        self._pending.extend(messages)
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None or self._timer.done():
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval_ms / 1000)
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Background flush of buffered messages failed")
+            if self._pending:
+                self._timer = asyncio.create_task(self._flush_later())
+
+
+__all__ = ["BufferedMessageStoreDuckDB"]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, TypeVar
+
+from duckdb import DuckDBPyConnection
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class ExecutorStats:
+    """Point-in-time queue and latency counters for a DuckDBExecutor."""
+
+    max_workers: int
+    queue_depth: int
+    running: int
+    completed: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return self.total_wait_ms / self.completed if self.completed else 0.0
+
+
+class DuckDBExecutor:
+    """Run DuckDB statements off the event loop on a bounded thread pool.
+
+    Every worker thread lazily opens its own cursor on the client's connection
+    and reuses it for all statements it executes, so concurrent queries never
+    share a cursor and never block the event loop.
+    """
+
+    def __init__(self, client: DuckDBClient, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.client = client
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="duckdb")
+        self._local = threading.local()
+        self._cursors: list[DuckDBPyConnection] = []
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait_ms = 0.0
+        self._max_wait_ms = 0.0
+
+    def _cursor(self) -> DuckDBPyConnection:
+        cursor = getattr(self._local, "cursor", None)
+        if cursor is None:
+            cursor = self.client.conn.cursor()
+            self._local.cursor = cursor
+            with self._lock:
+                self._cursors.append(cursor)
+        return cursor
+
+    async def run(self, fn: Callable[[DuckDBPyConnection], R]) -> R:
+        """Run ``fn`` with the worker thread's cursor and return its result."""
+        loop = asyncio.get_running_loop()
+        enqueued_at = time.perf_counter()
+        started = False
+
+        def task() -> R:
+            nonlocal started
+            started = True
+            wait_ms = (time.perf_counter() - enqueued_at) * 1000
+            with self._lock:
+                self._queue_depth -= 1
+                self._running += 1
+                self._total_wait_ms += wait_ms
+                self._max_wait_ms = max(self._max_wait_ms, wait_ms)
+            try:
+                return fn(self._cursor())
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        with self._lock:
+            self._queue_depth += 1
+        try:
+            return await loop.run_in_executor(self._pool, task)
+        except asyncio.CancelledError:
+            if not started:
+                with self._lock:
+                    self._queue_depth -= 1
+            raise
+
+    async def execute(self, sql: str, value_list: list[Any] | None = None) -> None:
+        def _execute(cursor: DuckDBPyConnection) -> None:
+            cursor.execute(sql, value_list)
+
+        await self.run(_execute)
+
+    async def fetch_all(
+        self, sql: str, value_list: list[Any] | None = None
+    ) -> list[dict[str, Any]]:
+        def _fetch_all(cursor: DuckDBPyConnection) -> list[dict[str, Any]]:
+            rows = cursor.execute(sql, value_list).fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+
+        return await self.run(_fetch_all)
+
+    async def fetch_rows(
+        self, sql: str, value_list: list[Any] | None = None
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """Return column names and raw row tuples without building dicts."""
+
+        def _fetch_rows(cursor: DuckDBPyConnection) -> tuple[list[str], list[tuple[Any, ...]]]:
+            rows = cursor.execute(sql, value_list).fetchall()
+            return [desc[0] for desc in cursor.description], rows
+
+        return await self.run(_fetch_rows)
+
+    async def fetch_one(
+        self, sql: str, value_list: list[Any] | None = None
+    ) -> dict[str, Any] | None:
+        def _fetch_one(cursor: DuckDBPyConnection) -> dict[str, Any] | None:
+            row = cursor.execute(sql, value_list).fetchone()
+            if row is None:
+                return None
+            columns = [desc[0] for desc in cursor.description]
+            return dict(zip(columns, row))
+
+        return await self.run(_fetch_one)
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self.max_workers,
+                queue_depth=self._queue_depth,
+                running=self._running,
+                completed=self._completed,
+                total_wait_ms=self._total_wait_ms,
+                max_wait_ms=self._max_wait_ms,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads and close their cursors."""
+        self._pool.shutdown(wait=True)
+        with self._lock:
+            for cursor in self._cursors:
+                cursor.close()
+            self._cursors.clear()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, AsyncIterator, Literal
+
+from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+ExportFormat = Literal["parquet", "ndjson"]
+
+# Rows pulled from the cursor per round trip when streaming NDJSON.
+EXPORT_CHUNK_ROWS = 1000
+
+# File suffix and COPY options per export format; JSON is written one object per line.
+_COPY_FORMATS: dict[str, tuple[str, str]] = {
+    "parquet": ("parquet", "FORMAT PARQUET"),
+    "ndjson": ("ndjson", "FORMAT JSON"),
+}
+
+
+class ExportStoreDuckDB:
+    """Export everything a user owns without materializing it in Python.
+
+    ``copy_to`` lets DuckDB write files directly with ``COPY ... TO``;
+    ``iter_ndjson`` streams rows from a dedicated cursor in fixed-size chunks.
+    Either way memory use depends on the chunk size, not the history size.
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStoreDuckDB,
+        source_store: SourceStoreDuckDB,
+        message_store: MessageStoreDuckDB,
+        infographic_store: InfographicStoreDuckDB,
+    ) -> None:
+        self.sessions = session_store.store
+        self.archive = session_store.archive
+        self.executor = self.sessions.executor
+        # Child tables with the column that orders rows within a session.
+        self.children = {
+            "sources": (source_store.store, "fetched_at"),
+            "messages": (message_store.store, "created_at"),
+            "infographics": (infographic_store.store, "created_at"),
+        }
+
+    async def _queries(self, user_id: str) -> list[tuple[str, DuckDBStoreBase, str]]:
+        """(kind, base, SQL) for each exported table; every query binds user_id once.
+
+        Tables are read together with the user's archived batches, if any.
+        """
+        batches = await self.archive.batches_for_user(user_id) if self.archive else []
+
+        def source(base: DuckDBStoreBase) -> str:
+            if self.archive is None or not batches:
+                return base.table_name
+            return self.archive.union_source(base, batches)
+
+        sessions = source(self.sessions)
+        owned = f"SELECT session_id FROM {sessions} WHERE user_id = ?"
+        queries = [
+            (
+                "sessions",
+                self.sessions,
+                f"SELECT * FROM {sessions} WHERE user_id = ? ORDER BY created_at",
+            )
+        ]
+        for kind, (base, order_column) in self.children.items():
+            sql = (
+                f"SELECT * FROM {source(base)} WHERE session_id IN ({owned}) "
+                f"ORDER BY session_id, {order_column}"
+            )
+            queries.append((kind, base, sql))
+        return queries
+
+    async def copy_to(self, user_id: str, directory: Path, fmt: ExportFormat) -> list[Path]:
+        """Write one file per table into ``directory`` and return their paths."""
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix, options = _COPY_FORMATS[fmt]
+        paths: list[Path] = []
+        for kind, _, sql in await self._queries(user_id):
+            path = directory / f"{kind}.{suffix}"
+            target = str(path.resolve()).replace("'", "''")
+            await self.executor.execute(f"COPY ({sql}) TO '{target}' ({options})", [user_id])
+            paths.append(path)
+        return paths
+
+    async def iter_ndjson(
+        self, user_id: str, chunk_rows: int = EXPORT_CHUNK_ROWS
+    ) -> AsyncIterator[bytes]:
+        """Yield NDJSON lines ``{"kind": ..., "data": {...}}`` in chunks.
+
+        The export runs on its own cursor inside one read transaction, so it
+        sees a consistent snapshot and never holds a shared executor cursor
+        between chunks.
+        """
+        cursor = self.executor.client.conn.cursor()
+        try:
+            await self.executor.run(lambda _: cursor.begin())
+            for kind, base, sql in await self._queries(user_id):
+                await self.executor.run(lambda _, sql=sql: cursor.execute(sql, [user_id]))
+                columns = [desc[0] for desc in cursor.description]
+                json_columns = {name for name in columns if name in base._json_fields}
+                while rows := await self.executor.run(lambda _: cursor.fetchmany(chunk_rows)):
+                    yield "".join(
+                        json.dumps(
+                            {"kind": kind, "data": _decode_row(columns, row, json_columns)},
+                            default=str,
+                        )
+                        + "\n"
+                        for row in rows
+                    ).encode()
+            await self.executor.run(lambda _: cursor.commit())
+        finally:
+            cursor.close()
+
+
+def _decode_row(columns: list[str], row: tuple[Any, ...], json_columns: set[str]) -> dict:
+    record = dict(zip(columns, row))
+    for name in json_columns:
+        if isinstance(record[name], str):
+            record[name] = json.loads(record[name])
+    return record
+
+
+__all__ = ["EXPORT_CHUNK_ROWS", "ExportFormat", "ExportStoreDuckDB"]
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from duckdb import DuckDBPyConnection
+
+from infograph.stores.duckdb.base import INSERT_BATCH_ROWS
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+from infograph.stores.duckdb.search_index_store_duckdb import SearchIndexStoreDuckDB
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+from infograph.stores.ttl_cache import TTLCache
+
+
+class MaintenanceStoreDuckDB:
+    """Cross-table cascade deletes and compaction for the core database.
+
+    All stores must share one client so a cascade runs in a single
+    transaction on one cursor. Purged sessions are evicted from
+    ``session_cache`` when one is given.
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStoreDuckDB,
+        source_store: SourceStoreDuckDB,
+        message_store: MessageStoreDuckDB,
+        infographic_store: InfographicStoreDuckDB,
+        search_index_store: SearchIndexStoreDuckDB,
+        archive: SessionArchiveDuckDB | None = None,
+        session_cache: TTLCache | None = None,
+    ) -> None:
+        self.session_store = session_store
+        self.session_cache = session_cache
+        self.archive = archive
+        self.search_index_store = search_index_store
+        self.executor = session_store.store.executor
+        self.sessions_table = session_store.store.table_name
+        self.child_tables = [
+            source_store.store.table_name,
+            message_store.store.table_name,
+            infographic_store.store.table_name,
+        ]
+        self.infographics_table = infographic_store.store.table_name
+
+    def _user_filters(self) -> list[tuple[str, str]]:
+        """(table, WHERE clause binding user_id once) for every table a user owns.
+
+        Parents come first so copies insert them before their children.
+        """
+        owned = f"session_id IN (SELECT session_id FROM {self.sessions_table} WHERE user_id = ?)"
+        filters = [
+            (self.sessions_table, "user_id = ?"),
+            *((table, owned) for table in self.child_tables),
+            (self.search_index_store.postings.table_name, "user_id = ?"),
+            (self.search_index_store.stats.table_name, "user_id = ?"),
+        ]
+        if self.archive is not None:
+            # Archived batches are shared files; moving the index entries moves the user.
+            filters.append((self.archive.index.table_name, "user_id = ?"))
+        return filters
+
+    async def expired_session_ids(self, cutoff_ms: int, limit: int) -> list[str]:
+        rows = await self.executor.fetch_all(
+            f"SELECT session_id FROM {self.sessions_table} "
+            "WHERE created_at < ? ORDER BY created_at LIMIT ?",
+            [cutoff_ms, limit],
+        )
+        return [row["session_id"] for row in rows]
+
+    async def expired_archived_session_ids(self, cutoff_ms: int, limit: int) -> list[str]:
+        if self.archive is None:
+            return []
+        return await self.archive.expired_session_ids(cutoff_ms, limit)
+
+    async def orphaned_session_ids(self, limit: int) -> list[str]:
+        """Session ids that still own child rows but no longer have a session row.
+
+        Archived sessions keep their search postings hot and are not orphans.
+        """
+        children = " UNION ".join(
+            f"SELECT DISTINCT session_id FROM {table}"
+            for table in [*self.child_tables, self.search_index_store.postings.table_name]
+        )
+        archived = (
+            f"AND NOT EXISTS (SELECT 1 FROM {self.archive.index.table_name} a "
+            "WHERE a.session_id = child.session_id) "
+            if self.archive is not None
+            else ""
+        )
+        rows = await self.executor.fetch_all(
+            f"SELECT session_id FROM ({children}) AS child "
+            f"WHERE NOT EXISTS (SELECT 1 FROM {self.sessions_table} s "
+            f"WHERE s.session_id = child.session_id) {archived}LIMIT ?",
+            [limit],
+        )
+        return [row["session_id"] for row in rows]
+
+    async def purge_sessions(self, session_ids: Sequence[str]) -> int:
+        """Delete sessions and everything they own in one transaction.
+
+        Archived sessions lose their index entries too; their batch files
+        are left for ``PurgeService`` to remove once no shard references them.
+        """
+        if not session_ids:
+            return 0
+        placeholders = ",".join(["?"] * len(session_ids))
+        values = list(session_ids)
+
+        def _purge(cursor: DuckDBPyConnection) -> int:
+            cursor.begin()
+            try:
+                removed = 0
+                for table in [*self.child_tables, self.sessions_table]:
+                    removed += cursor.execute(
+                        f"DELETE FROM {table} WHERE session_id IN ({placeholders})",
+                        values,
+                    ).fetchone()[0]
+                self.search_index_store.delete_sessions_with_cursor(cursor, values)
+                if self.archive is not None:
+                    removed += self.archive.delete_entries_with_cursor(cursor, values)
+                cursor.commit()
+                return removed
+            except Exception:
+                cursor.rollback()
+                raise
+
+        removed = await self.executor.run(_purge)
+        if self.archive is not None:
+            self.archive.invalidate()
+        if self.session_cache is not None:
+            for session_id in values:
+                self.session_cache.invalidate(session_id)
+        return removed
+
+    async def user_ids(self) -> list[str]:
+        """Users with hot or archived sessions here."""
+        sql = f"SELECT user_id FROM {self.sessions_table}"
+        if self.archive is not None:
+            sql += f" UNION SELECT user_id FROM {self.archive.index.table_name}"
+        rows = await self.executor.fetch_all(
+            f"SELECT DISTINCT user_id FROM ({sql}) AS owners ORDER BY user_id"
+        )
+        return [row["user_id"] for row in rows]
+
+    def session_ids_in(
+        self, tables: dict[str, tuple[list[str], list[tuple[Any, ...]]]]
+    ) -> list[str]:
+        """Hot and archived session ids among rows returned by ``fetch_user_rows``."""
+        session_ids: list[str] = []
+        sources = [self.sessions_table]
+        if self.archive is not None:
+            sources.append(self.archive.index.table_name)
+        for table in sources:
+            columns, rows = tables.get(table, ([], []))
+            if rows:
+                position = columns.index("session_id")
+                session_ids.extend(row[position] for row in rows)
+        return session_ids
+
+    async def fetch_user_rows(
+        self, user_id: str
+    ) -> dict[str, tuple[list[str], list[tuple[Any, ...]]]]:
+        """Every row ``user_id`` owns, as (columns, rows) per table, from one snapshot."""
+
+        def _fetch(cursor: DuckDBPyConnection) -> dict[str, tuple[list[str], list[tuple]]]:
+            cursor.begin()
+            try:
+                tables = {}
+                for table, where in self._user_filters():
+                    result = cursor.execute(f"SELECT * FROM {table} WHERE {where}", [user_id])
+                    columns = [desc[0] for desc in result.description]
+                    tables[table] = (columns, result.fetchall())
+                cursor.commit()
+                return tables
+            except Exception:
+                cursor.rollback()
+                raise
+
+        return await self.executor.run(_fetch)
+
+    async def replace_user_rows(
+        self, user_id: str, tables: dict[str, tuple[list[str], list[tuple[Any, ...]]]]
+    ) -> int:
+        """Replace whatever ``user_id`` owns here with ``tables``, in one transaction.
+
+        Deleting first makes a retried copy after an interrupted move safe.
+        """
+
+        def _replace(cursor: DuckDBPyConnection) -> int:
+            cursor.begin()
+            try:
+                self._delete_user_rows_with_cursor(cursor, user_id)
+                copied = 0
+                for table, _ in self._user_filters():
+                    columns, rows = tables.get(table, ([], []))
+                    row_placeholder = "(" + ",".join(["?"] * len(columns)) + ")"
+                    for start in range(0, len(rows), INSERT_BATCH_ROWS):
+                        chunk = rows[start : start + INSERT_BATCH_ROWS]
+                        cursor.execute(
+                            f"INSERT INTO {table} ({','.join(columns)}) "
+                            f"VALUES {','.join([row_placeholder] * len(chunk))}",
+                            [value for row in chunk for value in row],
+                        )
+                    copied += len(rows)
+                cursor.commit()
+                return copied
+            except Exception:
+                cursor.rollback()
+                raise
+
+        copied = await self.executor.run(_replace)
+        if self.archive is not None:
+            self.archive.invalidate()
+        return copied
+
+    async def delete_user_rows(self, user_id: str) -> int:
+        """Delete everything ``user_id`` owns here in one transaction."""
+
+        def _delete(cursor: DuckDBPyConnection) -> int:
+            cursor.begin()
+            try:
+                removed = self._delete_user_rows_with_cursor(cursor, user_id)
+                cursor.commit()
+                return removed
+            except Exception:
+                cursor.rollback()
+                raise
+
+        removed = await self.executor.run(_delete)
+        if self.archive is not None:
+            self.archive.invalidate()
+        return removed
+
+    def _delete_user_rows_with_cursor(self, cursor: DuckDBPyConnection, user_id: str) -> int:
+        removed = 0
+        # Children before parents: their filter reads the sessions table.
+        for table, where in reversed(self._user_filters()):
+            removed += cursor.execute(
+                f"DELETE FROM {table} WHERE {where}", [user_id]
+            ).fetchone()[0]
+        return removed
+
+    async def archive_sessions(self, session_ids: Sequence[str]) -> int:
+        """Move sessions and their child rows to the Parquet archive."""
+        if self.archive is None:
+            raise ValueError("No session archive is configured")
+        return await self.archive.archive_sessions(
+            session_ids, self.sessions_table, self.child_tables
+        )
+
+    async def referenced_image_paths(self) -> set[str]:
+        rows = await self.executor.fetch_all(
+            f"SELECT DISTINCT image_path FROM {self.infographics_table}"
+        )
+        paths = {row["image_path"] for row in rows}
+        if self.archive is not None:
+            paths |= await self.archive.image_paths(self.infographics_table)
+        return paths
+
+    async def checkpoint(self) -> None:
+        """Flush the WAL and let DuckDB reclaim blocks freed by deletes."""
+        await self.executor.execute("CHECKPOINT")
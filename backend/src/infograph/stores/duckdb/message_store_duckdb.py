@@ -1,50 +1,95 @@
 from __future__ import annotations
 
 import uuid
+from typing import AsyncIterator, Sequence
 
+from leettools.common.duckdb.duckdb_client import DuckDBClient
 from leettools.common.utils import time_utils
 from leettools.settings import SystemSettings
 
 from infograph.core.schemas import Message, MessageCreate
 from infograph.stores.abstract_message_store import AbstractMessageStore
 from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
 from infograph.stores.duckdb.utils import ensure_duckdb_settings
 
 
 class MessageStoreDuckDB(AbstractMessageStore):
-    """DuckDB-backed storage for chat messages."""
+    """DuckDB-backed storage for chat messages.
 
-    def __init__(self, settings: SystemSettings | None = None) -> None:
+    Reads order messages by ``created_at``, so the store hands out strictly
+    increasing timestamps: messages written in one batch, or in the same
+    millisecond, keep the order they were written in.
+    """
+
+    def __init__(
+        self,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+        archive: SessionArchiveDuckDB | None = None,
+    ) -> None:
         self.settings = ensure_duckdb_settings(settings)
-        self.store = DuckDBStoreBase(Message, "messages", self.settings)
+        self.archive = archive
+        self._last_created_at = 0
+        self.store = DuckDBStoreBase(
+            Message, "messages", self.settings, client=client, executor=executor
+        )
 
     async def create(self, create: MessageCreate) -> Message:
-        created_at = time_utils.cur_timestamp_in_ms()
-        message = Message(
+        message = self._build_message(create, self._claim_timestamps(1))
+        await self.store.insert(message)
+        return message
+
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        messages = self._build_messages(creates)
+        await self.store.insert_many(messages)
+        return messages
+
+    def _claim_timestamps(self, count: int) -> int:
+        """First of ``count`` consecutive timestamps, all later than any handed out before."""
+        first = max(time_utils.cur_timestamp_in_ms(), self._last_created_at + 1)
+        self._last_created_at = first + count - 1
+        return first
+
+    def _build_messages(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        first = self._claim_timestamps(len(creates))
+        return [self._build_message(create, first + idx) for idx, create in enumerate(creates)]
+
+    def _build_message(self, create: MessageCreate, created_at: int) -> Message:
+        return Message(
             message_id=str(uuid.uuid4()),
             session_id=create.session_id,
             role=create.role,
             content=create.content,
             created_at=created_at,
         )
-        self.store.client.insert_into_table(
-            table_name=self.store.table_name,
-            column_list=self.store.insert_columns,
-            value_list=self.store._model_values(message),
-        )
-        return message
 
     async def list_for_session(self, session_id: str) -> list[Message]:
-        rows = self.store.client.fetch_all_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ? ORDER BY created_at ASC",
-            value_list=[session_id],
+        messages = await self.store.find_all(
+            ["session_id"], [session_id], order_by=["created_at ASC"], trusted=True
         )
-        return [self.store._to_model(row) for row in rows if row]
+        archived = await self._archived(session_id)
+        if not archived:
+            return messages
+        return sorted([*archived, *messages], key=lambda message: message.created_at)
 
-    async def delete_for_session(self, session_id: str) -> None:
-        self.store.client.delete_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ?",
-            value_list=[session_id],
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Message]]:
+        # Archived messages predate anything written since, so they come first.
+        if archived := await self._archived(session_id):
+            yield archived
+        async for chunk in self.store.iter_all(
+            ["session_id"], [session_id], order_by=["created_at ASC"]
+        ):
+            yield chunk
+
+    async def _archived(self, session_id: str) -> list[Message]:
+        if self.archive is None:
+            return []
+        return await self.archive.read_for_session(
+            self.store, session_id, order_by=["created_at ASC"]
         )
+
+    async def delete_for_session(self, session_id: str) -> None:
+        await self.store.delete("WHERE session_id = ?", [session_id])
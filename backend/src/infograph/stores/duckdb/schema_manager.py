@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Sequence
+from weakref import WeakKeyDictionary
+
+from duckdb import ConstraintException, DuckDBPyConnection
+from leettools.common.db.table_schema import pydantic_to_db_schema
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from leettools.common.utils import time_utils
+from leettools.settings import SystemSettings
+from pydantic import BaseModel
+
+from infograph.core.schemas import (
+    ArchivedSession,
+    Infographic,
+    Message,
+    ResearchSession,
+    SchemaVersion,
+    SearchPosting,
+    SearchUserStats,
+    SessionShard,
+    Source,
+    User,
+    UserShard,
+)
+from infograph.stores.duckdb.utils import strip_db_schema
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSIONS_TABLE = "schema_versions"
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """A table and the model its columns are derived from."""
+
+    model: type[BaseModel]
+    table_name: str
+
+
+# Every table a core database holds; bootstrapped together when its client opens.
+CORE_TABLES: tuple[TableSpec, ...] = (
+    TableSpec(User, "users"),
+    TableSpec(ResearchSession, "research_sessions"),
+    TableSpec(Source, "sources"),
+    TableSpec(Message, "messages"),
+    TableSpec(Infographic, "infographics"),
+    TableSpec(SearchPosting, "search_postings"),
+    TableSpec(SearchUserStats, "search_user_stats"),
+    TableSpec(ArchivedSession, "archived_sessions"),
+)
+
+# Held only by the home database of a sharded deployment.
+SHARD_DIRECTORY_TABLES: tuple[TableSpec, ...] = (
+    TableSpec(UserShard, "user_shards"),
+    TableSpec(SessionShard, "session_directory"),
+)
+
+
+@functools.cache
+def table_schema(model: type[BaseModel]) -> dict[str, str]:
+    """DuckDB schema for ``model``, derived once per process."""
+    return pydantic_to_db_schema(model)
+
+
+def unique_columns(model: type[BaseModel]) -> tuple[str, ...]:
+    """Columns declared via ``unique`` schema extras."""
+    return tuple(
+        name
+        for name, field in model.model_fields.items()
+        if isinstance(field.json_schema_extra, dict) and field.json_schema_extra.get("unique")
+    )
+
+
+def schema_fingerprint(schema: dict[str, str], unique: Sequence[str] = ()) -> str:
+    payload: list[Any] = sorted(schema.items())
+    if unique:
+        payload.append(["UNIQUE", sorted(unique)])
+    return hashlib.blake2b(json.dumps(payload).encode(), digest_size=8).hexdigest()
+
+
+class SchemaManager:
+    """Create and migrate the tables of one database, once per client.
+
+    ``bootstrap`` reads the ``schema_versions`` table and the catalog's
+    column list in two queries, then touches only tables whose model
+    changed since their recorded fingerprint: missing tables are created,
+    missing columns are added (and filled from their ``backfill`` SQL
+    expression, if any) and the table's version is bumped. Changes
+    are additive only; dropping or retyping a column needs a hand-written
+    migration. Stores call ``ensure`` and, after a bootstrap, attach to
+    the ready table without any DDL.
+    """
+
+    _managers: WeakKeyDictionary[DuckDBClient, SchemaManager] = WeakKeyDictionary()
+    _managers_lock = threading.Lock()
+
+    def __init__(self, client: DuckDBClient, settings: SystemSettings) -> None:
+        self.client = client
+        self.db_schema = settings.DB_CORE
+        self._lock = threading.RLock()
+        self._ready: dict[str, str] = {}
+        self._versions_table: str | None = None
+
+    @classmethod
+    def for_client(cls, client: DuckDBClient, settings: SystemSettings) -> SchemaManager:
+        """The manager shared by every store on ``client``."""
+        with cls._managers_lock:
+            manager = cls._managers.get(client)
+            if manager is None:
+                manager = cls(client, settings)
+                cls._managers[client] = manager
+            return manager
+
+    def ensure(self, model: type[BaseModel], table_name: str) -> str:
+        """Qualified name of ``table_name``, creating or migrating it on first use."""
+        qualified = self._ready.get(table_name)
+        if qualified is not None:
+            return qualified
+        return self.bootstrap([TableSpec(model, table_name)])[table_name]
+
+    def bootstrap(self, specs: Sequence[TableSpec]) -> dict[str, str]:
+        """Bring every table in ``specs`` up to date in one pass; returns qualified names."""
+        with self._lock:
+            pending = [spec for spec in specs if spec.table_name not in self._ready]
+            if pending:
+                with self.client.conn.cursor() as cursor:
+                    versions = self._recorded_versions(cursor)
+                    existing = self._existing_columns(cursor)
+                    for spec in pending:
+                        self._ready[spec.table_name] = self._migrate(
+                            cursor, spec, versions.get(spec.table_name), existing
+                        )
+            return {spec.table_name: self._ready[spec.table_name] for spec in specs}
+
+    def versions(self) -> dict[str, int]:
+        """Recorded schema version of every managed table in this database."""
+        with self.client.conn.cursor() as cursor:
+            return {
+                name: version.version
+                for name, version in self._recorded_versions(cursor).items()
+            }
+
+    def _recorded_versions(self, cursor: DuckDBPyConnection) -> dict[str, SchemaVersion]:
+        if self._versions_table is None:
+            self._versions_table = self.client.create_table_if_not_exists(
+                db_schema_name=self.db_schema,
+                table_name=SCHEMA_VERSIONS_TABLE,
+                columns=table_schema(SchemaVersion),
+            )
+        result = cursor.execute(f"SELECT * FROM {self._versions_table}")
+        columns = [desc[0] for desc in result.description]
+        versions = {}
+        for row in result.fetchall():
+            version = SchemaVersion.model_construct(**dict(zip(columns, row)))
+            versions[version.table_name] = version
+        return versions
+
+    def _existing_columns(self, cursor: DuckDBPyConnection) -> dict[str, set[str]]:
+        rows = cursor.execute(
+            "SELECT table_name, column_name FROM information_schema.columns "
+            "WHERE table_catalog = current_database() AND table_schema = ?",
+            [self.db_schema.lower()],
+        ).fetchall()
+        existing: dict[str, set[str]] = {}
+        for table_name, column_name in rows:
+            existing.setdefault(table_name, set()).add(column_name)
+        return existing
+
+    def _migrate(
+        self,
+        cursor: DuckDBPyConnection,
+        spec: TableSpec,
+        recorded: SchemaVersion | None,
+        existing: dict[str, set[str]],
+    ) -> str:
+        schema = table_schema(spec.model)
+        fingerprint = schema_fingerprint(schema, unique_columns(spec.model))
+        columns = existing.get(spec.table_name)
+        if recorded is not None and recorded.fingerprint == fingerprint and columns:
+            return recorded.qualified_name
+
+        qualified = self.client.create_table_if_not_exists(
+            db_schema_name=self.db_schema,
+            table_name=spec.table_name,
+            columns=schema,
+        )
+        if columns:
+            for column, definition in strip_db_schema(schema).items():
+                if column not in columns:
+                    cursor.execute(
+                        f"ALTER TABLE {qualified} ADD COLUMN IF NOT EXISTS {column} {definition}"
+                    )
+                    self._backfill(cursor, spec.model, qualified, column)
+        self._create_composite_indexes(cursor, spec.model, qualified)
+        if not self._create_unique_indexes(cursor, spec.model, qualified):
+            # Left unrecorded so the next bootstrap tries the index again.
+            return qualified
+
+        version = recorded.version + 1 if recorded is not None else 1
+        cursor.execute(
+            f"INSERT INTO {self._versions_table} "
+            "(table_name, qualified_name, version, fingerprint, updated_at) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (table_name) DO UPDATE SET "
+            "qualified_name = excluded.qualified_name, version = excluded.version, "
+            "fingerprint = excluded.fingerprint, updated_at = excluded.updated_at",
+            [spec.table_name, qualified, version, fingerprint, time_utils.cur_timestamp_in_ms()],
+        )
+        return qualified
+
+    @staticmethod
+    def _backfill(
+        cursor: DuckDBPyConnection, model: type[BaseModel], qualified: str, column: str
+    ) -> None:
+        """Fill a newly added column from its ``backfill`` SQL expression, if declared."""
+        field = model.model_fields.get(column)
+        extra = field.json_schema_extra if field is not None else None
+        expression = extra.get("backfill") if isinstance(extra, dict) else None
+        if expression:
+            cursor.execute(f"UPDATE {qualified} SET {column} = {expression}")
+
+    @staticmethod
+    def _create_composite_indexes(
+        cursor: DuckDBPyConnection, model: type[BaseModel], qualified: str
+    ) -> None:
+        """Create the indexes, of one or more columns, declared via ``composite_index`` extras."""
+        table = qualified.split(".")[-1]
+        for field in model.model_fields.values():
+            extra = field.json_schema_extra
+            columns = extra.get("composite_index") if isinstance(extra, dict) else None
+            if not columns:
+                continue
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_{'_'.join(columns)} "
+                f"ON {qualified} ({', '.join(columns)})"
+            )
+
+    @staticmethod
+    def _create_unique_indexes(
+        cursor: DuckDBPyConnection, model: type[BaseModel], qualified: str
+    ) -> bool:
+        """Create unique indexes for ``unique`` columns; False if existing rows collide."""
+        table = qualified.split(".")[-1]
+        for column in unique_columns(model):
+            try:
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS uidx_{table}_{column} "
+                    f"ON {qualified} ({column})"
+                )
+            except ConstraintException:
+                logger.error(
+                    "%s holds duplicate %s values; merge them to enable its unique index",
+                    qualified,
+                    column,
+                )
+                return False
+        return True
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Sequence
+
+from duckdb import DuckDBPyConnection
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import SearchDocument, SearchHit, SearchPosting, SearchUserStats
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.utils import ensure_duckdb_settings
+from infograph.stores.search_utils import (
+    BM25_B,
+    BM25_K1,
+    posting_key,
+    term_frequencies,
+    tokenize,
+)
+
+
+class SearchIndexStoreDuckDB(AbstractSearchIndexStore):
+    """Inverted index over a user's history, kept in DuckDB tables.
+
+    Each indexed document contributes one posting per distinct term, keyed
+    by user and term so a search reads only the postings of its own query
+    terms through the index. Per-user document counts and lengths are maintained alongside so BM25 can
+    be scored from the postings of the query terms alone.
+    """
+
+    def __init__(
+        self,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+    ) -> None:
+        self.settings = ensure_duckdb_settings(settings)
+        self.postings = DuckDBStoreBase(
+            SearchPosting, "search_postings", self.settings, client=client, executor=executor
+        )
+        self.stats = DuckDBStoreBase(
+            SearchUserStats,
+            "search_user_stats",
+            self.settings,
+            client=self.postings.client,
+            executor=self.postings.executor,
+        )
+
+    async def index_documents(self, documents: Sequence[SearchDocument]) -> None:
+        postings: list[SearchPosting] = []
+        user_totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+        for document in documents:
+            frequencies, length = term_frequencies(document.text)
+            if not frequencies:
+                continue
+            user_totals[document.user_id][0] += 1
+            user_totals[document.user_id][1] += length
+            postings.extend(
+                SearchPosting(
+                    term=term,
+                    doc_id=document.doc_id,
+                    user_id=document.user_id,
+                    posting_key=posting_key(document.user_id, term),
+                    session_id=document.session_id,
+                    term_freq=count,
+                    doc_length=length,
+                )
+                for term, count in frequencies.items()
+            )
+        if not postings:
+            return
+
+        upsert_stats = (
+            f"INSERT INTO {self.stats.table_name} (user_id, doc_count, total_length) "
+            "VALUES (?, ?, ?) ON CONFLICT (user_id) DO UPDATE SET "
+            "doc_count = doc_count + excluded.doc_count, "
+            "total_length = total_length + excluded.total_length"
+        )
+
+        def _index(cursor: DuckDBPyConnection) -> None:
+            cursor.begin()
+            try:
+                self.postings.insert_many_with_cursor(cursor, postings)
+                for user_id, (doc_count, total_length) in user_totals.items():
+                    cursor.execute(upsert_stats, [user_id, doc_count, total_length])
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                raise
+
+        await self.postings.executor.run(_index)
+
+    async def delete_for_session(self, session_id: str) -> None:
+        def _delete(cursor: DuckDBPyConnection) -> None:
+            cursor.begin()
+            try:
+                self.delete_sessions_with_cursor(cursor, [session_id])
+                cursor.commit()
+            except Exception:
+                cursor.rollback()
+                raise
+
+        await self.postings.executor.run(_delete)
+
+    def delete_sessions_with_cursor(
+        self, cursor: DuckDBPyConnection, session_ids: Sequence[str]
+    ) -> None:
+        """Drop postings for ``session_ids`` and adjust user stats; caller owns the transaction."""
+        placeholders = ",".join(["?"] * len(session_ids))
+        removed = cursor.execute(
+            f"""
+            SELECT user_id, count(*) AS doc_count, sum(doc_length) AS total_length
+            FROM (
+                SELECT DISTINCT user_id, doc_id, doc_length
+                FROM {self.postings.table_name} WHERE session_id IN ({placeholders})
+            )
+            GROUP BY user_id
+            """,
+            list(session_ids),
+        ).fetchall()
+        cursor.execute(
+            f"DELETE FROM {self.postings.table_name} WHERE session_id IN ({placeholders})",
+            list(session_ids),
+        )
+        for user_id, doc_count, total_length in removed:
+            cursor.execute(
+                f"UPDATE {self.stats.table_name} SET doc_count = doc_count - ?, "
+                "total_length = total_length - ? WHERE user_id = ?",
+                [doc_count, total_length, user_id],
+            )
+
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        terms = sorted(set(tokenize(query)))
+        if not terms:
+            return []
+        # One equality probe per term on the indexed key; filtering on
+        # user_id and term directly scans every user's postings.
+        keys = [posting_key(user_id, term) for term in terms]
+
+        rows = await self.postings.executor.fetch_all(
+            f"""
+            WITH stats AS (
+                SELECT doc_count, total_length::DOUBLE / doc_count AS avg_length
+                FROM {self.stats.table_name}
+                WHERE user_id = ? AND doc_count > 0
+            ),
+            matches AS (
+                SELECT term, session_id, term_freq, doc_length
+                FROM {self.postings.table_name}
+                WHERE posting_key IN ({",".join(["?"] * len(keys))})
+            ),
+            doc_freq AS (
+                SELECT term, count(*) AS df FROM matches GROUP BY term
+            )
+            SELECT
+                m.session_id,
+                sum(
+                    ln(1 + (s.doc_count - d.df + 0.5) / (d.df + 0.5))
+                    * m.term_freq * ({BM25_K1} + 1)
+                    / (
+                        m.term_freq
+                        + {BM25_K1} * (1 - {BM25_B} + {BM25_B} * m.doc_length / s.avg_length)
+                    )
+                ) AS score
+            FROM matches m
+            JOIN doc_freq d USING (term)
+            CROSS JOIN stats s
+            GROUP BY m.session_id
+            ORDER BY score DESC, m.session_id
+            LIMIT ?
+            """,
+            [user_id, *keys, limit],
+        )
+        return [SearchHit(session_id=row["session_id"], score=row["score"]) for row in rows]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import shutil
+import uuid
+from pathlib import Path
+from typing import Any, Sequence
+
+from duckdb import DuckDBPyConnection
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from leettools.common.utils import time_utils
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import ArchivedSession
+from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.utils import ensure_duckdb_settings
+
+
+def _short_name(table_name: str) -> str:
+    return table_name.split(".")[-1]
+
+
+def _quote(path: Path | str) -> str:
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def _read_parquet(paths: Sequence[Path | str]) -> str:
+    # The batch=<id> directories are not partition columns of the archived rows.
+    files = ", ".join(_quote(path) for path in paths)
+    return f"read_parquet([{files}], hive_partitioning = false)"
+
+
+class SessionArchiveDuckDB:
+    """Cold tier for old sessions: Parquet batches plus a small hot index.
+
+    ``archive_sessions`` copies sessions and their child rows to
+    ``<archive_dir>/<table>/batch=<id>/data.parquet`` and removes them from
+    the hot tables in the same transaction. Reads consult the
+    ``archived_sessions`` index and only scan the batch that holds the
+    session, so hot-path queries pay nothing while the index is empty and
+    one primary-key probe otherwise. Archived sessions are read-only.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Path,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+    ) -> None:
+        self.archive_dir = archive_dir
+        self.settings = ensure_duckdb_settings(settings)
+        self.index = DuckDBStoreBase(
+            ArchivedSession, "archived_sessions", self.settings, client=client, executor=executor
+        )
+        self.executor = self.index.executor
+        self._has_entries: bool | None = None
+
+    def batch_path(self, table_name: str, batch_id: str) -> Path:
+        return self.archive_dir / _short_name(table_name) / f"batch={batch_id}" / "data.parquet"
+
+    def table_glob(self, table_name: str) -> str:
+        return str(self.archive_dir / _short_name(table_name) / "batch=*" / "data.parquet")
+
+    async def has_entries(self) -> bool:
+        if self._has_entries is None:
+            row = await self.executor.fetch_one(
+                f"SELECT 1 AS found FROM {self.index.table_name} LIMIT 1"
+            )
+            self._has_entries = row is not None
+        return self._has_entries
+
+    def invalidate(self) -> None:
+        """Forget whether the index is empty, after index rows were written elsewhere."""
+        self._has_entries = None
+
+    async def batch_for_session(self, session_id: str) -> str | None:
+        if not await self.has_entries():
+            return None
+        entry = await self.index.find_one(["session_id"], [session_id])
+        return None if entry is None else entry.batch_id
+
+    async def batches_for_user(self, user_id: str) -> list[str]:
+        if not await self.has_entries():
+            return []
+        rows = await self.executor.fetch_all(
+            f"SELECT DISTINCT batch_id FROM {self.index.table_name} "
+            "WHERE user_id = ? ORDER BY batch_id",
+            [user_id],
+        )
+        return [row["batch_id"] for row in rows]
+
+    async def expired_session_ids(self, cutoff_ms: int, limit: int) -> list[str]:
+        if not await self.has_entries():
+            return []
+        rows = await self.executor.fetch_all(
+            f"SELECT session_id FROM {self.index.table_name} "
+            "WHERE created_at < ? ORDER BY created_at LIMIT ?",
+            [cutoff_ms, limit],
+        )
+        return [row["session_id"] for row in rows]
+
+    def union_source(self, base: DuckDBStoreBase, batch_ids: Sequence[str]) -> str:
+        """FROM target covering the hot table and the given batches of it."""
+        files = [self.batch_path(base.table_name, batch_id) for batch_id in batch_ids]
+        files = [path for path in files if path.exists()]
+        if not files:
+            return base.table_name
+        return (
+            f"(SELECT * FROM {base.table_name} UNION ALL BY NAME "
+            f"SELECT * FROM {_read_parquet(files)})"
+        )
+
+    async def read_for_session(
+        self, base: DuckDBStoreBase, session_id: str, order_by: Sequence[str] = ()
+    ) -> list[Any]:
+        """Archived rows of ``base`` for ``session_id``; empty if it was never archived."""
+        batch_id = await self.batch_for_session(session_id)
+        if batch_id is None:
+            return []
+        path = self.batch_path(base.table_name, batch_id)
+        if not path.exists():
+            return []
+        sql = f"SELECT * FROM {_read_parquet([path])} WHERE session_id = ?"
+        if order_by:
+            sql += " ORDER BY " + ", ".join(order_by)
+        columns, rows = await self.executor.fetch_rows(sql, [session_id])
+        return base._construct_all(columns, rows)
+
+    async def archive_sessions(
+        self, session_ids: Sequence[str], sessions_table: str, child_tables: Sequence[str]
+    ) -> int:
+        """Move sessions and their child rows into a new batch; return rows moved."""
+        if not session_ids:
+            return 0
+        batch_id = f"{time_utils.cur_timestamp_in_ms()}-{uuid.uuid4().hex[:8]}"
+        tables = [sessions_table, *child_tables]
+        placeholders = ",".join(["?"] * len(session_ids))
+        values = list(session_ids)
+        for table in tables:
+            self.batch_path(table, batch_id).parent.mkdir(parents=True, exist_ok=True)
+
+        def _archive(cursor: DuckDBPyConnection) -> int:
+            cursor.begin()
+            try:
+                for table in tables:
+                    cursor.execute(
+                        f"COPY (SELECT * FROM {table} WHERE session_id IN ({placeholders})) "
+                        f"TO {_quote(self.batch_path(table, batch_id))} (FORMAT PARQUET)",
+                        values,
+                    )
+                cursor.execute(
+                    f"INSERT INTO {self.index.table_name} "
+                    "(session_id, user_id, created_at, batch_id, archived_at) "
+                    f"SELECT session_id, user_id, created_at, ?, ? FROM {sessions_table} "
+                    f"WHERE session_id IN ({placeholders})",
+                    [batch_id, time_utils.cur_timestamp_in_ms(), *values],
+                )
+                moved = 0
+                for table in reversed(tables):
+                    moved += cursor.execute(
+                        f"DELETE FROM {table} WHERE session_id IN ({placeholders})", values
+                    ).fetchone()[0]
+                cursor.commit()
+                return moved
+            except Exception:
+                cursor.rollback()
+                for table in tables:
+                    shutil.rmtree(self.batch_path(table, batch_id).parent, ignore_errors=True)
+                raise
+
+        moved = await self.executor.run(_archive)
+        self._has_entries = True
+        return moved
+
+    async def forget(self, session_id: str) -> None:
+        """Drop a deleted session from the index; its Parquet rows become unreachable."""
+        if await self.has_entries():
+            await self.index.delete("WHERE session_id = ?", [session_id])
+
+    def delete_entries_with_cursor(
+        self, cursor: DuckDBPyConnection, session_ids: Sequence[str]
+    ) -> int:
+        """Drop index entries inside the caller's transaction; call ``invalidate`` after it.
+
+        The batch files stay: after a shard move, other shards' indexes may
+        still point into the same batch. ``remove_batches`` deletes them once
+        no index does.
+        """
+        placeholders = ",".join(["?"] * len(session_ids))
+        return cursor.execute(
+            f"DELETE FROM {self.index.table_name} WHERE session_id IN ({placeholders})",
+            list(session_ids),
+        ).fetchone()[0]
+
+    async def batch_ids(self) -> set[str]:
+        """Batches this index still has entries in."""
+        if not await self.has_entries():
+            return set()
+        rows = await self.executor.fetch_all(
+            f"SELECT DISTINCT batch_id FROM {self.index.table_name}"
+        )
+        return {row["batch_id"] for row in rows}
+
+    def remove_batches(self, keep: set[str], written_before: float) -> int:
+        """Delete the files of every batch not in ``keep``; return the batches removed.
+
+        Batches written after ``written_before`` (a Unix time) are kept, so a
+        batch whose index entries are not committed yet is never removed.
+        """
+        removed: set[str] = set()
+        for directory in self.archive_dir.glob("*/batch=*"):
+            batch_id = directory.name.removeprefix("batch=")
+            if batch_id in keep or directory.stat().st_mtime > written_before:
+                continue
+            shutil.rmtree(directory, ignore_errors=True)
+            removed.add(batch_id)
+        return len(removed)
+
+    async def image_paths(self, infographics_table: str) -> set[str]:
+        if not await self.has_entries():
+            return set()
+        if not list((self.archive_dir / _short_name(infographics_table)).glob("batch=*")):
+            return set()
+        rows = await self.executor.fetch_all(
+            "SELECT DISTINCT image_path FROM "
+            + _read_parquet([self.table_glob(infographics_table)])
+        )
+        return {row["image_path"] for row in rows}
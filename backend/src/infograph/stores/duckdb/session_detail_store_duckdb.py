@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any
+
+from duckdb import DuckDBPyConnection
+
+from infograph.core.schemas import SessionDetail
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+
+
+def _columns(cursor: DuckDBPyConnection) -> list[str]:
+    return [desc[0] for desc in cursor.description]
+
+
+class SessionDetailStoreDuckDB(AbstractSessionDetailStore):
+    """Aggregate read of a session and everything it owns.
+
+    The ownership check and the three child queries run back to back on one
+    executor cursor inside a single read transaction, so the page sees one
+    consistent snapshot for the price of one thread hop. Archived sessions
+    miss that query and are assembled from the stores' archive reads instead.
+    """
+
+    def __init__(
+        self,
+        session_store: SessionStoreDuckDB,
+        source_store: SourceStoreDuckDB,
+        message_store: AbstractMessageStore,
+        infographic_store: InfographicStoreDuckDB,
+    ) -> None:
+        self.sessions = session_store.store
+        self.archive = session_store.archive
+        self.source_store = source_store
+        self.infographic_store = infographic_store
+        self.sources = source_store.store
+        # The message store may buffer writes; its pending messages are merged in.
+        self.message_store = message_store
+        self.messages = message_store.store
+        self.infographics = infographic_store.store
+        self.executor = self.sessions.executor
+
+    async def get_for_user(self, session_id: str, user_id: str) -> SessionDetail | None:
+        session_sql = self.sessions.select_sql(["session_id", "user_id"])
+        sources_sql = self.sources.select_sql(["session_id"], ["fetched_at DESC"])
+        messages_sql = self.messages.select_sql(["session_id"], ["created_at ASC"])
+        infographic_sql = self.infographics.select_sql(["session_id"])
+
+        def _read(cursor: DuckDBPyConnection) -> SessionDetail | None:
+            row = cursor.execute(session_sql, [session_id, user_id]).fetchone()
+            if row is None:
+                return None
+            session = self.sessions._to_model(dict(zip(_columns(cursor), row)))
+            rows = cursor.execute(sources_sql, [session_id]).fetchall()
+            sources = self.sources._construct_all(_columns(cursor), rows)
+            rows = cursor.execute(messages_sql, [session_id]).fetchall()
+            messages = self.messages._construct_all(_columns(cursor), rows)
+            row = cursor.execute(infographic_sql, [session_id]).fetchone()
+            infographic_row: dict[str, Any] | None = (
+                dict(zip(_columns(cursor), row)) if row is not None else None
+            )
+            return SessionDetail.model_construct(
+                session=session,
+                sources=sources,
+                messages=messages,
+                infographic=self.infographics._to_model(infographic_row),
+            )
+
+        def _load(cursor: DuckDBPyConnection) -> SessionDetail | None:
+            cursor.begin()
+            try:
+                detail = _read(cursor)
+                cursor.commit()
+                return detail
+            except Exception:
+                cursor.rollback()
+                raise
+
+        # Taken before the read so messages flushed while it runs are not lost.
+        pending = self.message_store.pending_for_session(session_id)
+        detail = await self.executor.run(_load)
+        if detail is None:
+            return await self._get_archived(session_id, user_id)
+        if pending:
+            seen = {message.message_id for message in detail.messages}
+            detail.messages = sorted(
+                [*detail.messages, *(m for m in pending if m.message_id not in seen)],
+                key=lambda message: message.created_at,
+            )
+        return detail
+
+    async def _get_archived(self, session_id: str, user_id: str) -> SessionDetail | None:
+        if self.archive is None:
+            return None
+        sessions = await self.archive.read_for_session(self.sessions, session_id)
+        if not sessions or sessions[0].user_id != user_id:
+            return None
+        return SessionDetail.model_construct(
+            session=sessions[0],
+            sources=await self.source_store.list_for_session(session_id),
+            messages=list(await self.message_store.list_for_session(session_id)),
+            infographic=await self.infographic_store.get_for_session(session_id),
+        )
+
+
+__all__ = ["SessionDetailStoreDuckDB"]
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Sequence
 import uuid
 
+import duckdb
+from leettools.common.duckdb.duckdb_client import DuckDBClient
 from leettools.common.utils import time_utils
 from leettools.settings import SystemSettings
 
@@ -10,16 +12,29 @@ from infograph.core.schemas import (
     ResearchSession,
     ResearchSessionCreate,
     ResearchSessionUpdate,
+    SessionStatus,
 )
 from infograph.stores.abstract_session_store import AbstractSessionStore
 from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
 from infograph.stores.duckdb.utils import ensure_duckdb_settings
+from infograph.stores.pagination import SessionCursor
 
 
 class SessionStoreDuckDB(AbstractSessionStore):
-    def __init__(self, settings: SystemSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+        archive: SessionArchiveDuckDB | None = None,
+    ) -> None:
         self.settings = ensure_duckdb_settings(settings)
-        self.store = DuckDBStoreBase(ResearchSession, "research_sessions", self.settings)
+        self.archive = archive
+        self.store = DuckDBStoreBase(
+            ResearchSession, "research_sessions", self.settings, client=client, executor=executor
+        )
 
     async def create(self, create: ResearchSessionCreate, user_id: str) -> ResearchSession:
         now = time_utils.cur_timestamp_in_ms()
@@ -31,20 +46,30 @@ class SessionStoreDuckDB(AbstractSessionStore):
             created_at=now,
             updated_at=now,
         )
-        self.store.client.insert_into_table(
-            table_name=self.store.table_name,
-            column_list=self.store.insert_columns,
-            value_list=self.store._model_values(session),
-        )
+        await self.store.insert(session)
         return session
 
     async def get(self, session_id: str) -> ResearchSession | None:
-        row = self.store.client.fetch_one_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ?",
-            value_list=[session_id],
+        session = await self.store.find_one(["session_id"], [session_id])
+        if session is None and self.archive is not None:
+            archived = await self.archive.read_for_session(self.store, session_id)
+            return archived[0] if archived else None
+        return session
+
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        if not session_ids:
+            return []
+        placeholders = ",".join(["?"] * len(session_ids))
+        source = None
+        if self.archive is not None:
+            batches = await self.archive.batches_for_user(user_id)
+            if batches:
+                source = self.archive.union_source(self.store, batches)
+        return await self.store.fetch_all_trusted(
+            f"WHERE user_id = ? AND session_id IN ({placeholders})",
+            [user_id, *session_ids],
+            source=source,
         )
-        return self.store._to_model(row)
 
     async def list_for_user(
         self,
@@ -55,6 +80,7 @@ class SessionStoreDuckDB(AbstractSessionStore):
         search: str | None = None,
         start_timestamp: int | None = None,
         end_timestamp: int | None = None,
+        cursor: str | None = None,
     ) -> Iterable[ResearchSession]:
         clauses = ["WHERE user_id = ?"]
         values: list[object] = [user_id]
@@ -71,41 +97,59 @@ class SessionStoreDuckDB(AbstractSessionStore):
             clauses.append("AND created_at <= ?")
             values.append(end_timestamp)
 
-        where_clause = " ".join(clauses) + " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        values.extend([limit, offset])
+        if cursor is not None:
+            position = SessionCursor.decode(cursor)
+            clauses.append("AND (created_at < ? OR (created_at = ? AND session_id < ?))")
+            values.extend([position.created_at, position.created_at, position.session_id])
 
-        rows = self.store.client.fetch_all_from_table(
-            table_name=self.store.table_name,
-            where_clause=where_clause,
-            value_list=values,
-        )
-        return [self.store._to_model(row) for row in rows]
+        where_clause = " ".join(clauses) + " ORDER BY created_at DESC, session_id DESC LIMIT ?"
+        values.append(limit)
+        if cursor is None and offset:
+            where_clause += " OFFSET ?"
+            values.append(offset)
+
+        source = None
+        if self.archive is not None:
+            batches = await self.archive.batches_for_user(user_id)
+            if batches:
+                source = self.archive.union_source(self.store, batches)
+        return await self.store.fetch_all_trusted(where_clause, values, source=source)
 
     async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
-        existing = await self.get(session_id)
-        if existing is None:
-            raise ValueError(f"Session {session_id} not found")
         if update.status is None:
+            existing = await self.get(session_id)
+            if existing is None:
+                raise ValueError(f"Session {session_id} not found")
             return existing
-        updated_at = time_utils.cur_timestamp_in_ms()
-        self.store.client.update_table(
-            table_name=self.store.table_name,
-            column_list=["status", "updated_at"],
-            value_list=[update.status, updated_at, session_id],
-            where_clause="WHERE session_id = ?",
-        )
-        return ResearchSession(
-            session_id=existing.session_id,
-            user_id=existing.user_id,
-            prompt=existing.prompt,
-            status=update.status,
-            created_at=existing.created_at,
-            updated_at=updated_at,
+        updated = await self.store.update_returning(
+            ["status", "updated_at"],
+            [update.status, time_utils.cur_timestamp_in_ms(), session_id],
+            "WHERE session_id = ?",
         )
+        if updated is None:
+            raise ValueError(f"Session {session_id} not found")
+        return updated
+
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        if not from_statuses:
+            return None
+        placeholders = ",".join(["?"] * len(from_statuses))
+        try:
+            return await self.store.update_returning(
+                ["status", "updated_at"],
+                [to_status, time_utils.cur_timestamp_in_ms(), session_id, *from_statuses],
+                f"WHERE session_id = ? AND status IN ({placeholders})",
+            )
+        except duckdb.TransactionException:
+            # A concurrent transition updated the row first; this one lost the race.
+            return None
 
     async def delete(self, session_id: str) -> None:
-        self.store.client.delete_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ?",
-            value_list=[session_id],
-        )
+        await self.store.delete("WHERE session_id = ?", [session_id])
+        if self.archive is not None:
+            await self.archive.forget(session_id)
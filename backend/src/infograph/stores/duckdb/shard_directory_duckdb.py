@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from leettools.common.utils import time_utils
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import SessionShard, UserShard
+from infograph.stores.duckdb.base import INSERT_BATCH_ROWS, DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.utils import ensure_duckdb_settings
+from infograph.stores.ttl_cache import TTLCache
+
+
+def hash_shard(user_id: str, shard_count: int) -> int:
+    """Stable shard for ``user_id``; unlike ``hash`` it is the same in every process."""
+    digest = hashlib.blake2b(user_id.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+class ShardDirectoryDuckDB:
+    """Where each user's data lives and which user owns each session.
+
+    A user is pinned to ``hash_shard`` when their first session is created
+    and stays there until the rebalancer moves them, so changing the shard
+    count never strands existing data. Lookups go through optional caches;
+    placements only change while the service is stopped for a rebalance.
+    """
+
+    def __init__(
+        self,
+        shard_count: int,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+        user_cache: TTLCache[str, int] | None = None,
+        session_cache: TTLCache[str, str] | None = None,
+    ) -> None:
+        self.shard_count = shard_count
+        self.settings = ensure_duckdb_settings(settings)
+        self.users = DuckDBStoreBase(
+            UserShard, "user_shards", self.settings, client=client, executor=executor
+        )
+        self.sessions = DuckDBStoreBase(
+            SessionShard,
+            "session_directory",
+            self.settings,
+            client=self.users.client,
+            executor=self.users.executor,
+        )
+        self.user_cache = user_cache
+        self.session_cache = session_cache
+
+    def default_shard(self, user_id: str) -> int:
+        return hash_shard(user_id, self.shard_count)
+
+    async def placed_shard(self, user_id: str) -> int | None:
+        """The shard ``user_id`` is pinned to, or ``None`` if they own no sessions yet."""
+        if self.user_cache is not None:
+            shard = self.user_cache.get(user_id)
+            if shard is not None:
+                return shard
+        placement = await self.users.find_one(["user_id"], [user_id])
+        if placement is None:
+            return None
+        if self.user_cache is not None:
+            self.user_cache.set(user_id, placement.shard)
+        return placement.shard
+
+    async def shard_for_user(self, user_id: str) -> int:
+        shard = await self.placed_shard(user_id)
+        return self.default_shard(user_id) if shard is None else shard
+
+    async def place_user(self, user_id: str) -> int:
+        """Pin ``user_id`` to its default shard unless already placed; return the shard."""
+        shard = await self.placed_shard(user_id)
+        if shard is not None:
+            return shard
+        await self.users.executor.execute(
+            f"INSERT INTO {self.users.table_name} (user_id, shard, updated_at) "
+            "VALUES (?, ?, ?) ON CONFLICT (user_id) DO NOTHING",
+            [user_id, self.default_shard(user_id), time_utils.cur_timestamp_in_ms()],
+        )
+        # Re-read so a concurrent placement wins consistently.
+        return await self.shard_for_user(user_id)
+
+    async def move_user(self, user_id: str, shard: int) -> None:
+        await self.users.executor.execute(
+            f"INSERT INTO {self.users.table_name} (user_id, shard, updated_at) "
+            "VALUES (?, ?, ?) ON CONFLICT (user_id) DO UPDATE SET "
+            "shard = excluded.shard, updated_at = excluded.updated_at",
+            [user_id, shard, time_utils.cur_timestamp_in_ms()],
+        )
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user_id)
+
+    async def placements(self) -> list[UserShard]:
+        return await self.users.find_all(order_by=["user_id"], trusted=True)
+
+    async def add_session(self, session_id: str, user_id: str) -> None:
+        await self.sessions.insert(SessionShard(session_id=session_id, user_id=user_id))
+        if self.session_cache is not None:
+            self.session_cache.set(session_id, user_id)
+
+    async def add_sessions(self, session_ids: list[str], user_id: str) -> None:
+        """Record many sessions of one user; entries that already exist are kept."""
+        for start in range(0, len(session_ids), INSERT_BATCH_ROWS):
+            chunk = session_ids[start : start + INSERT_BATCH_ROWS]
+            await self.sessions.executor.execute(
+                f"INSERT INTO {self.sessions.table_name} (session_id, user_id) "
+                f"VALUES {','.join(['(?, ?)'] * len(chunk))} ON CONFLICT DO NOTHING",
+                [value for session_id in chunk for value in (session_id, user_id)],
+            )
+
+    async def user_for_session(self, session_id: str) -> str | None:
+        if self.session_cache is not None:
+            user_id = self.session_cache.get(session_id)
+            if user_id is not None:
+                return user_id
+        entry = await self.sessions.find_one(["session_id"], [session_id])
+        if entry is None:
+            return None
+        if self.session_cache is not None:
+            self.session_cache.set(session_id, entry.user_id)
+        return entry.user_id
+
+    async def shard_for_session(self, session_id: str) -> int | None:
+        user_id = await self.user_for_session(session_id)
+        return None if user_id is None else await self.shard_for_user(user_id)
+
+    async def remove_session(self, session_id: str) -> None:
+        await self.sessions.delete("WHERE session_id = ?", [session_id])
+        if self.session_cache is not None:
+            self.session_cache.invalidate(session_id)
+
+    async def remove_sessions(self, session_ids: list[str]) -> None:
+        """Forget many sessions, e.g. after the purge deleted them from their shard."""
+        for start in range(0, len(session_ids), INSERT_BATCH_ROWS):
+            chunk = session_ids[start : start + INSERT_BATCH_ROWS]
+            await self.sessions.delete(
+                f"WHERE session_id IN ({','.join(['?'] * len(chunk))})", chunk
+            )
+        if self.session_cache is not None:
+            for session_id in session_ids:
+                self.session_cache.invalidate(session_id)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from pathlib import Path
+from typing import AsyncIterator, Sequence
+
+from infograph.core.schemas import (
+    Infographic,
+    InfographicCreate,
+    Message,
+    MessageCreate,
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SearchDocument,
+    SearchHit,
+    SessionDetail,
+    SessionStatus,
+    Source,
+    SourceCreate,
+)
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_source_store import AbstractSourceStore
+from infograph.stores.duckdb.export_store_duckdb import EXPORT_CHUNK_ROWS, ExportFormat
+from infograph.stores.duckdb.shard_directory_duckdb import ShardDirectoryDuckDB
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+class _ShardRouter:
+    """Resolve users and sessions to the registry of the shard that owns them."""
+
+    def __init__(self, directory: ShardDirectoryDuckDB, shards: list[StoreRegistryDuckDB]) -> None:
+        self.directory = directory
+        self.shards = shards
+
+    async def _user_shard(self, user_id: str) -> StoreRegistryDuckDB:
+        return self.shards[await self.directory.shard_for_user(user_id)]
+
+    async def _session_shard(self, session_id: str) -> StoreRegistryDuckDB | None:
+        shard = await self.directory.shard_for_session(session_id)
+        return None if shard is None else self.shards[shard]
+
+    async def _require_session_shard(self, session_id: str) -> StoreRegistryDuckDB:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            raise ValueError(f"Unknown session: {session_id}")
+        return shard
+
+
+class ShardedSessionStore(_ShardRouter, AbstractSessionStore):
+    async def create(self, create: ResearchSessionCreate, user_id: str) -> ResearchSession:
+        shard = self.shards[await self.directory.place_user(user_id)]
+        session = await shard.session_store.create(create, user_id)
+        await self.directory.add_session(session.session_id, user_id)
+        return session
+
+    async def get(self, session_id: str) -> ResearchSession | None:
+        shard = await self._session_shard(session_id)
+        return None if shard is None else await shard.session_store.get(session_id)
+
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        # A user's sessions all live on the user's shard.
+        shard = await self._user_shard(user_id)
+        return await shard.session_store.get_many(user_id, session_ids)
+
+    async def list_for_user(
+        self,
+        user_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        search: str | None = None,
+        start_timestamp: int | None = None,
+        end_timestamp: int | None = None,
+        cursor: str | None = None,
+    ) -> list[ResearchSession]:
+        shard = await self._user_shard(user_id)
+        return list(
+            await shard.session_store.list_for_user(
+                user_id,
+                limit=limit,
+                offset=offset,
+                search=search,
+                start_timestamp=start_timestamp,
+                end_timestamp=end_timestamp,
+                cursor=cursor,
+            )
+        )
+
+    async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
+        shard = await self._require_session_shard(session_id)
+        return await shard.session_store.update(session_id, update)
+
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            return None
+        return await shard.session_store.transition(session_id, from_statuses, to_status)
+
+    async def delete(self, session_id: str) -> None:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            return
+        await shard.session_store.delete(session_id)
+        await self.directory.remove_session(session_id)
+
+
+class ShardedSourceStore(_ShardRouter, AbstractSourceStore):
+    async def create(self, create: SourceCreate) -> Source:
+        shard = await self._require_session_shard(create.session_id)
+        return await shard.source_store.create(create)
+
+    async def create_many(self, creates: Sequence[SourceCreate]) -> list[Source]:
+        by_session: dict[str, list[SourceCreate]] = defaultdict(list)
+        for create in creates:
+            by_session[create.session_id].append(create)
+        sources: list[Source] = []
+        for session_id, group in by_session.items():
+            shard = await self._require_session_shard(session_id)
+            sources.extend(await shard.source_store.create_many(group))
+        return sources
+
+    async def list_for_session(self, session_id: str) -> list[Source]:
+        shard = await self._session_shard(session_id)
+        return [] if shard is None else list(await shard.source_store.list_for_session(session_id))
+
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Source]]:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            return
+        async for chunk in shard.source_store.iter_for_session(session_id):
+            yield chunk
+
+    async def delete_for_session(self, session_id: str) -> None:
+        shard = await self._session_shard(session_id)
+        if shard is not None:
+            await shard.source_store.delete_for_session(session_id)
+
+
+class ShardedMessageStore(_ShardRouter, AbstractMessageStore):
+    async def create(self, create: MessageCreate) -> Message:
+        shard = await self._require_session_shard(create.session_id)
+        return await shard.message_store.create(create)
+
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        by_session: dict[str, list[MessageCreate]] = defaultdict(list)
+        for create in creates:
+            by_session[create.session_id].append(create)
+        messages: list[Message] = []
+        for session_id, group in by_session.items():
+            shard = await self._require_session_shard(session_id)
+            messages.extend(await shard.message_store.create_many(group))
+        return messages
+
+    async def list_for_session(self, session_id: str) -> list[Message]:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            return []
+        return list(await shard.message_store.list_for_session(session_id))
+
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Message]]:
+        shard = await self._session_shard(session_id)
+        if shard is None:
+            return
+        async for chunk in shard.message_store.iter_for_session(session_id):
+            yield chunk
+
+    async def delete_for_session(self, session_id: str) -> None:
+        shard = await self._session_shard(session_id)
+        if shard is not None:
+            await shard.message_store.delete_for_session(session_id)
+
+
+class ShardedInfographicStore(_ShardRouter, AbstractInfographicStore):
+    async def create(self, create: InfographicCreate) -> Infographic:
+        shard = await self._require_session_shard(create.session_id)
+        return await shard.infographic_store.create(create)
+
+    async def get_for_session(self, session_id: str) -> Infographic | None:
+        shard = await self._session_shard(session_id)
+        return None if shard is None else await shard.infographic_store.get_for_session(session_id)
+
+    async def list_recent(self, limit: int = 10) -> list[Infographic]:
+        # Each shard returns its newest ``limit``; the global newest are among them.
+        candidates = [
+            infographic
+            for shard in self.shards
+            for infographic in await shard.infographic_store.list_recent(limit)
+        ]
+        return heapq.nlargest(limit, candidates, key=lambda infographic: infographic.created_at)
+
+
+class ShardedSearchIndexStore(_ShardRouter, AbstractSearchIndexStore):
+    async def index_documents(self, documents: Sequence[SearchDocument]) -> None:
+        by_user: dict[str, list[SearchDocument]] = defaultdict(list)
+        for document in documents:
+            by_user[document.user_id].append(document)
+        for user_id, group in by_user.items():
+            shard = await self._user_shard(user_id)
+            await shard.search_index_store.index_documents(group)
+
+    async def delete_for_session(self, session_id: str) -> None:
+        shard = await self._session_shard(session_id)
+        if shard is not None:
+            await shard.search_index_store.delete_for_session(session_id)
+
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        shard = await self._user_shard(user_id)
+        return await shard.search_index_store.search(user_id, query, limit=limit)
+
+
+class ShardedSessionDetailStore(_ShardRouter, AbstractSessionDetailStore):
+    async def get_for_user(self, session_id: str, user_id: str) -> SessionDetail | None:
+        shard = await self._user_shard(user_id)
+        return await shard.session_detail_store.get_for_user(session_id, user_id)
+
+
+class ShardedExportStore(_ShardRouter):
+    """Export from the shard that holds the user's history."""
+
+    async def copy_to(self, user_id: str, directory: Path, fmt: ExportFormat) -> list[Path]:
+        shard = await self._user_shard(user_id)
+        return await shard.export_store.copy_to(user_id, directory, fmt)
+
+    async def iter_ndjson(
+        self, user_id: str, chunk_rows: int = EXPORT_CHUNK_ROWS
+    ) -> AsyncIterator[bytes]:
+        shard = await self._user_shard(user_id)
+        async for chunk in shard.export_store.iter_ndjson(user_id, chunk_rows):
+            yield chunk
@@ -1,52 +1,82 @@
 from __future__ import annotations
 
 import uuid
+from typing import AsyncIterator, Sequence
 
+from leettools.common.duckdb.duckdb_client import DuckDBClient
 from leettools.common.utils import time_utils
 from leettools.settings import SystemSettings
 
 from infograph.core.schemas import Source, SourceCreate
 from infograph.stores.abstract_source_store import AbstractSourceStore
 from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
 from infograph.stores.duckdb.utils import ensure_duckdb_settings
 
 
 class SourceStoreDuckDB(AbstractSourceStore):
     """DuckDB-backed storage for Source records."""
 
-    def __init__(self, settings: SystemSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+        archive: SessionArchiveDuckDB | None = None,
+    ) -> None:
         self.settings = ensure_duckdb_settings(settings)
-        self.store = DuckDBStoreBase(Source, "sources", self.settings)
+        self.archive = archive
+        self.store = DuckDBStoreBase(
+            Source, "sources", self.settings, client=client, executor=executor
+        )
 
     async def create(self, create: SourceCreate) -> Source:
+        source = self._build_source(create, time_utils.cur_timestamp_in_ms())
+        await self.store.insert(source)
+        return source
+
+    async def create_many(self, creates: Sequence[SourceCreate]) -> list[Source]:
         now = time_utils.cur_timestamp_in_ms()
-        source = Source(
+        sources = [self._build_source(create, now) for create in creates]
+        await self.store.insert_many(sources)
+        return sources
+
+    def _build_source(self, create: SourceCreate, fetched_at: int) -> Source:
+        return Source(
             source_id=str(uuid.uuid4()),
             session_id=create.session_id,
             title=create.title,
             url=create.url,
             snippet=create.snippet,
             confidence=create.confidence,
-            fetched_at=now,
-        )
-        self.store.client.insert_into_table(
-            table_name=self.store.table_name,
-            column_list=self.store.insert_columns,
-            value_list=self.store._model_values(source),
+            fetched_at=fetched_at,
         )
-        return source
 
     async def list_for_session(self, session_id: str) -> list[Source]:
-        rows = self.store.client.fetch_all_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ? ORDER BY fetched_at DESC",
-            value_list=[session_id],
+        sources = await self.store.find_all(
+            ["session_id"], [session_id], order_by=["fetched_at DESC"], trusted=True
         )
-        return [self.store._to_model(row) for row in rows if row]
+        archived = await self._archived(session_id)
+        if not archived:
+            return sources
+        return sorted([*sources, *archived], key=lambda source: source.fetched_at, reverse=True)
 
-    async def delete_for_session(self, session_id: str) -> None:
-        self.store.client.delete_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE session_id = ?",
-            value_list=[session_id],
+    async def iter_for_session(self, session_id: str) -> AsyncIterator[list[Source]]:
+        async for chunk in self.store.iter_all(
+            ["session_id"], [session_id], order_by=["fetched_at DESC"]
+        ):
+            yield chunk
+        # Archived sources are older than anything added since, so they come last.
+        if archived := await self._archived(session_id):
+            yield archived
+
+    async def _archived(self, session_id: str) -> list[Source]:
+        if self.archive is None:
+            return []
+        return await self.archive.read_for_session(
+            self.store, session_id, order_by=["fetched_at DESC"]
         )
+
+    async def delete_for_session(self, session_id: str) -> None:
+        await self.store.delete("WHERE session_id = ?", [session_id])
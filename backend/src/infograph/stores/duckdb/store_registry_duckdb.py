@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from leettools.settings import SystemSettings
+
+from infograph.core.schemas import ResearchSession, User
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.cached_stores import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_CACHE_TTL_SECONDS,
+    CachedSessionStore,
+    CachedUserStore,
+)
+from infograph.stores.duckdb.buffered_message_store_duckdb import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_FLUSH_INTERVAL_MS,
+    BufferedMessageStoreDuckDB,
+)
+from infograph.stores.duckdb.executor import (
+    DEFAULT_MAX_WORKERS,
+    DuckDBExecutor,
+    ExecutorStats,
+)
+from infograph.stores.duckdb.export_store_duckdb import ExportStoreDuckDB
+from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+from infograph.stores.duckdb.maintenance_store_duckdb import MaintenanceStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+from infograph.stores.duckdb.schema_manager import CORE_TABLES, SchemaManager
+from infograph.stores.duckdb.search_index_store_duckdb import SearchIndexStoreDuckDB
+from infograph.stores.duckdb.session_archive_duckdb import SessionArchiveDuckDB
+from infograph.stores.duckdb.session_detail_store_duckdb import SessionDetailStoreDuckDB
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+from infograph.stores.duckdb.utils import ensure_duckdb_settings
+from infograph.stores.ttl_cache import CacheStats, TTLCache
+
+S = TypeVar("S")
+
+
+class StoreRegistryDuckDB(AbstractStoreRegistry):
+    """Own one DuckDB client per database file and one instance of each store.
+
+    The registry is created once per application and handed to every router, so
+    adding routers never opens additional connections to the same file. Each
+    database's tables are created or migrated in one pass when its client is
+    first opened, so building stores afterwards runs no DDL.
+
+    ``user_store`` and ``session_store`` are wrapped in read-through caches
+    unless ``INFOGRAPH_CACHE_TTL_SECONDS`` is 0. Cascade purges go through the
+    uncached stores and evict the sessions they remove from the cache.
+
+    With ``INFOGRAPH_MESSAGE_WRITE_BEHIND=1`` the message store buffers
+    inserts and group-commits them; ``aclose`` flushes whatever is pending.
+    """
+
+    supports_export = True
+
+    def __init__(
+        self, settings: SystemSettings | None = None, db_name: str | None = None
+    ) -> None:
+        self.settings = ensure_duckdb_settings(settings)
+        self.db_name = db_name or self.settings.DB_CORE
+        self._clients: dict[tuple[str, str], DuckDBClient] = {}
+        self._executors: dict[tuple[str, str], DuckDBExecutor] = {}
+        self.max_workers = int(
+            os.environ.get("DUCKDB_EXECUTOR_WORKERS", DEFAULT_MAX_WORKERS)
+        )
+        self.cache_ttl_seconds = float(
+            os.environ.get("INFOGRAPH_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS)
+        )
+        self.cache_size = int(os.environ.get("INFOGRAPH_CACHE_SIZE", DEFAULT_CACHE_SIZE))
+        self._caches: dict[str, TTLCache] = {}
+        self.message_write_behind = os.environ.get(
+            "INFOGRAPH_MESSAGE_WRITE_BEHIND", ""
+        ).lower() in ("1", "true", "yes")
+        self._stores: dict[str, object] = {}
+        self._lock = threading.RLock()
+
+    def client(self, db_name: str | None = None) -> DuckDBClient:
+        """Return the shared client for ``db_name`` (defaults to the registry's database)."""
+        db_name = db_name or self.db_name
+        key = (str(self.settings.DUCKDB_PATH), db_name)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = DuckDBClient(self.settings, db_name=db_name)
+                SchemaManager.for_client(client, self.settings).bootstrap(CORE_TABLES)
+                self._clients[key] = client
+            return client
+
+    def schemas(self, db_name: str | None = None) -> SchemaManager:
+        """Schema manager of ``db_name``; its core tables are already bootstrapped."""
+        return SchemaManager.for_client(self.client(db_name), self.settings)
+
+    def executor(self, db_name: str | None = None) -> DuckDBExecutor:
+        """Return the shared executor that runs queries against ``db_name``."""
+        db_name = db_name or self.db_name
+        key = (str(self.settings.DUCKDB_PATH), db_name)
+        with self._lock:
+            executor = self._executors.get(key)
+            if executor is None:
+                executor = DuckDBExecutor(self.client(db_name), self.max_workers)
+                self._executors[key] = executor
+            return executor
+
+    def _get_or_create(self, name: str, factory: Callable[[], S]) -> S:
+        with self._lock:
+            store = self._stores.get(name)
+            if store is None:
+                store = factory()
+                self._stores[name] = store
+            return store  # type: ignore[return-value]
+
+    def _cache(self, name: str) -> TTLCache | None:
+        if self.cache_ttl_seconds <= 0:
+            return None
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = TTLCache(self.cache_size, self.cache_ttl_seconds)
+                self._caches[name] = cache
+            return cache
+
+    @property
+    def user_store(self) -> AbstractUserStore:
+        def factory() -> AbstractUserStore:
+            cache: TTLCache[str, User] | None = self._cache("users")
+            if cache is None:
+                return self._user_store_duckdb
+            return CachedUserStore(self._user_store_duckdb, cache)
+
+        return self._get_or_create("user_store", factory)
+
+    @property
+    def session_store(self) -> AbstractSessionStore:
+        def factory() -> AbstractSessionStore:
+            cache: TTLCache[str, ResearchSession] | None = self._cache("sessions")
+            if cache is None:
+                return self._session_store_duckdb
+            return CachedSessionStore(self._session_store_duckdb, cache)
+
+        return self._get_or_create("session_store", factory)
+
+    @property
+    def _user_store_duckdb(self) -> UserStoreDuckDB:
+        return self._get_or_create(
+            "user_store_duckdb",
+            lambda: UserStoreDuckDB(self.settings, self.client(), self.executor()),
+        )
+
+    @property
+    def _session_store_duckdb(self) -> SessionStoreDuckDB:
+        return self._get_or_create(
+            "session_store_duckdb",
+            lambda: SessionStoreDuckDB(
+                self.settings, self.client(), self.executor(), archive=self.archive
+            ),
+        )
+
+    @property
+    def source_store(self) -> SourceStoreDuckDB:
+        return self._get_or_create(
+            "source_store",
+            lambda: SourceStoreDuckDB(
+                self.settings, self.client(), self.executor(), archive=self.archive
+            ),
+        )
+
+    @property
+    def message_store(self) -> AbstractMessageStore:
+        def factory() -> AbstractMessageStore:
+            if not self.message_write_behind:
+                return self._message_store_duckdb
+            return BufferedMessageStoreDuckDB(
+                self._message_store_duckdb,
+                batch_size=int(
+                    os.environ.get("INFOGRAPH_MESSAGE_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+                ),
+                flush_interval_ms=int(
+                    os.environ.get("INFOGRAPH_MESSAGE_FLUSH_MS", DEFAULT_FLUSH_INTERVAL_MS)
+                ),
+            )
+
+        return self._get_or_create("message_store", factory)
+
+    @property
+    def _message_store_duckdb(self) -> MessageStoreDuckDB:
+        return self._get_or_create(
+            "message_store_duckdb",
+            lambda: MessageStoreDuckDB(
+                self.settings, self.client(), self.executor(), archive=self.archive
+            ),
+        )
+
+    @property
+    def infographic_store(self) -> InfographicStoreDuckDB:
+        return self._get_or_create(
+            "infographic_store",
+            lambda: InfographicStoreDuckDB(
+                self.settings, self.client(), self.executor(), archive=self.archive
+            ),
+        )
+
+    @property
+    def search_index_store(self) -> SearchIndexStoreDuckDB:
+        return self._get_or_create(
+            "search_index_store",
+            lambda: SearchIndexStoreDuckDB(
+                self.settings, self.client(), self.executor()
+            ),
+        )
+
+    @property
+    def session_detail_store(self) -> SessionDetailStoreDuckDB:
+        return self._get_or_create(
+            "session_detail_store",
+            lambda: SessionDetailStoreDuckDB(
+                self._session_store_duckdb,
+                self.source_store,
+                self.message_store,
+                self.infographic_store,
+            ),
+        )
+
+    @property
+    def export_store(self) -> ExportStoreDuckDB:
+        return self._get_or_create(
+            "export_store",
+            lambda: ExportStoreDuckDB(
+                self._session_store_duckdb,
+                self.source_store,
+                self._message_store_duckdb,
+                self.infographic_store,
+            ),
+        )
+
+    @property
+    def archive(self) -> SessionArchiveDuckDB:
+        """Parquet tier for old sessions, shared by every store of this database.
+
+        Batches live under ``<DUCKDB_PATH>/archive`` for all databases, so a
+        user's index entries can move between shards without copying files.
+        """
+        return self._get_or_create(
+            "archive",
+            lambda: SessionArchiveDuckDB(
+                Path(self.settings.DUCKDB_PATH) / "archive",
+                self.settings,
+                self.client(),
+                self.executor(),
+            ),
+        )
+
+    @property
+    def maintenance_store(self) -> MaintenanceStoreDuckDB:
+        return self._get_or_create(
+            "maintenance_store",
+            lambda: MaintenanceStoreDuckDB(
+                self._session_store_duckdb,
+                self.source_store,
+                self._message_store_duckdb,
+                self.infographic_store,
+                self.search_index_store,
+                archive=self.archive,
+                session_cache=self._cache("sessions"),
+            ),
+        )
+
+    @property
+    def shards(self) -> list[StoreRegistryDuckDB]:
+        """Registries that hold session data; just this one when unsharded."""
+        return [self]
+
+    @property
+    def client_count(self) -> int:
+        """Number of open DuckDB clients, independent of the number of routers."""
+        return len(self._clients)
+
+    def executor_stats(self) -> dict[str, ExecutorStats]:
+        """Queue depth and wait-time stats for every executor, keyed by db name."""
+        with self._lock:
+            return {db_name: ex.stats() for (_, db_name), ex in self._executors.items()}
+
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """Hit/miss counters for every read-through cache, keyed by cache name."""
+        with self._lock:
+            return {name: cache.stats() for name, cache in self._caches.items()}
+
+    async def flush(self) -> None:
+        """Write out buffered messages, if write-behind is enabled."""
+        message_store = self._stores.get("message_store")
+        if isinstance(message_store, BufferedMessageStoreDuckDB):
+            await message_store.flush()
+
+    def close(self) -> None:
+        """Shut down executor threads; called when the app stops."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for executor in executors:
+            executor.shutdown()
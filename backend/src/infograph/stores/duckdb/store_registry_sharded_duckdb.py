@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import os
+from functools import cached_property
+from typing import Any
+
+from leettools.settings import SystemSettings
+
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.duckdb.schema_manager import SHARD_DIRECTORY_TABLES
+from infograph.stores.duckdb.shard_directory_duckdb import ShardDirectoryDuckDB
+from infograph.stores.duckdb.sharded_stores_duckdb import (
+    ShardedExportStore,
+    ShardedInfographicStore,
+    ShardedMessageStore,
+    ShardedSearchIndexStore,
+    ShardedSessionDetailStore,
+    ShardedSessionStore,
+    ShardedSourceStore,
+)
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+from infograph.stores.duckdb.utils import ensure_duckdb_settings
+
+
+def shard_count_from_env() -> int:
+    """Number of DuckDB shards from ``INFOGRAPH_DUCKDB_SHARDS``; 1 means unsharded."""
+    count = int(os.environ.get("INFOGRAPH_DUCKDB_SHARDS", 1))
+    if count < 1:
+        raise ValueError("INFOGRAPH_DUCKDB_SHARDS must be at least 1")
+    return count
+
+
+class StoreRegistryShardedDuckDB(AbstractStoreRegistry):
+    """Spread users over ``shard_count`` DuckDB files, each with its own writer.
+
+    Users and the shard directory stay in ``DB_CORE``; everything a user owns
+    lives in ``<DB_CORE>_shard<N>``. Store calls are routed by ``user_id``,
+    or through the directory for calls keyed by ``session_id``. Each shard
+    has its own executor, caches and write-behind buffer, so write contention
+    and file size grow with the users of one shard, not all of them.
+    """
+
+    supports_export = True
+
+    def __init__(self, settings: SystemSettings | None = None, shard_count: int = 2) -> None:
+        self.settings = ensure_duckdb_settings(settings)
+        self.home = StoreRegistryDuckDB(self.settings)
+        self._shards = [
+            StoreRegistryDuckDB(self.settings, db_name=f"{self.settings.DB_CORE}_shard{index}")
+            for index in range(shard_count)
+        ]
+
+    @cached_property
+    def directory(self) -> ShardDirectoryDuckDB:
+        # Built on first use, like the stores below, so creating an app opens no file.
+        self.home.schemas().bootstrap(SHARD_DIRECTORY_TABLES)
+        return ShardDirectoryDuckDB(
+            len(self._shards),
+            self.settings,
+            self.home.client(),
+            self.home.executor(),
+            user_cache=self.home._cache("user_shards"),
+            session_cache=self.home._cache("session_directory"),
+        )
+
+    @property
+    def shards(self) -> list[StoreRegistryDuckDB]:
+        return self._shards
+
+    @property
+    def user_store(self) -> AbstractUserStore:
+        return self.home.user_store
+
+    @cached_property
+    def session_store(self) -> ShardedSessionStore:
+        return ShardedSessionStore(self.directory, self._shards)
+
+    @cached_property
+    def source_store(self) -> ShardedSourceStore:
+        return ShardedSourceStore(self.directory, self._shards)
+
+    @cached_property
+    def message_store(self) -> ShardedMessageStore:
+        return ShardedMessageStore(self.directory, self._shards)
+
+    @cached_property
+    def infographic_store(self) -> ShardedInfographicStore:
+        return ShardedInfographicStore(self.directory, self._shards)
+
+    @cached_property
+    def search_index_store(self) -> ShardedSearchIndexStore:
+        return ShardedSearchIndexStore(self.directory, self._shards)
+
+    @cached_property
+    def session_detail_store(self) -> ShardedSessionDetailStore:
+        return ShardedSessionDetailStore(self.directory, self._shards)
+
+    @cached_property
+    def export_store(self) -> ShardedExportStore:  # type: ignore[override]
+        return ShardedExportStore(self.directory, self._shards)
+
+    def executor_stats(self) -> dict[str, Any]:
+        stats = self.home.executor_stats()
+        for shard in self._shards:
+            stats.update(shard.executor_stats())
+        return stats
+
+    def cache_stats(self) -> dict[str, Any]:
+        stats = self.home.cache_stats()
+        for shard in self._shards:
+            stats.update(
+                {f"{shard.db_name}.{name}": value for name, value in shard.cache_stats().items()}
+            )
+        return stats
+
+    async def flush(self) -> None:
+        for shard in self._shards:
+            await shard.flush()
+
+    def close(self) -> None:
+        for shard in self._shards:
+            shard.close()
+        self.home.close()
@@ -2,77 +2,87 @@ from __future__ import annotations
 
 import uuid
 
+import duckdb
+from leettools.common.duckdb.duckdb_client import DuckDBClient
 from leettools.common.utils import time_utils
 from leettools.settings import SystemSettings
 
 from infograph.core.schemas import User, UserCreate
 from infograph.stores.abstract_user_store import AbstractUserStore
 from infograph.stores.duckdb.base import DuckDBStoreBase
+from infograph.stores.duckdb.executor import DuckDBExecutor
 from infograph.stores.duckdb.utils import ensure_duckdb_settings
 
 
 class UserStoreDuckDB(AbstractUserStore):
-    def __init__(self, settings: SystemSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: SystemSettings | None = None,
+        client: DuckDBClient | None = None,
+        executor: DuckDBExecutor | None = None,
+    ) -> None:
         self.settings = ensure_duckdb_settings(settings)
-        self.store = DuckDBStoreBase(User, "users", self.settings)
+        self.store = DuckDBStoreBase(
+            User, "users", self.settings, client=client, executor=executor
+        )
 
-    async def create(self, create: UserCreate) -> User:
+    @staticmethod
+    def _new_user(create: UserCreate) -> User:
         now = time_utils.cur_timestamp_in_ms()
-        user = User(
+        return User(
             user_id=str(uuid.uuid4()),
             email=create.email,
             name=create.name,
             google_id=create.google_id,
             created_at=now,
             updated_at=now,
+            profile_version=0,
         )
-        self.store.client.insert_into_table(
-            table_name=self.store.table_name,
-            column_list=self.store.insert_columns,
-            value_list=self.store._model_values(user),
-        )
+
+    async def create(self, create: UserCreate) -> User:
+        user = self._new_user(create)
+        await self.store.insert(user)
         return user
 
     async def get_by_google_id(self, google_id: str) -> User | None:
-        row = self.store.client.fetch_one_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE google_id = ?",
-            value_list=[google_id],
-        )
-        return self.store._to_model(row)
+        return await self.store.find_one(["google_id"], [google_id])
+
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        # The unique index on google_id turns a racing second insert into a no-op.
+        try:
+            inserted = await self.store.insert_if_absent(self._new_user(create))
+        except duckdb.TransactionException:
+            inserted = None
+        if inserted is not None:
+            return inserted
+        user = await self.get_by_google_id(create.google_id)
+        if user is None:
+            raise RuntimeError(f"User for google_id {create.google_id} was not stored")
+        return user
 
     async def get(self, user_id: str) -> User | None:
-        row = self.store.client.fetch_one_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE user_id = ?",
-            value_list=[user_id],
-        )
-        return self.store._to_model(row)
+        return await self.store.find_one(["user_id"], [user_id])
 
     async def list(self) -> list[User]:
-        rows = self.store.client.fetch_all_from_table(
-            table_name=self.store.table_name,
-            where_clause="ORDER BY created_at DESC",
-        )
-        return [self.store._to_model(row) for row in rows if row]
+        return await self.store.find_all(order_by=["created_at DESC"])
 
     async def update(self, user: User) -> User:
         updated_user = user.model_copy(update={"updated_at": time_utils.cur_timestamp_in_ms()})
         column_map = self.store._column_value_map(updated_user)
-        column_names = [name for name in column_map.keys() if name != "user_id"]
+        column_names = [
+            name for name in column_map.keys() if name not in ("user_id", "profile_version")
+        ]
         value_list = [column_map[name] for name in column_names]
         value_list.append(updated_user.user_id)
-        self.store.client.update_table(
-            table_name=self.store.table_name,
-            column_list=column_names,
-            value_list=value_list,
-            where_clause="WHERE user_id = ?",
+        # Incremented in SQL so concurrent updates never hand out the same version.
+        set_clause = ", ".join(f"{name} = ?" for name in column_names)
+        row = await self.store.executor.fetch_one(
+            f"UPDATE {self.store.table_name} SET {set_clause}, "
+            "profile_version = COALESCE(profile_version, 0) + 1 "
+            "WHERE user_id = ? RETURNING *",
+            value_list,
         )
-        return updated_user
+        return self.store._to_model(row) or updated_user
 
     async def delete(self, user_id: str) -> None:
-        self.store.client.delete_from_table(
-            table_name=self.store.table_name,
-            where_clause="WHERE user_id = ?",
-            value_list=[user_id],
-        )
+        await self.store.delete("WHERE user_id = ?", [user_id])
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any, cast
+
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+
+
+class LazyStore:
+    """Stand-in for a registry store that is only built on first use.
+
+    Routers and services hold the proxy; the first attribute access asks
+    the registry for the real store and every later one is forwarded to it,
+    so creating an app opens no database and requests that never touch a
+    store, such as health checks, never build one.
+    """
+
+    def __init__(self, stores: AbstractStoreRegistry, name: str) -> None:
+        self._stores = stores
+        self._name = name
+        self._store: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        store = self._store
+        if store is None:
+            store = self._store = getattr(self._stores, self._name)
+        return getattr(store, name)
+
+
+def lazy_store(stores: AbstractStoreRegistry, name: str) -> Any:
+    """``stores.<name>`` deferred until used, typed as the store it stands in for."""
+    return cast(Any, LazyStore(stores, name))
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import heapq
+import uuid
+
+from leettools.common.utils import time_utils
+
+from infograph.core.schemas import Infographic, InfographicCreate
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+
+
+class InfographicStoreMemory(AbstractInfographicStore):
+    """In-memory infographic store keyed by session."""
+
+    def __init__(self) -> None:
+        self._by_session: dict[str, list[Infographic]] = {}
+
+    async def create(self, create: InfographicCreate) -> Infographic:
+        infographic = Infographic(
+            infographic_id=str(uuid.uuid4()),
+            session_id=create.session_id,
+            image_path=create.image_path,
+            template_type=create.template_type,
+            layout_data=create.layout_data,
+            created_at=time_utils.cur_timestamp_in_ms(),
+        )
+        self._by_session.setdefault(create.session_id, []).append(infographic)
+        return infographic
+
+    async def get_for_session(self, session_id: str) -> Infographic | None:
+        infographics = self._by_session.get(session_id)
+        return infographics[0] if infographics else None
+
+    async def list_recent(self, limit: int = 10) -> list[Infographic]:
+        return heapq.nlargest(
+            limit,
+            (item for items in self._by_session.values() for item in items),
+            key=lambda infographic: infographic.created_at,
+        )
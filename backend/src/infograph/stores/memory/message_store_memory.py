@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import uuid
+from typing import Sequence
+
+from leettools.common.utils import time_utils
+
+from infograph.core.schemas import Message, MessageCreate
+from infograph.stores.abstract_message_store import AbstractMessageStore
+
+
+class MessageStoreMemory(AbstractMessageStore):
+    """In-memory message store keyed by session, oldest first."""
+
+    def __init__(self) -> None:
+        self._by_session: dict[str, list[Message]] = {}
+
+    async def create(self, create: MessageCreate) -> Message:
+        return (await self.create_many([create]))[0]
+
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        created_at = time_utils.cur_timestamp_in_ms()
+        messages = [
+            Message(
+                message_id=str(uuid.uuid4()),
+                session_id=create.session_id,
+                role=create.role,
+                content=create.content,
+                created_at=created_at,
+            )
+            for create in creates
+        ]
+        for message in messages:
+            self._by_session.setdefault(message.session_id, []).append(message)
+        return messages
+
+    async def list_for_session(self, session_id: str) -> list[Message]:
+        return list(self._by_session.get(session_id, []))
+
+    async def delete_for_session(self, session_id: str) -> None:
+        self._by_session.pop(session_id, None)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Sequence
+
+from infograph.core.schemas import SearchDocument, SearchHit
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.search_utils import (
+    bm25_idf,
+    bm25_term_score,
+    term_frequencies,
+    tokenize,
+)
+
+
+@dataclass
+class _IndexedDocument:
+    user_id: str
+    session_id: str
+    length: int
+    term_freqs: dict[str, int]
+
+
+class SearchIndexStoreMemory(AbstractSearchIndexStore):
+    """In-memory inverted index scored with the same BM25 as the DuckDB index."""
+
+    def __init__(self) -> None:
+        self._documents: dict[str, _IndexedDocument] = {}
+        # user_id -> term -> doc_ids containing the term
+        self._postings: dict[str, dict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._session_docs: dict[str, set[str]] = defaultdict(set)
+        self._user_totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+
+    async def index_documents(self, documents: Sequence[SearchDocument]) -> None:
+        for document in documents:
+            frequencies, length = term_frequencies(document.text)
+            if not frequencies:
+                continue
+            self._remove(document.doc_id)
+            self._documents[document.doc_id] = _IndexedDocument(
+                user_id=document.user_id,
+                session_id=document.session_id,
+                length=length,
+                term_freqs=dict(frequencies),
+            )
+            postings = self._postings[document.user_id]
+            for term in frequencies:
+                postings[term].add(document.doc_id)
+            self._session_docs[document.session_id].add(document.doc_id)
+            totals = self._user_totals[document.user_id]
+            totals[0] += 1
+            totals[1] += length
+
+    async def delete_for_session(self, session_id: str) -> None:
+        for doc_id in self._session_docs.pop(session_id, set()):
+            self._remove(doc_id)
+
+    def _remove(self, doc_id: str) -> None:
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        postings = self._postings[document.user_id]
+        for term in document.term_freqs:
+            postings[term].discard(doc_id)
+            if not postings[term]:
+                del postings[term]
+        self._session_docs[document.session_id].discard(doc_id)
+        totals = self._user_totals[document.user_id]
+        totals[0] -= 1
+        totals[1] -= document.length
+
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        doc_count, total_length = self._user_totals.get(user_id, (0, 0))
+        terms = set(tokenize(query))
+        if not terms or doc_count <= 0:
+            return []
+        avg_length = total_length / doc_count
+        postings = self._postings.get(user_id, {})
+
+        scores: dict[str, float] = defaultdict(float)
+        for term in terms:
+            doc_ids = postings.get(term)
+            if not doc_ids:
+                continue
+            idf = bm25_idf(doc_count, len(doc_ids))
+            for doc_id in doc_ids:
+                document = self._documents[doc_id]
+                scores[document.session_id] += idf * bm25_term_score(
+                    document.term_freqs[term], document.length, avg_length
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [SearchHit(session_id=session_id, score=score) for session_id, score in ranked]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from infograph.core.schemas import SessionDetail
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_source_store import AbstractSourceStore
+
+
+class SessionDetailStoreMemory(AbstractSessionDetailStore):
+    """Aggregate session read composed from the in-memory stores."""
+
+    def __init__(
+        self,
+        session_store: AbstractSessionStore,
+        source_store: AbstractSourceStore,
+        message_store: AbstractMessageStore,
+        infographic_store: AbstractInfographicStore,
+    ) -> None:
+        self.session_store = session_store
+        self.source_store = source_store
+        self.message_store = message_store
+        self.infographic_store = infographic_store
+
+    async def get_for_user(self, session_id: str, user_id: str) -> SessionDetail | None:
+        session = await self.session_store.get(session_id)
+        if session is None or session.user_id != user_id:
+            return None
+        return SessionDetail(
+            session=session,
+            sources=list(await self.source_store.list_for_session(session_id)),
+            messages=list(await self.message_store.list_for_session(session_id)),
+            infographic=await self.infographic_store.get_for_session(session_id),
+        )
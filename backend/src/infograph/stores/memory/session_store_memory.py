@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from operator import itemgetter
+from typing import Iterable, Sequence
+
+from leettools.common.utils import time_utils
+
+from infograph.core.schemas import (
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SessionStatus,
+)
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.pagination import SessionCursor
+
+_created_at = itemgetter(0)
+
+
+class SessionStoreMemory(AbstractSessionStore):
+    """In-memory session store.
+
+    Each user's sessions are kept in a list sorted by ``(created_at,
+    session_id)``, so listing walks it backwards exactly like the DuckDB
+    ``ORDER BY created_at DESC, session_id DESC`` and cursors and time
+    filters are binary searches.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, ResearchSession] = {}
+        self._by_user: dict[str, list[tuple[int, str]]] = {}
+
+    async def create(self, create: ResearchSessionCreate, user_id: str) -> ResearchSession:
+        now = time_utils.cur_timestamp_in_ms()
+        session = ResearchSession(
+            session_id=str(uuid.uuid4()),
+            user_id=user_id,
+            prompt=create.prompt,
+            status="pending",
+            created_at=now,
+            updated_at=now,
+        )
+        self._sessions[session.session_id] = session
+        insort(self._by_user.setdefault(user_id, []), (now, session.session_id))
+        return session
+
+    async def get(self, session_id: str) -> ResearchSession | None:
+        return self._sessions.get(session_id)
+
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        sessions = (self._sessions.get(session_id) for session_id in session_ids)
+        return [session for session in sessions if session and session.user_id == user_id]
+
+    async def list_for_user(
+        self,
+        user_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        search: str | None = None,
+        start_timestamp: int | None = None,
+        end_timestamp: int | None = None,
+        cursor: str | None = None,
+    ) -> Iterable[ResearchSession]:
+        keys = self._by_user.get(user_id, [])
+        lo, hi = 0, len(keys)
+        if start_timestamp is not None:
+            lo = bisect_left(keys, start_timestamp, key=_created_at)
+        if end_timestamp is not None:
+            hi = bisect_right(keys, end_timestamp, key=_created_at)
+        if cursor is not None:
+            position = SessionCursor.decode(cursor)
+            hi = min(hi, bisect_left(keys, (position.created_at, position.session_id)))
+            offset = 0
+        needle = search.lower() if search else None
+
+        sessions: list[ResearchSession] = []
+        for idx in range(hi - 1, lo - 1, -1):
+            if len(sessions) >= limit:
+                break
+            session = self._sessions[keys[idx][1]]
+            if needle is not None and needle not in session.prompt.lower():
+                continue
+            if offset:
+                offset -= 1
+                continue
+            sessions.append(session)
+        return sessions
+
+    async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
+        existing = self._sessions.get(session_id)
+        if existing is None:
+            raise ValueError(f"Session {session_id} not found")
+        if update.status is None:
+            return existing
+        return self._set_status(existing, update.status)
+
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        existing = self._sessions.get(session_id)
+        if existing is None or existing.status not in from_statuses:
+            return None
+        return self._set_status(existing, to_status)
+
+    def _set_status(self, session: ResearchSession, status: SessionStatus) -> ResearchSession:
+        updated = session.model_copy(
+            update={"status": status, "updated_at": time_utils.cur_timestamp_in_ms()}
+        )
+        self._sessions[session.session_id] = updated
+        return updated
+
+    async def delete(self, session_id: str) -> None:
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        keys = self._by_user[session.user_id]
+        key = (session.created_at, session.session_id)
+        idx = bisect_left(keys, key)
+        if idx < len(keys) and keys[idx] == key:
+            del keys[idx]
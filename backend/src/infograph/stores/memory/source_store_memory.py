@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import uuid
+from typing import Sequence
+
+from leettools.common.utils import time_utils
+
+from infograph.core.schemas import Source, SourceCreate
+from infograph.stores.abstract_source_store import AbstractSourceStore
+
+
+class SourceStoreMemory(AbstractSourceStore):
+    """In-memory source store keyed by session."""
+
+    def __init__(self) -> None:
+        self._by_session: dict[str, list[Source]] = {}
+
+    async def create(self, create: SourceCreate) -> Source:
+        return (await self.create_many([create]))[0]
+
+    async def create_many(self, creates: Sequence[SourceCreate]) -> list[Source]:
+        fetched_at = time_utils.cur_timestamp_in_ms()
+        sources = [
+            Source(
+                source_id=str(uuid.uuid4()),
+                session_id=create.session_id,
+                title=create.title,
+                url=create.url,
+                snippet=create.snippet,
+                confidence=create.confidence,
+                fetched_at=fetched_at,
+            )
+            for create in creates
+        ]
+        for source in sources:
+            self._by_session.setdefault(source.session_id, []).append(source)
+        return sources
+
+    async def list_for_session(self, session_id: str) -> list[Source]:
+        # Appended in fetch order, so newest first is the reversed list.
+        return list(reversed(self._by_session.get(session_id, [])))
+
+    async def delete_for_session(self, session_id: str) -> None:
+        self._by_session.pop(session_id, None)
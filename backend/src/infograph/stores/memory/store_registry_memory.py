@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.memory.infographic_store_memory import InfographicStoreMemory
+from infograph.stores.memory.message_store_memory import MessageStoreMemory
+from infograph.stores.memory.search_index_store_memory import SearchIndexStoreMemory
+from infograph.stores.memory.session_detail_store_memory import SessionDetailStoreMemory
+from infograph.stores.memory.session_store_memory import SessionStoreMemory
+from infograph.stores.memory.source_store_memory import SourceStoreMemory
+from infograph.stores.memory.user_store_memory import UserStoreMemory
+
+
+class StoreRegistryMemory(AbstractStoreRegistry):
+    """Process-local stores with no persistence.
+
+    Meant for ephemeral demo nodes and for profiling the API layer without
+    storage cost; everything is lost when the process exits.
+    """
+
+    def __init__(self) -> None:
+        self._user_store = UserStoreMemory()
+        self._session_store = SessionStoreMemory()
+        self._source_store = SourceStoreMemory()
+        self._message_store = MessageStoreMemory()
+        self._infographic_store = InfographicStoreMemory()
+        self._search_index_store = SearchIndexStoreMemory()
+        self._session_detail_store = SessionDetailStoreMemory(
+            self._session_store,
+            self._source_store,
+            self._message_store,
+            self._infographic_store,
+        )
+
+    @property
+    def user_store(self) -> UserStoreMemory:
+        return self._user_store
+
+    @property
+    def session_store(self) -> SessionStoreMemory:
+        return self._session_store
+
+    @property
+    def source_store(self) -> SourceStoreMemory:
+        return self._source_store
+
+    @property
+    def message_store(self) -> MessageStoreMemory:
+        return self._message_store
+
+    @property
+    def infographic_store(self) -> InfographicStoreMemory:
+        return self._infographic_store
+
+    @property
+    def search_index_store(self) -> SearchIndexStoreMemory:
+        return self._search_index_store
+
+    @property
+    def session_detail_store(self) -> SessionDetailStoreMemory:
+        return self._session_detail_store
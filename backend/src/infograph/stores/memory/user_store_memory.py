@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import uuid
+
+from leettools.common.utils import time_utils
+
+from infograph.core.schemas import User, UserCreate
+from infograph.stores.abstract_user_store import AbstractUserStore
+
+
+class UserStoreMemory(AbstractUserStore):
+    """In-memory user store indexed by ``user_id`` and ``google_id``."""
+
+    def __init__(self) -> None:
+        self._users: dict[str, User] = {}
+        self._by_google_id: dict[str, str] = {}
+
+    async def create(self, create: UserCreate) -> User:
+        now = time_utils.cur_timestamp_in_ms()
+        user = User(
+            user_id=str(uuid.uuid4()),
+            email=create.email,
+            name=create.name,
+            google_id=create.google_id,
+            created_at=now,
+            updated_at=now,
+            profile_version=0,
+        )
+        self._users[user.user_id] = user
+        self._by_google_id.setdefault(user.google_id, user.user_id)
+        return user
+
+    async def get_by_google_id(self, google_id: str) -> User | None:
+        user_id = self._by_google_id.get(google_id)
+        return self._users.get(user_id) if user_id is not None else None
+
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        # No await between the lookup and the insert, so this is atomic.
+        user = await self.get_by_google_id(create.google_id)
+        return user if user is not None else await self.create(create)
+
+    async def get(self, user_id: str) -> User | None:
+        return self._users.get(user_id)
+
+    async def list(self) -> list[User]:
+        return sorted(self._users.values(), key=lambda user: user.created_at, reverse=True)
+
+    async def update(self, user: User) -> User:
+        previous = self._users.get(user.user_id)
+        if previous is None:
+            return user.model_copy(update={"updated_at": time_utils.cur_timestamp_in_ms()})
+        updated_user = user.model_copy(
+            update={
+                "updated_at": time_utils.cur_timestamp_in_ms(),
+                "profile_version": (previous.profile_version or 0) + 1,
+            }
+        )
+        if previous.google_id != updated_user.google_id:
+            self._by_google_id.pop(previous.google_id, None)
+            self._by_google_id[updated_user.google_id] = updated_user.user_id
+        self._users[user.user_id] = updated_user
+        return updated_user
+
+    async def delete(self, user_id: str) -> None:
+        user = self._users.pop(user_id, None)
+        if user is not None and self._by_google_id.get(user.google_id) == user_id:
+            del self._by_google_id[user.google_id]
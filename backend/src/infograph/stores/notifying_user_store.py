@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable
+
+from infograph.core.schemas import User, UserCreate
+from infograph.stores.abstract_user_store import AbstractUserStore
+
+# Called with the user_id and, after an update, the new profile_version.
+UserChangeListener = Callable[[str, "int | None"], None]
+
+
+class NotifyingUserStore(AbstractUserStore):
+    """User store wrapper that reports updates and deletes to ``on_change``.
+
+    AuthService listens so tokens it has cached, or whose snapshot it
+    trusts, stop resolving to a user as soon as that user changes through
+    this store. The listener runs after the write, even a failed one.
+    Attributes that are not part of the store interface fall through to the
+    wrapped store.
+    """
+
+    def __init__(self, inner: AbstractUserStore, on_change: UserChangeListener) -> None:
+        self.inner = inner
+        self.on_change = on_change
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.inner, name)
+
+    async def create(self, create: UserCreate) -> User:
+        return await self.inner.create(create)
+
+    async def get_by_google_id(self, google_id: str) -> User | None:
+        return await self.inner.get_by_google_id(google_id)
+
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        return await self.inner.upsert_by_google_id(create)
+
+    async def get(self, user_id: str) -> User | None:
+        return await self.inner.get(user_id)
+
+    async def list(self) -> Iterable[User]:
+        return await self.inner.list()
+
+    async def update(self, user: User) -> User:
+        try:
+            updated = await self.inner.update(user)
+        except BaseException:
+            self.on_change(user.user_id, None)
+            raise
+        # Snapshots at least as new as the update can still be trusted.
+        self.on_change(user.user_id, updated.profile_version)
+        return updated
+
+    async def delete(self, user_id: str) -> None:
+        try:
+            await self.inner.delete(user_id)
+        finally:
+            self.on_change(user_id, None)
+
+
+__all__ = ["NotifyingUserStore", "UserChangeListener"]
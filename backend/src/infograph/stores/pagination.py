@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+
+from infograph.core.schemas import ResearchSession
+
+
+@dataclass(frozen=True)
+class SessionCursor:
+    """Keyset position in a user's session history, newest first.
+
+    Sessions are ordered by ``(created_at DESC, session_id DESC)``; a cursor
+    points just past the last session of the previous page.
+    """
+
+    created_at: int
+    session_id: str
+
+    @classmethod
+    def after(cls, session: ResearchSession) -> SessionCursor:
+        return cls(created_at=session.created_at, session_id=session.session_id)
+
+    def encode(self) -> str:
+        raw = json.dumps([self.created_at, self.session_id]).encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> SessionCursor:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, session_id = json.loads(base64.urlsafe_b64decode(padded))
+        except (binascii.Error, ValueError, TypeError) as exc:
+            raise ValueError("Invalid pagination cursor") from exc
+        if not isinstance(created_at, int) or not isinstance(session_id, str):
+            raise ValueError("Invalid pagination cursor")
+        return cls(created_at=created_at, session_id=session_id)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from infograph.core.schemas import Infographic, InfographicCreate
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class InfographicStoreRPC(RPCStoreBase, AbstractInfographicStore):
+    store_name = "infographic_store"
+
+    async def create(self, create: InfographicCreate) -> Infographic:
+        return await self._call("create", create)
+
+    async def get_for_session(self, session_id: str) -> Infographic | None:
+        return await self._call("get_for_session", session_id)
+
+    async def list_recent(self, limit: int = 10) -> list[Infographic]:
+        return await self._call("list_recent", limit)
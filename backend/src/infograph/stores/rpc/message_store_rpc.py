@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infograph.core.schemas import Message, MessageCreate
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class MessageStoreRPC(RPCStoreBase, AbstractMessageStore):
+    """Message store client; buffered writes are merged on the server side."""
+
+    store_name = "message_store"
+
+    async def create(self, create: MessageCreate) -> Message:
+        return await self._call("create", create)
+
+    async def create_many(self, creates: Sequence[MessageCreate]) -> list[Message]:
+        return await self._call("create_many", list(creates))
+
+    async def list_for_session(self, session_id: str) -> list[Message]:
+        return await self._call("list_for_session", session_id)
+
+    async def delete_for_session(self, session_id: str) -> None:
+        await self._call("delete_for_session", session_id)
@@ -0,0 +1,79 @@
+"""Wire format shared by the store server and its clients.
+
+Each frame is a 4-byte big-endian length followed by a UTF-8 JSON body.
+Requests are ``{"id", "store", "method", "args", "kwargs"}``; responses are
+``{"id", "result"}`` or ``{"id", "error": {"type", "message"}}``. Pydantic
+models travel as ``{"__model__": name, "data": ...}`` and are rebuilt from
+``infograph.core.schemas`` only, so a peer cannot instantiate other types.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+from pydantic import BaseModel
+
+from infograph.core import schemas
+
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+_HEADER = struct.Struct(">I")
+_MODELS: dict[str, type[BaseModel]] = {
+    name: value
+    for name, value in vars(schemas).items()
+    if isinstance(value, type) and issubclass(value, BaseModel)
+}
+# Exceptions re-raised with their own type on the client; anything else
+# surfaces as StoreRPCError.
+_ERRORS: dict[str, type[Exception]] = {"ValueError": ValueError, "KeyError": KeyError}
+
+
+class StoreRPCError(RuntimeError):
+    """The store server failed a request or the connection was lost."""
+
+
+def encode(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return {"__model__": type(value).__name__, "data": value.model_dump(mode="json")}
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    return value
+
+
+def decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        name = value.get("__model__")
+        if name is not None:
+            model = _MODELS.get(name)
+            if model is None:
+                raise StoreRPCError(f"Unknown model in store RPC payload: {name}")
+            return model.model_validate(value["data"])
+        return {key: decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+    return value
+
+
+def error_payload(exc: Exception) -> dict[str, str]:
+    return {"type": type(exc).__name__, "message": str(exc)}
+
+
+def raise_error(payload: dict[str, str]) -> None:
+    error_type = _ERRORS.get(payload.get("type", ""), StoreRPCError)
+    raise error_type(payload.get("message", "Store server error"))
+
+
+async def read_frame(reader: asyncio.StreamReader) -> dict[str, Any]:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if length > MAX_FRAME_BYTES:
+        raise StoreRPCError(f"Store RPC frame of {length} bytes exceeds the limit")
+    return json.loads(await reader.readexactly(length))
+
+
+def pack_frame(message: dict[str, Any]) -> bytes:
+    body = json.dumps(message, separators=(",", ":")).encode()
+    return _HEADER.pack(len(body)) + body
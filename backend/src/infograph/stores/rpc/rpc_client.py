@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from pathlib import Path
+from typing import Any
+
+from infograph.stores.rpc.protocol import (
+    StoreRPCError,
+    decode,
+    encode,
+    pack_frame,
+    raise_error,
+    read_frame,
+)
+
+
+class StoreRPCClient:
+    """Multiplexed connection from an API worker to the store server.
+
+    Calls are pipelined over one Unix socket and matched to responses by
+    id. The connection is opened on first use and reopened after a failure;
+    it is bound to the event loop that opened it.
+    """
+
+    def __init__(self, socket_path: Path) -> None:
+        self.socket_path = socket_path
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connect_lock: asyncio.Lock | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+
+    async def call(self, store: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        writer = await self._connect()
+        request_id = next(self._ids)
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            writer.write(
+                pack_frame(
+                    {
+                        "id": request_id,
+                        "store": store,
+                        "method": method,
+                        "args": encode(list(args)),
+                        "kwargs": encode(kwargs),
+                    }
+                )
+            )
+            await writer.drain()
+            response = await future
+        except ConnectionError as exc:
+            raise StoreRPCError(f"Store server unavailable: {exc}") from exc
+        finally:
+            self._pending.pop(request_id, None)
+        if "error" in response:
+            raise_error(response["error"])
+        return decode(response.get("result"))
+
+    async def _connect(self) -> asyncio.StreamWriter:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A connection cannot be shared across event loops; start over.
+            self._loop = loop
+            self._connect_lock = asyncio.Lock()
+            self._writer = None
+            self._reader_task = None
+        assert self._connect_lock is not None
+        async with self._connect_lock:
+            if self._writer is None or self._writer.is_closing():
+                try:
+                    reader, self._writer = await asyncio.open_unix_connection(
+                        str(self.socket_path)
+                    )
+                except OSError as exc:
+                    raise StoreRPCError(
+                        f"Cannot connect to store server at {self.socket_path}: {exc}"
+                    ) from exc
+                self._reader_task = asyncio.create_task(self._read_responses(reader))
+            return self._writer
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                response = await read_frame(reader)
+                future = self._pending.get(response.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionError, StoreRPCError):
+            pass
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(StoreRPCError("Store server connection lost"))
+
+    async def aclose(self) -> None:
+        if self._reader_task is not None and self._loop is asyncio.get_running_loop():
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+        self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class RPCStoreBase:
+    """Forward store calls to the registry attribute ``store_name`` on the server."""
+
+    store_name: str
+
+    def __init__(self, client: StoreRPCClient) -> None:
+        self.client = client
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await self.client.call(self.store_name, method, *args, **kwargs)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infograph.core.schemas import SearchDocument, SearchHit
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class SearchIndexStoreRPC(RPCStoreBase, AbstractSearchIndexStore):
+    store_name = "search_index_store"
+
+    async def index_documents(self, documents: Sequence[SearchDocument]) -> None:
+        await self._call("index_documents", list(documents))
+
+    async def delete_for_session(self, session_id: str) -> None:
+        await self._call("delete_for_session", session_id)
+
+    async def search(self, user_id: str, query: str, *, limit: int = 20) -> list[SearchHit]:
+        return await self._call("search", user_id, query, limit=limit)
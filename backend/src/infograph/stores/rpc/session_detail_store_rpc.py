@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from infograph.core.schemas import SessionDetail
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class SessionDetailStoreRPC(RPCStoreBase, AbstractSessionDetailStore):
+    store_name = "session_detail_store"
+
+    async def get_for_user(self, session_id: str, user_id: str) -> SessionDetail | None:
+        return await self._call("get_for_user", session_id, user_id)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infograph.core.schemas import (
+    ResearchSession,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SessionStatus,
+)
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class SessionStoreRPC(RPCStoreBase, AbstractSessionStore):
+    store_name = "session_store"
+
+    async def create(self, create: ResearchSessionCreate, user_id: str) -> ResearchSession:
+        return await self._call("create", create, user_id)
+
+    async def get(self, session_id: str) -> ResearchSession | None:
+        return await self._call("get", session_id)
+
+    async def get_many(self, user_id: str, session_ids: Sequence[str]) -> list[ResearchSession]:
+        return await self._call("get_many", user_id, list(session_ids))
+
+    async def list_for_user(
+        self,
+        user_id: str,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        search: str | None = None,
+        start_timestamp: int | None = None,
+        end_timestamp: int | None = None,
+        cursor: str | None = None,
+    ) -> list[ResearchSession]:
+        return await self._call(
+            "list_for_user",
+            user_id,
+            limit=limit,
+            offset=offset,
+            search=search,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
+            cursor=cursor,
+        )
+
+    async def update(self, session_id: str, update: ResearchSessionUpdate) -> ResearchSession:
+        return await self._call("update", session_id, update)
+
+    async def transition(
+        self,
+        session_id: str,
+        from_statuses: Sequence[SessionStatus],
+        to_status: SessionStatus,
+    ) -> ResearchSession | None:
+        return await self._call("transition", session_id, list(from_statuses), to_status)
+
+    async def delete(self, session_id: str) -> None:
+        await self._call("delete", session_id)
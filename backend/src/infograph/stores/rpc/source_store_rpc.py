@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from infograph.core.schemas import Source, SourceCreate
+from infograph.stores.abstract_source_store import AbstractSourceStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class SourceStoreRPC(RPCStoreBase, AbstractSourceStore):
+    store_name = "source_store"
+
+    async def create(self, create: SourceCreate) -> Source:
+        return await self._call("create", create)
+
+    async def create_many(self, creates: Sequence[SourceCreate]) -> list[Source]:
+        return await self._call("create_many", list(creates))
+
+    async def list_for_session(self, session_id: str) -> list[Source]:
+        return await self._call("list_for_session", session_id)
+
+    async def delete_for_session(self, session_id: str) -> None:
+        await self._call("delete_for_session", session_id)
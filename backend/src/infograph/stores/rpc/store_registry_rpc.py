@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.rpc.infographic_store_rpc import InfographicStoreRPC
+from infograph.stores.rpc.message_store_rpc import MessageStoreRPC
+from infograph.stores.rpc.rpc_client import StoreRPCClient
+from infograph.stores.rpc.search_index_store_rpc import SearchIndexStoreRPC
+from infograph.stores.rpc.session_detail_store_rpc import SessionDetailStoreRPC
+from infograph.stores.rpc.session_store_rpc import SessionStoreRPC
+from infograph.stores.rpc.source_store_rpc import SourceStoreRPC
+from infograph.stores.rpc.user_store_rpc import UserStoreRPC
+
+
+def store_socket_path() -> Path:
+    """Socket of the store server, from ``INFOGRAPH_STORE_SOCKET``."""
+    path = os.environ.get("INFOGRAPH_STORE_SOCKET")
+    if not path:
+        raise ValueError("INFOGRAPH_STORE_SOCKET must be set for the rpc store backend")
+    return Path(path)
+
+
+class StoreRegistryRPC(AbstractStoreRegistry):
+    """Stores served by a separate store-server process over a Unix socket.
+
+    Lets several API worker processes share one DuckDB file: the server is
+    the only process that opens it. Caches and write-behind buffers live in
+    the server, so every worker sees the same state.
+    """
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        self.client = StoreRPCClient(socket_path or store_socket_path())
+        self._user_store = UserStoreRPC(self.client)
+        self._session_store = SessionStoreRPC(self.client)
+        self._source_store = SourceStoreRPC(self.client)
+        self._message_store = MessageStoreRPC(self.client)
+        self._infographic_store = InfographicStoreRPC(self.client)
+        self._search_index_store = SearchIndexStoreRPC(self.client)
+        self._session_detail_store = SessionDetailStoreRPC(self.client)
+
+    @property
+    def user_store(self) -> UserStoreRPC:
+        return self._user_store
+
+    @property
+    def session_store(self) -> SessionStoreRPC:
+        return self._session_store
+
+    @property
+    def source_store(self) -> SourceStoreRPC:
+        return self._source_store
+
+    @property
+    def message_store(self) -> MessageStoreRPC:
+        return self._message_store
+
+    @property
+    def infographic_store(self) -> InfographicStoreRPC:
+        return self._infographic_store
+
+    @property
+    def search_index_store(self) -> SearchIndexStoreRPC:
+        return self._search_index_store
+
+    @property
+    def session_detail_store(self) -> SessionDetailStoreRPC:
+        return self._session_detail_store
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
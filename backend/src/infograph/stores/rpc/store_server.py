@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import signal
+import socket
+import time
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any
+
+from infograph.stores.abstract_infographic_store import AbstractInfographicStore
+from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_search_index_store import AbstractSearchIndexStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
+from infograph.stores.abstract_session_store import AbstractSessionStore
+from infograph.stores.abstract_source_store import AbstractSourceStore
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.rpc.protocol import decode, encode, error_payload, pack_frame, read_frame
+from infograph.stores.store_registry import create_store_registry
+
+logger = logging.getLogger(__name__)
+
+# Registry attribute -> interface whose abstract coroutine methods are served.
+SERVED_STORES: dict[str, type] = {
+    "user_store": AbstractUserStore,
+    "session_store": AbstractSessionStore,
+    "source_store": AbstractSourceStore,
+    "message_store": AbstractMessageStore,
+    "infographic_store": AbstractInfographicStore,
+    "search_index_store": AbstractSearchIndexStore,
+    "session_detail_store": AbstractSessionDetailStore,
+}
+
+
+def _served_methods(interface: type) -> frozenset[str]:
+    return frozenset(
+        name
+        for name in interface.__abstractmethods__
+        if inspect.iscoroutinefunction(getattr(interface, name))
+    )
+
+
+class StoreServer:
+    """Serve a registry's stores to API worker processes over a Unix socket.
+
+    The server is the only process that opens the DuckDB file, so any number
+    of API workers can share one database. Requests on a connection are
+    handled concurrently and answered by id, in completion order.
+    """
+
+    def __init__(self, registry: AbstractStoreRegistry, socket_path: Path) -> None:
+        self.registry = registry
+        self.socket_path = socket_path
+        self._methods = {name: _served_methods(iface) for name, iface in SERVED_STORES.items()}
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> None:
+        self.socket_path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+        os.chmod(self.socket_path, 0o600)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.socket_path.unlink(missing_ok=True)
+        await self.registry.aclose()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        write_lock = asyncio.Lock()
+        tasks: set[asyncio.Task[None]] = set()
+
+        async def respond(request: dict[str, Any]) -> None:
+            response: dict[str, Any] = {"id": request.get("id")}
+            try:
+                response["result"] = encode(await self._dispatch(request))
+            except Exception as exc:
+                response["error"] = error_payload(exc)
+            async with write_lock:
+                writer.write(pack_frame(response))
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    request = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                task = asyncio.create_task(respond(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception:
+            logger.exception("Store server connection failed")
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _dispatch(self, request: dict[str, Any]) -> Any:
+        store_name = request.get("store", "")
+        method_name = request.get("method", "")
+        if method_name not in self._methods.get(store_name, ()):
+            raise LookupError(f"Store method {store_name}.{method_name} is not served")
+        method = getattr(getattr(self.registry, store_name), method_name)
+        return await method(*decode(request.get("args", [])), **decode(request.get("kwargs", {})))
+
+
+async def serve_stores(
+    registry: AbstractStoreRegistry, socket_path: Path, stop: asyncio.Event | None = None
+) -> None:
+    """Serve ``registry`` until ``stop`` is set or the process gets SIGTERM/SIGINT."""
+    stop = stop or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+    server = StoreServer(registry, socket_path)
+    await server.start()
+    logger.info("Store server listening on %s", socket_path)
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+
+
+def run_store_server(socket_path: Path, backend: str | None = None) -> None:
+    """Process entry point: own the ``backend`` stores and serve them over ``socket_path``."""
+    backend = (backend or os.environ.get("INFOGRAPH_STORE_BACKEND") or "duckdb").lower()
+    if backend == "rpc":
+        raise ValueError("The store server needs a local backend, not rpc")
+    asyncio.run(serve_stores(create_store_registry(backend), socket_path))
+
+
+def wait_for_socket(
+    socket_path: Path, timeout: float = 30.0, process: BaseProcess | None = None
+) -> None:
+    """Block until the store server accepts connections on ``socket_path``.
+
+    With ``process``, the server's process, raises RuntimeError with its exit
+    code as soon as it dies instead of waiting out ``timeout``.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(socket_path))
+                return
+            except OSError:
+                if process is not None and not process.is_alive():
+                    raise RuntimeError(
+                        f"Store server exited with code {process.exitcode} "
+                        f"before listening on {socket_path}"
+                    ) from None
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Store server did not start on {socket_path}")
+        time.sleep(0.05)
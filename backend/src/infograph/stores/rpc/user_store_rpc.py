@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from infograph.core.schemas import User, UserCreate
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.rpc.rpc_client import RPCStoreBase
+
+
+class UserStoreRPC(RPCStoreBase, AbstractUserStore):
+    store_name = "user_store"
+
+    async def create(self, create: UserCreate) -> User:
+        return await self._call("create", create)
+
+    async def get_by_google_id(self, google_id: str) -> User | None:
+        return await self._call("get_by_google_id", google_id)
+
+    async def upsert_by_google_id(self, create: UserCreate) -> User:
+        return await self._call("upsert_by_google_id", create)
+
+    async def get(self, user_id: str) -> User | None:
+        return await self._call("get", user_id)
+
+    async def list(self) -> list[User]:
+        return await self._call("list")
+
+    async def update(self, user: User) -> User:
+        return await self._call("update", user)
+
+    async def delete(self, user_id: str) -> None:
+        await self._call("delete", user_id)
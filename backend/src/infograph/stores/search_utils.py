@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Joins user_id and term in a posting key; never produced by the tokenizer.
+POSTING_KEY_SEPARATOR = "\x1f"
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it of on or that the to was were with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase ``text`` and split it into index terms, dropping stopwords."""
+    return [
+        token
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token not in _STOPWORDS
+    ]
+
+
+def posting_key(user_id: str, term: str) -> str:
+    """Key under which ``user_id``'s postings for ``term`` are indexed."""
+    return f"{user_id}{POSTING_KEY_SEPARATOR}{term}"
+
+
+def term_frequencies(text: str) -> tuple[Counter[str], int]:
+    """Return term counts and the document length in terms."""
+    tokens = tokenize(text)
+    return Counter(tokens), len(tokens)
+
+
+def bm25_idf(doc_count: int, doc_freq: int) -> float:
+    """Non-negative BM25 inverse document frequency."""
+    return math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def bm25_term_score(term_freq: int, doc_length: int, avg_length: float) -> float:
+    """BM25 term-frequency component, to be multiplied by ``bm25_idf``."""
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_length / avg_length)
+    return term_freq * (BM25_K1 + 1) / (term_freq + norm)
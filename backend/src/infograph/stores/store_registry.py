@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+
+if TYPE_CHECKING:
+    from leettools.settings import SystemSettings
+
+STORE_BACKENDS = ("duckdb", "memory", "rpc")
+
+
+def create_store_registry(
+    backend: str | None = None, settings: SystemSettings | None = None
+) -> AbstractStoreRegistry:
+    """Build the registry for ``backend``, defaulting to ``INFOGRAPH_STORE_BACKEND``.
+
+    ``duckdb`` is sharded by user when ``INFOGRAPH_DUCKDB_SHARDS`` is above 1;
+    ``rpc`` connects to a store server on ``INFOGRAPH_STORE_SOCKET`` instead of
+    opening storage in this process.
+    """
+    backend = (backend or os.environ.get("INFOGRAPH_STORE_BACKEND") or "duckdb").lower()
+    if backend == "memory":
+        from infograph.stores.memory.store_registry_memory import StoreRegistryMemory
+
+        return StoreRegistryMemory()
+    if backend == "duckdb":
+        from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+        from infograph.stores.duckdb.store_registry_sharded_duckdb import (
+            StoreRegistryShardedDuckDB,
+            shard_count_from_env,
+        )
+
+        shard_count = shard_count_from_env()
+        if shard_count > 1:
+            return StoreRegistryShardedDuckDB(settings, shard_count)
+        return StoreRegistryDuckDB(settings)
+    if backend == "rpc":
+        from infograph.stores.rpc.store_registry_rpc import StoreRegistryRPC
+
+        return StoreRegistryRPC()
+    raise ValueError(f"Unknown store backend: {backend}")
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Invalidations are counted per slot rather than per key so the counters stay
+# bounded; keys sharing a slot only cost each other a skipped fill.
+GENERATION_SLOTS = 1024
+
+
+@dataclass
+class CacheStats:
+    """Point-in-time counters for a TTLCache."""
+
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries also expire ``ttl_seconds`` after being set.
+
+    Read-through callers take ``generation(key)`` before loading a value and
+    pass it to ``set``; an ``invalidate`` of the key in between makes the
+    ``set`` a no-op, so a load that raced a write cannot cache the old value.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generations = [0] * GENERATION_SLOTS
+
+    def generation(self, key: K) -> int:
+        """Invalidation count of ``key``; pass it to ``set`` for a load started now."""
+        with self._lock:
+            return self._generations[hash(key) % GENERATION_SLOTS]
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(
+        self,
+        key: K,
+        value: V,
+        ttl_seconds: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store ``value``; ``ttl_seconds`` overrides the cache-wide TTL for this entry.
+
+        With ``generation``, nothing is stored if ``key`` was invalidated since
+        that generation was read.
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if (
+                generation is not None
+                and generation != self._generations[hash(key) % GENERATION_SLOTS]
+            ):
+                return
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generations[hash(key) % GENERATION_SLOTS] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations = [generation + 1 for generation in self._generations]
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                size=len(self._entries),
+                max_size=self.max_size,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
@@ -1,3 +1,11 @@
 """Infograph service package."""
 
-from .main import main  # noqa: F401
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if name == "main":
+        from .main import main
+
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,39 +2,103 @@
 
 from fastapi import APIRouter
 
-from infograph.svc.api.v1.routers import health_router, auth_router, session_router, source_router
+from infograph.services.auth_service import AuthService
+from infograph.services.history_search_service import HistorySearchService
+from infograph.services.search_service import SearchService
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.lazy_store import lazy_store
+from infograph.stores.store_registry import create_store_registry
+from infograph.svc.api.v1.routers import (
+    auth_router,
+    export_router,
+    health_router,
+    session_router,
+    source_router,
+)
 
 
 class ServiceAPIRouter(APIRouter):
-    """Aggregate router for all v1 endpoints."""
+    """Aggregate router for all v1 endpoints.
 
-    def __init__(self, *args, **kwargs):
+    Routers get stand-ins for the registry's stores, so building the app
+    opens no database; each store is built by the first request that uses it.
+    ``protected_prefixes`` are the paths, relative to this router, that need
+    a signed-in user; the app authenticates them in AuthMiddleware.
+    """
+
+    def __init__(self, *args, stores: AbstractStoreRegistry | None = None, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.health_router = health_router.HealthRouter()
+        self.stores = stores or create_store_registry()
+        self.protected_prefixes = ["/api/v1/auth/me", "/api/v1/sessions"]
+        session_store = lazy_store(self.stores, "session_store")
+        source_store = lazy_store(self.stores, "source_store")
+        message_store = lazy_store(self.stores, "message_store")
+        self.auth_service = AuthService(lazy_store(self.stores, "user_store"))
+        # Routers write users through this store so their tokens are invalidated.
+        user_store = self.auth_service.user_store
+        self.search_service = SearchService(source_store)
+        self.history_search = HistorySearchService(
+            lazy_store(self.stores, "search_index_store")
+        )
+
+        self.health_router = health_router.HealthRouter(
+            stores=self.stores,
+            token_cache=self.auth_service.token_cache,
+            key_store=self.auth_service.key_store,
+        )
         super().include_router(
             self.health_router,
             prefix="",
             tags=["health"],
         )
 
-        self.auth_router = auth_router.AuthRouter()
+        self.auth_router = auth_router.AuthRouter(
+            user_store=user_store,
+            auth_service=self.auth_service,
+        )
         super().include_router(
             self.auth_router,
             prefix="/api/v1/auth",
             tags=["auth"],
         )
 
-        self.session_router = session_router.SessionRouter()
+        self.session_router = session_router.SessionRouter(
+            session_store=session_store,
+            message_store=message_store,
+            source_store=source_store,
+            user_store=user_store,
+            auth_service=self.auth_service,
+            search_service=self.search_service,
+            history_search=self.history_search,
+            detail_store=lazy_store(self.stores, "session_detail_store"),
+        )
         super().include_router(
             self.session_router,
             prefix="/api/v1/sessions",
             tags=["sessions"],
         )
 
-        self.source_router = source_router.SourceRouter()
+        self.source_router = source_router.SourceRouter(
+            session_store=session_store,
+            source_store=source_store,
+            auth_service=self.auth_service,
+            user_store=user_store,
+        )
         super().include_router(
             self.source_router,
             prefix="/api/v1/sessions",
             tags=["sources"],
         )
+
+        if self.stores.supports_export:
+            self.export_router = export_router.ExportRouter(
+                export_store=lazy_store(self.stores, "export_store"),
+                auth_service=self.auth_service,
+            )
+            super().include_router(
+                self.export_router,
+                prefix="/api/v1/export",
+                tags=["export"],
+            )
+            self.protected_prefixes.append("/api/v1/export")
@@ -1,5 +1,5 @@
 """API v1 routers package."""
 
-from . import auth_router, health_router, session_router, source_router
+from . import auth_router, export_router, health_router, session_router, source_router
 
-__all__ = ["auth_router", "health_router", "session_router", "source_router"]
+__all__ = ["auth_router", "export_router", "health_router", "session_router", "source_router"]
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from fastapi import Header, HTTPException
+from fastapi import Request
 from pydantic import BaseModel
 
-from infograph.core.schemas import User
+from infograph.core.schemas import User, UserProfile
 from infograph.services.auth_service import AuthService
 from infograph.stores.abstract_user_store import AbstractUserStore
-from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
 from infograph.svc.api_router_base import APIRouterBase
+from infograph.svc.auth_middleware import request_user
 
 
 class GoogleAuthRequest(BaseModel):
@@ -25,17 +25,6 @@ class AuthResponse(BaseModel):
     token: str
 
 
-def _bearer_token_from_header(authorization: str | None) -> str:
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Missing Authorization header")
-
-    parts = authorization.strip().split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(status_code=401, detail="Invalid Authorization header")
-
-    return parts[1]
-
-
 class AuthRouter(APIRouterBase):
     """Router that exposes authentication endpoints."""
 
@@ -46,7 +35,11 @@ class AuthRouter(APIRouterBase):
         auth_service: AuthService | None = None,
     ) -> None:
         super().__init__()
-        self.user_store = user_store or UserStoreDuckDB()
+        if user_store is None:
+            from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+
+            user_store = UserStoreDuckDB()
+        self.user_store = user_store
         self.auth_service = auth_service or AuthService(self.user_store)
         self._register_routes()
 
@@ -56,12 +49,16 @@ class AuthRouter(APIRouterBase):
             user, token = await self.auth_service.authenticate(payload.credential)
             return AuthResponse(user=user, token=token)
 
-        @self.get("/me", response_model=User)
-        async def get_current_user(
-            authorization: str | None = Header(None, alias="Authorization")
-        ) -> User:
-            token = _bearer_token_from_header(authorization)
-            return await self.auth_service.get_user_from_token(token)
+        # Only the profile fields, so the reply is the same when served from a snapshot.
+        @self.get("/me", response_model=UserProfile)
+        async def get_current_user(request: Request) -> UserProfile:
+            user = await request_user(request, self.auth_service)
+            return UserProfile(
+                user_id=user.user_id,
+                email=user.email,
+                name=user.name,
+                profile_version=user.profile_version,
+            )
 
         @self.post("/logout")
         async def logout() -> dict[str, bool]:
@@ -0,0 +1,80 @@
+"""Router for exporting a user's research history."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Sequence
+
+from fastapi import Depends, Query, Request
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+
+from infograph.core.schemas import User
+from infograph.services.auth_service import AuthService
+from infograph.svc.api_router_base import APIRouterBase
+from infograph.svc.auth_middleware import request_user
+
+if TYPE_CHECKING:
+    from infograph.stores.duckdb.export_store_duckdb import ExportStoreDuckDB
+
+
+def _write_zip(archive: Path, paths: Sequence[Path]) -> None:
+    """Bundle ``paths`` into ``archive``; blocking, so run off the event loop."""
+    with zipfile.ZipFile(archive, "w") as bundle:
+        for path in paths:
+            bundle.write(path, arcname=path.name)
+
+
+class ExportRouter(APIRouterBase):
+    """Router streaming a user's sessions, sources, messages and infographics."""
+
+    def __init__(self, *, export_store: ExportStoreDuckDB, auth_service: AuthService) -> None:
+        super().__init__()
+        self.export_store = export_store
+        self.auth_service = auth_service
+        self._register_routes()
+
+    async def _get_current_user(self, request: Request) -> User:
+        """The user AuthMiddleware resolved from the bearer token."""
+        return await request_user(request, self.auth_service)
+
+    def _register_routes(self) -> None:
+
+        @self.get("")
+        async def export_history(
+            format: Literal["ndjson", "parquet"] = Query("ndjson"),
+            current_user: User = Depends(self._get_current_user),
+        ):
+            """Export the user's history as NDJSON or a zip of Parquet files.
+
+            NDJSON is streamed from the database in chunks. Parquet files are
+            written to a temporary directory by DuckDB, zipped on a worker
+            thread and served from disk.
+            """
+            if format == "ndjson":
+                return StreamingResponse(
+                    self.export_store.iter_ndjson(current_user.user_id),
+                    media_type="application/x-ndjson",
+                    headers={"Content-Disposition": 'attachment; filename="export.ndjson"'},
+                )
+
+            workdir = Path(tempfile.mkdtemp(prefix="infograph-export-"))
+            try:
+                paths = await self.export_store.copy_to(
+                    current_user.user_id, workdir / "export", "parquet"
+                )
+                archive = workdir / "export.zip"
+                await asyncio.to_thread(_write_zip, archive, paths)
+            except Exception:
+                await asyncio.to_thread(shutil.rmtree, workdir, ignore_errors=True)
+                raise
+            return FileResponse(
+                archive,
+                media_type="application/zip",
+                filename="export.zip",
+                background=BackgroundTask(shutil.rmtree, workdir, ignore_errors=True),
+            )
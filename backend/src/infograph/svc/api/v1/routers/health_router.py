@@ -1,15 +1,57 @@
 """Health check router."""
 
+from dataclasses import asdict
+from typing import Any
+
+from infograph.services.google_key_store import GoogleKeyStore
+from infograph.services.token_cache import VerifiedTokenCache
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
 from infograph.svc.api_router_base import APIRouterBase
 
 
 class HealthRouter(APIRouterBase):
     """Router exposing system health endpoints."""
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        stores: AbstractStoreRegistry | None = None,
+        token_cache: VerifiedTokenCache | None = None,
+        key_store: GoogleKeyStore | None = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
+        self.stores = stores
+        self.token_cache = token_cache
+        self.key_store = key_store
 
         @self.get("/health")
         async def health_status() -> dict[str, str]:
             """Return a simple health response."""
             return {"status": "ok", "version": "1.0.0"}
+
+        @self.get("/health/db")
+        async def db_health() -> dict[str, Any]:
+            """Report DuckDB executor queue depth, wait times and cache hit rates."""
+            if self.stores is None:
+                return {"executors": {}, "caches": {}}
+            return {
+                "executors": {
+                    db_name: {**asdict(stats), "avg_wait_ms": stats.avg_wait_ms}
+                    for db_name, stats in self.stores.executor_stats().items()
+                },
+                "caches": {
+                    name: {**asdict(stats), "hit_rate": stats.hit_rate}
+                    for name, stats in self.stores.cache_stats().items()
+                },
+            }
+
+        @self.get("/health/auth")
+        async def auth_health() -> dict[str, Any]:
+            """Report the verified-token cache hit rate and the cached Google signing keys."""
+            token_cache = None
+            if self.token_cache is not None:
+                stats = self.token_cache.stats()
+                token_cache = {**asdict(stats), "hit_rate": stats.hit_rate}
+            signing_keys = asdict(self.key_store.stats()) if self.key_store is not None else None
+            return {"token_cache": token_cache, "signing_keys": signing_keys}
@@ -4,37 +4,31 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from fastapi import Depends, Header, HTTPException, Query
+from fastapi import Depends, HTTPException, Query, Request, Response
 
 from infograph.core.schemas import (
     Message,
     MessageCreate,
     ResearchSession,
     ResearchSessionCreate,
+    SessionDetail,
+    SessionSearchResult,
     User,
 )
 from infograph.services.auth_service import AuthService
+from infograph.services.history_search_service import HistorySearchService
 from infograph.services.search_service import SearchService
 from infograph.stores.abstract_message_store import AbstractMessageStore
+from infograph.stores.abstract_session_detail_store import AbstractSessionDetailStore
 from infograph.stores.abstract_session_store import AbstractSessionStore
 from infograph.stores.abstract_source_store import AbstractSourceStore
 from infograph.stores.abstract_user_store import AbstractUserStore
-from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
-from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
-from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
-from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+from infograph.stores.pagination import SessionCursor
 from infograph.svc.api_router_base import APIRouterBase
+from infograph.svc.auth_middleware import request_user
 
-
-def _extract_bearer_token(authorization: str | None) -> str:
-    if not authorization:
-        raise HTTPException(status_code=401, detail="Missing Authorization header")
-
-    parts = authorization.strip().split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(status_code=401, detail="Invalid Authorization header")
-
-    return parts[1]
+# Response header carrying the cursor of the next page of sessions.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
 
 class SessionRouter(APIRouterBase):
@@ -49,26 +43,60 @@ class SessionRouter(APIRouterBase):
         user_store: AbstractUserStore | None = None,
         auth_service: AuthService | None = None,
         search_service: SearchService | None = None,
+        history_search: HistorySearchService | None = None,
+        detail_store: AbstractSessionDetailStore | None = None,
     ) -> None:
         super().__init__()
-        self.session_store = session_store or SessionStoreDuckDB()
-        self.user_store = user_store or UserStoreDuckDB(self.session_store.settings)
-        self.message_store = message_store or MessageStoreDuckDB(self.session_store.settings)
-        self.source_store = source_store or SourceStoreDuckDB(self.session_store.settings)
+        defaults_needed = any(
+            dependency is None
+            for dependency in (
+                session_store,
+                message_store,
+                source_store,
+                user_store,
+                history_search,
+                detail_store,
+            )
+        )
+        if defaults_needed:
+            # Standalone use without a registry; the app always passes its stores.
+            from infograph.stores.duckdb.infographic_store_duckdb import InfographicStoreDuckDB
+            from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+            from infograph.stores.duckdb.search_index_store_duckdb import SearchIndexStoreDuckDB
+            from infograph.stores.duckdb.session_detail_store_duckdb import (
+                SessionDetailStoreDuckDB,
+            )
+            from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+            from infograph.stores.duckdb.source_store_duckdb import SourceStoreDuckDB
+            from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+
+            session_store = session_store or SessionStoreDuckDB()
+            settings = session_store.settings
+            user_store = user_store or UserStoreDuckDB(settings)
+            message_store = message_store or MessageStoreDuckDB(settings)
+            source_store = source_store or SourceStoreDuckDB(settings)
+            history_search = history_search or HistorySearchService(
+                SearchIndexStoreDuckDB(settings)
+            )
+            detail_store = detail_store or SessionDetailStoreDuckDB(
+                session_store,
+                source_store,
+                message_store,
+                InfographicStoreDuckDB(settings),
+            )
+        self.session_store = session_store
+        self.user_store = user_store
+        self.message_store = message_store
+        self.source_store = source_store
         self.auth_service = auth_service or AuthService(self.user_store)
         self.search_service = search_service or SearchService(self.source_store)
+        self.history_search = history_search
+        self.detail_store = detail_store
         self._register_routes()
 
-    async def _get_current_user(
-        self,
-        authorization: str | None = Header(None, alias="Authorization"),
-    ) -> User:
-        """Resolve the current user from a bearer token."""
-        token = _extract_bearer_token(authorization)
-        try:
-            return await self.auth_service.get_user_from_token(token)
-        except ValueError as exc:
-            raise HTTPException(status_code=401, detail=str(exc)) from exc
+    async def _get_current_user(self, request: Request) -> User:
+        """The user AuthMiddleware resolved from the bearer token."""
+        return await request_user(request, self.auth_service)
 
     async def _get_user_session(self, session_id: str, user: User) -> ResearchSession:
         """Return a session owned by the authenticated user."""
@@ -86,28 +114,62 @@ class SessionRouter(APIRouterBase):
         ) -> ResearchSession:
             """Create a new research session for the authenticated user."""
             session = await self.session_store.create(payload, current_user.user_id)
-            await self.search_service.gather_sources(session.session_id, payload.prompt)
+            sources = await self.search_service.gather_sources(session.session_id, payload.prompt)
+            await self.history_search.index_session(session, sources)
             return session
 
         @self.get("", response_model=list[ResearchSession])
         async def list_sessions(
+            response: Response,
             limit: int = Query(20, ge=1, le=100),
             offset: int = Query(0, ge=0),
+            cursor: str | None = Query(None, min_length=1),
             search: str | None = Query(None, min_length=1),
             start_timestamp: int | None = Query(None, alias="start"),
             end_timestamp: int | None = Query(None, alias="end"),
             current_user: User = Depends(self._get_current_user),
         ) -> list[ResearchSession]:
-            """List research sessions belonging to the authenticated user."""
-            sessions: Iterable[ResearchSession] = await self.session_store.list_for_user(
-                current_user.user_id,
-                limit=limit,
-                offset=offset,
-                search=search,
-                start_timestamp=start_timestamp,
-                end_timestamp=end_timestamp,
-            )
-            return list(sessions)
+            """List research sessions belonging to the authenticated user.
+
+            Pass the ``X-Next-Cursor`` response header back as ``cursor`` to
+            fetch the next page; ``offset`` remains for older clients.
+            """
+            try:
+                sessions: Iterable[ResearchSession] = await self.session_store.list_for_user(
+                    current_user.user_id,
+                    limit=limit,
+                    offset=offset,
+                    search=search,
+                    start_timestamp=start_timestamp,
+                    end_timestamp=end_timestamp,
+                    cursor=cursor,
+                )
+            except ValueError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from exc
+            sessions = list(sessions)
+            if len(sessions) == limit:
+                response.headers[NEXT_CURSOR_HEADER] = SessionCursor.after(sessions[-1]).encode()
+            return sessions
+
+        @self.get("/search", response_model=list[SessionSearchResult])
+        async def search_sessions(
+            q: str = Query(..., min_length=1),
+            limit: int = Query(20, ge=1, le=100),
+            current_user: User = Depends(self._get_current_user),
+        ) -> list[SessionSearchResult]:
+            """Rank the user's sessions by relevance of prompts, sources and messages."""
+            hits = await self.history_search.search(current_user.user_id, q, limit=limit)
+            sessions = {
+                session.session_id: session
+                for session in await self.session_store.get_many(
+                    current_user.user_id, [hit.session_id for hit in hits]
+                )
+            }
+            return [
+                SessionSearchResult(session=sessions[hit.session_id], score=hit.score)
+                for hit in hits
+                if hit.session_id in sessions
+            ]
 
         @self.get("/{session_id}", response_model=ResearchSession)
         async def get_session(
@@ -117,6 +179,17 @@ class SessionRouter(APIRouterBase):
             """Fetch a session by ID if it belongs to the user."""
             return await self._get_user_session(session_id, current_user)
 
+        @self.get("/{session_id}/full", response_model=SessionDetail)
+        async def get_session_detail(
+            session_id: str,
+            current_user: User = Depends(self._get_current_user),
+        ) -> SessionDetail:
+            """Return a session with its sources, messages and infographic."""
+            detail = await self.detail_store.get_for_user(session_id, current_user.user_id)
+            if detail is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            return detail
+
         @self.delete("/{session_id}")
         async def delete_session(
             session_id: str,
@@ -125,6 +198,7 @@ class SessionRouter(APIRouterBase):
             """Delete a session that belongs to the calling user."""
             await self._get_user_session(session_id, current_user)
             await self.session_store.delete(session_id)
+            await self.history_search.remove_session(session_id)
             return {"success": True}
 
         @self.post("/{session_id}/messages", response_model=Message, status_code=201)
@@ -134,15 +208,24 @@ class SessionRouter(APIRouterBase):
             current_user: User = Depends(self._get_current_user),
         ) -> Message:
             """Store a chat message for a session the user owns."""
-            await self._get_user_session(session_id, current_user)
+            session = await self._get_user_session(session_id, current_user)
             message_payload = payload.model_copy(update={"session_id": session_id})
-            return await self.message_store.create(message_payload)
+            message = await self.message_store.create(message_payload)
+            await self.history_search.index_message(session, message)
+            return message
 
         @self.get("/{session_id}/messages", response_model=list[Message])
         async def list_messages(
             session_id: str,
+            request: Request,
             current_user: User = Depends(self._get_current_user),
-        ) -> list[Message]:
-            """Return chat messages for a user's session."""
+        ) -> list[Message] | Response:
+            """Return chat messages for a user's session.
+
+            With ``Accept: application/x-ndjson`` the messages are streamed
+            one per line as they are read from the store.
+            """
             await self._get_user_session(session_id, current_user)
+            if self.wants_ndjson(request):
+                return self.ndjson_response(self.message_store.iter_for_session(session_id))
             return await self.message_store.list_for_session(session_id)
@@ -1,6 +1,12 @@
 """Base API router for the Infograph service."""
 
+from typing import AsyncIterator, Sequence
+
 from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 
 class APIRouterBase(APIRouter):
@@ -13,3 +19,18 @@ class APIRouterBase(APIRouter):
         """Extract the preferred locale from the request."""
         accept_language = request.headers.get("accept-language", "en-US")
         return accept_language.split(",")[0].strip()
+
+    @staticmethod
+    def wants_ndjson(request: Request) -> bool:
+        """True when the client asked for newline-delimited JSON."""
+        return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+    @staticmethod
+    def ndjson_response(chunks: AsyncIterator[Sequence[BaseModel]]) -> StreamingResponse:
+        """Stream model chunks as NDJSON, one object per line, as they arrive."""
+
+        async def body() -> AsyncIterator[bytes]:
+            async for chunk in chunks:
+                yield "".join(item.model_dump_json() + "\n" for item in chunk).encode()
+
+        return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
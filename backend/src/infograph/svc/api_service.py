@@ -1,13 +1,48 @@
 """FastAPI application factory for the Infograph service."""
 
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from infograph.stores.abstract_store_registry import AbstractStoreRegistry
+from infograph.stores.store_registry import create_store_registry
 from infograph.svc.api.v1.api import ServiceAPIRouter
+from infograph.svc.api.v1.routers.session_router import NEXT_CURSOR_HEADER
+from infograph.svc.auth_middleware import AuthMiddleware
+
+if TYPE_CHECKING:
+    from leettools.settings import SystemSettings
+
+API_PREFIX = "/api/v1"
+
+
+def create_app(
+    settings: SystemSettings | None = None,
+    stores: AbstractStoreRegistry | None = None,
+    store_backend: str | None = None,
+) -> FastAPI:
+    """Create and configure the FastAPI application.
 
+    ``store_backend`` is ``"duckdb"``, ``"memory"`` or ``"rpc"``; it defaults to the
+    ``INFOGRAPH_STORE_BACKEND`` environment variable, then DuckDB.
+    """
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Fetched and refreshed in the background so sign-ins never wait on Google.
+        key_store = app.state.auth_service.key_store
+        if key_store is not None:
+            await key_store.start()
+        try:
+            yield
+        finally:
+            if key_store is not None:
+                await key_store.aclose()
+        await app.state.stores.aclose()
 
     app = FastAPI(
         title="Infograph Service",
@@ -16,17 +51,30 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/v1/openapi.json",
+        lifespan=lifespan,
     )
 
+    # One registry per app: every router shares the same clients and stores.
+    app.state.stores = stores or create_store_registry(store_backend, settings)
+
+    api_router = ServiceAPIRouter(stores=app.state.stores)
+    app.include_router(api_router, prefix=API_PREFIX)
+    app.state.auth_service = api_router.auth_service
+
+    app.add_middleware(
+        AuthMiddleware,
+        auth_service=api_router.auth_service,
+        protected_prefixes=[API_PREFIX + prefix for prefix in api_router.protected_prefixes],
+    )
+    # Added last so it wraps authentication and 401 responses carry CORS headers.
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
         allow_methods=["*"],
         allow_headers=["*"],
         allow_credentials=True,
+        # Browsers hide non-safelisted response headers from cross-origin scripts.
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
-    api_router = ServiceAPIRouter()
-    app.include_router(api_router, prefix="/api/v1")
-
     return app
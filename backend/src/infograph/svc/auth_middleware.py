@@ -0,0 +1,91 @@
+"""Bearer-token authentication shared by every router."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from fastapi import HTTPException, Request
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infograph.core.schemas import User
+from infograph.services.auth_service import AuthService
+
+
+def bearer_token(authorization: str | None) -> str:
+    """The token of a ``Bearer <token>`` Authorization header."""
+    if not authorization:
+        raise HTTPException(status_code=401, detail="Missing Authorization header")
+
+    parts = authorization.strip().split()
+    if len(parts) != 2 or parts[0].lower() != "bearer":
+        raise HTTPException(status_code=401, detail="Invalid Authorization header")
+
+    return parts[1]
+
+
+async def authenticate(auth_service: AuthService, authorization: str | None) -> User:
+    """Resolve an Authorization header to its user, or raise a 401."""
+    token = bearer_token(authorization)
+    try:
+        return await auth_service.get_user_from_token(token)
+    except ValueError as exc:
+        raise HTTPException(status_code=401, detail=str(exc)) from exc
+
+
+async def request_user(request: Request, auth_service: AuthService) -> User:
+    """The user AuthMiddleware resolved for ``request``.
+
+    Routers mounted without the middleware, as in the router tests, resolve
+    the user here instead, once per request.
+    """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        user = await authenticate(auth_service, request.headers.get("authorization"))
+        request.state.user = user
+    return user
+
+
+class AuthMiddleware:
+    """Authenticate requests under ``protected_prefixes`` before they are routed.
+
+    The user is resolved once and put in ``request.state.user``. Requests
+    with a missing or bad token get a 401 before their body is read or any
+    dependency runs.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        auth_service: AuthService,
+        protected_prefixes: Sequence[str],
+    ) -> None:
+        self.app = app
+        self.auth_service = auth_service
+        self.protected_prefixes = tuple(protected_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith(self.protected_prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            user = await authenticate(
+                self.auth_service, Headers(scope=scope).get("authorization")
+            )
+        except HTTPException as exc:
+            response = JSONResponse({"detail": exc.detail}, status_code=exc.status_code)
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["user"] = user
+        await self.app(scope, receive, send)
+
+
+__all__ = ["AuthMiddleware", "authenticate", "bearer_token", "request_user"]
@@ -2,18 +2,303 @@
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import click
-import uvicorn
 
-from infograph.svc.api_service import create_app
+from infograph.stores.store_registry import STORE_BACKENDS, create_store_registry
+
+if TYPE_CHECKING:
+    from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+    from infograph.stores.duckdb.store_registry_sharded_duckdb import StoreRegistryShardedDuckDB
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--host", default="0.0.0.0", show_default=True, help="Host to bind the server to.")
 @click.option("--port", default=8000, show_default=True, type=int, help="Port to bind the server to.")
 @click.option("--log-level", default="info", show_default=True, help="Uvicorn log level.")
-def main(host: str, port: int, log_level: str) -> None:
+@click.option(
+    "--store-backend",
+    type=click.Choice(STORE_BACKENDS),
+    default=None,
+    help="Storage backend. Defaults to INFOGRAPH_STORE_BACKEND, then duckdb.",
+)
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="API worker processes. More than one starts a store server that owns the database.",
+)
+@click.option(
+    "--store-socket",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket of the store server. Defaults to INFOGRAPH_STORE_SOCKET, "
+    "then a file in the temp directory.",
+)
+@click.pass_context
+def main(
+    ctx: click.Context,
+    host: str,
+    port: int,
+    log_level: str,
+    store_backend: str | None,
+    workers: int,
+    store_socket: Path | None,
+) -> None:
     """Start the Infograph FastAPI service."""
 
-    app = create_app()
-    uvicorn.run(app, host=host, port=port, log_level=log_level)
+    if ctx.invoked_subcommand is not None:
+        return
+
+    # Imported here so subcommands and --help skip uvicorn and the app modules.
+    import uvicorn
+
+    from infograph.svc.api_service import create_app
+
+    if workers == 1:
+        app = create_app(store_backend=store_backend)
+        uvicorn.run(app, host=host, port=port, log_level=log_level)
+        return
+
+    from infograph.stores.rpc.store_server import run_store_server, wait_for_socket
+
+    backend = store_backend or os.environ.get("INFOGRAPH_STORE_BACKEND") or "duckdb"
+    if backend == "rpc":
+        raise click.UsageError("--workers starts its own store server; use a local backend")
+    socket_path = _store_socket_path(store_socket)
+    server = multiprocessing.get_context("spawn").Process(
+        target=run_store_server, args=(socket_path, backend), name="infograph-store-server"
+    )
+    server.start()
+    try:
+        try:
+            wait_for_socket(socket_path, process=server)
+        except RuntimeError as exc:
+            raise click.ClickException(str(exc)) from exc
+        # Workers are separate processes that build their app from the environment.
+        os.environ["INFOGRAPH_STORE_BACKEND"] = "rpc"
+        os.environ["INFOGRAPH_STORE_SOCKET"] = str(socket_path)
+        uvicorn.run(
+            "infograph.svc.api_service:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            log_level=log_level,
+            workers=workers,
+        )
+    finally:
+        server.terminate()
+        server.join()
+
+
+def _store_socket_path(store_socket: Path | None) -> Path:
+    if store_socket is not None:
+        return store_socket
+    if env_path := os.environ.get("INFOGRAPH_STORE_SOCKET"):
+        return Path(env_path)
+    return Path(tempfile.gettempdir()) / f"infograph-stores-{os.getpid()}.sock"
+
+
+@main.command("store-server")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix socket to listen on. Defaults to INFOGRAPH_STORE_SOCKET.",
+)
+@click.option(
+    "--store-backend",
+    type=click.Choice([backend for backend in STORE_BACKENDS if backend != "rpc"]),
+    default=None,
+    help="Backend the server owns. Defaults to INFOGRAPH_STORE_BACKEND, then duckdb.",
+)
+def store_server(socket_path: Path | None, store_backend: str | None) -> None:
+    """Own the stores and serve them to API workers started with the rpc backend."""
+
+    from infograph.stores.rpc.store_server import run_store_server
+
+    run_store_server(_store_socket_path(socket_path), store_backend)
+
+
+@main.command()
+@click.option(
+    "--retention-days",
+    type=int,
+    default=None,
+    help="Purge sessions older than this many days. Defaults to INFOGRAPH_RETENTION_DAYS; "
+    "unset keeps sessions forever.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Sessions deleted per transaction. Defaults to INFOGRAPH_PURGE_BATCH_SIZE or 500.",
+)
+def purge(retention_days: int | None, batch_size: int | None) -> None:
+    """Remove data of deleted/expired sessions and orphaned images, then checkpoint."""
+
+    from infograph.services.infographic_service import infographic_output_dir
+    from infograph.services.purge_service import PurgeService, RetentionPolicy
+    from infograph.stores.duckdb.store_registry_sharded_duckdb import (
+        StoreRegistryShardedDuckDB,
+    )
+
+    policy = RetentionPolicy.from_env()
+    if retention_days is not None:
+        policy.retention_days = retention_days
+    if batch_size is not None:
+        policy.batch_size = batch_size
+
+    stores = _duckdb_registry()
+    try:
+        maintenance = [shard.maintenance_store for shard in stores.shards]
+        directory = None
+        if isinstance(stores, StoreRegistryShardedDuckDB):
+            # Sessions not yet moved by import_unsharded still live in the core database.
+            maintenance.append(stores.home.maintenance_store)
+            directory = stores.directory
+        service = PurgeService(
+            maintenance,
+            infographic_output_dir(stores.settings),
+            policy,
+            directory=directory,
+        )
+        report = asyncio.run(service.run())
+    finally:
+        stores.close()
+
+    click.echo(
+        f"Purged {report.expired_sessions} expired and {report.orphaned_sessions} orphaned "
+        f"sessions ({report.rows_deleted} rows), removed {report.files_deleted} files "
+        f"({report.bytes_freed} bytes) and {report.batches_deleted} archive batches."
+    )
+
+
+@main.command()
+@click.option("--user-id", required=True, help="User whose history is exported.")
+@click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["parquet", "ndjson"]),
+    default="parquet",
+    show_default=True,
+)
+@click.option(
+    "--output",
+    type=click.Path(file_okay=False, path_type=Path),
+    required=True,
+    help="Directory that receives one file per table.",
+)
+def export(user_id: str, fmt: str, output: Path) -> None:
+    """Export a user's sessions, sources, messages and infographics."""
+
+    stores = _duckdb_registry()
+    try:
+        paths = asyncio.run(stores.export_store.copy_to(user_id, output, fmt))
+    finally:
+        stores.close()
+
+    for path in paths:
+        click.echo(str(path))
+
+
+@main.command()
+@click.option(
+    "--older-than-days",
+    type=int,
+    default=None,
+    help="Archive sessions older than this many days. Defaults to INFOGRAPH_ARCHIVE_AFTER_DAYS.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Sessions per Parquet batch. Defaults to INFOGRAPH_ARCHIVE_BATCH_SIZE or 5000.",
+)
+def archive(older_than_days: int | None, batch_size: int | None) -> None:
+    """Move old sessions and everything they own into Parquet archives."""
+
+    from infograph.services.archive_service import ArchivePolicy, ArchiveService
+
+    policy = ArchivePolicy.from_env()
+    if older_than_days is not None:
+        policy.archive_after_days = older_than_days
+    if batch_size is not None:
+        policy.batch_size = batch_size
+    if policy.archive_after_days is None:
+        raise click.UsageError("Pass --older-than-days or set INFOGRAPH_ARCHIVE_AFTER_DAYS")
+
+    stores = _duckdb_registry()
+    try:
+        service = ArchiveService([shard.maintenance_store for shard in stores.shards], policy)
+        report = asyncio.run(service.run())
+    finally:
+        stores.close()
+
+    click.echo(
+        f"Archived {report.sessions_archived} sessions ({report.rows_archived} rows) "
+        f"in {report.batches_written} batches."
+    )
+
+
+@main.command("rebalance-shards")
+@click.option("--user-id", default=None, help="Move only this user.")
+@click.option("--to-shard", type=int, default=None, help="Target shard for --user-id.")
+@click.option(
+    "--import-unsharded",
+    is_flag=True,
+    help="First move data from the unsharded core database into the shards.",
+)
+def rebalance_shards(user_id: str | None, to_shard: int | None, import_unsharded: bool) -> None:
+    """Move users to the shard INFOGRAPH_DUCKDB_SHARDS assigns them. Stop the API first."""
+
+    from infograph.services.shard_rebalance_service import ShardRebalanceService
+    from infograph.stores.duckdb.store_registry_sharded_duckdb import (
+        StoreRegistryShardedDuckDB,
+    )
+
+    if (user_id is None) != (to_shard is None):
+        raise click.UsageError("--user-id and --to-shard must be given together")
+    stores = _duckdb_registry()
+    if not isinstance(stores, StoreRegistryShardedDuckDB):
+        stores.close()
+        raise click.UsageError("Set INFOGRAPH_DUCKDB_SHARDS above 1 to enable sharding")
+
+    service = ShardRebalanceService(stores)
+
+    async def _run() -> None:
+        try:
+            if import_unsharded:
+                imported = await service.import_unsharded()
+                click.echo(
+                    f"Imported {imported.users_imported} users ({imported.rows_moved} rows)."
+                )
+            if user_id is not None and to_shard is not None:
+                rows = await service.move_user(user_id, to_shard)
+                click.echo(f"Moved user {user_id} to shard {to_shard} ({rows} rows).")
+                return
+            report = await service.run()
+            click.echo(
+                f"Moved {report.users_moved} users ({report.rows_moved} rows), deleted "
+                f"{report.stray_rows_deleted} stray rows."
+            )
+        finally:
+            await stores.aclose()
+
+    asyncio.run(_run())
+
+
+def _duckdb_registry() -> StoreRegistryDuckDB | StoreRegistryShardedDuckDB:
+    return create_store_registry("duckdb")  # type: ignore[return-value]
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import sys
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
@@ -22,6 +23,9 @@ SRC_DIR = ROOT_DIR / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
+from infograph.core.schemas import User  # noqa: E402
+from infograph.stores.memory.user_store_memory import UserStoreMemory  # noqa: E402
+
 
 @pytest.fixture
 def duckdb_settings(tmp_path: Path) -> SystemSettings:
@@ -31,3 +35,36 @@ def duckdb_settings(tmp_path: Path) -> SystemSettings:
     settings.LOG_ROOT = str(tmp_path / "logs")
     settings.DUCKDB_PATH = str(tmp_path / "duckdb")
     return settings
+
+
+class CountingUserStore(UserStoreMemory):
+    """In-memory user store that counts ``get`` calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    async def get(self, user_id: str) -> User | None:
+        self.gets += 1
+        return await super().get(user_id)
+
+
+class FakeClock:
+    """A ``clock=`` callable that only moves when a test sets ``now``."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def fake_clock() -> Callable[..., FakeClock]:
+    """Factory for clocks starting at the given time, zero by default."""
+    return FakeClock
+
+
+@pytest.fixture
+def counting_user_store() -> CountingUserStore:
+    return CountingUserStore()
@@ -0,0 +1,86 @@
+"""Tests for the request-scoped authentication middleware."""
+
+from __future__ import annotations
+
+import asyncio
+
+from fastapi.testclient import TestClient
+import jwt
+import pytest
+
+from infograph.core.schemas import User, UserCreate
+from infograph.stores.memory.store_registry_memory import StoreRegistryMemory
+from infograph.svc.api_service import create_app
+
+SESSIONS = "/api/v1/api/v1/sessions"
+
+
+@pytest.fixture
+def app_and_users(monkeypatch, counting_user_store):
+    monkeypatch.setenv("INFOGRAPH_TOKEN_CACHE_SIZE", "0")
+    stores = StoreRegistryMemory()
+    stores._user_store = counting_user_store
+    app = create_app(stores=stores)
+    return app, stores._user_store
+
+
+def _token(app, user: User) -> str:
+    settings = app.state.auth_service.settings
+    payload = {"user_id": user.user_id, "exp": 4_102_444_800}
+    return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
+
+
+def test_requests_without_a_valid_token_are_rejected_before_the_body_is_parsed(app_and_users):
+    app, user_store = app_and_users
+    client = TestClient(app)
+
+    missing = client.post(SESSIONS, content=b"{not json")
+    invalid = client.post(SESSIONS, content=b"{not json", headers={"Authorization": "Token x"})
+    malformed = client.get(SESSIONS, headers={"Authorization": "Bearer not-a-jwt"})
+
+    assert (missing.status_code, missing.json()) == (
+        401,
+        {"detail": "Missing Authorization header"},
+    )
+    assert (invalid.status_code, invalid.json()) == (
+        401,
+        {"detail": "Invalid Authorization header"},
+    )
+    assert malformed.status_code == 401
+    assert client.get("/api/v1/health").status_code == 200
+    assert user_store.gets == 0
+
+
+def test_the_user_is_resolved_once_per_request(app_and_users):
+    app, user_store = app_and_users
+    user = asyncio.run(
+        user_store.create(UserCreate(email="user@example.com", name="User", google_id="g-1"))
+    )
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {_token(app, user)}"}
+
+    created = client.post(SESSIONS, json={"prompt": "Solar"}, headers=headers)
+    me = client.get("/api/v1/api/v1/auth/me", headers=headers)
+
+    assert created.status_code == 201
+    assert me.json()["user_id"] == user.user_id
+    assert user_store.gets == 2
+
+
+def test_cross_origin_clients_can_read_the_next_page_cursor(app_and_users):
+    app, user_store = app_and_users
+    user = asyncio.run(
+        user_store.create(UserCreate(email="user@example.com", name="User", google_id="g-1"))
+    )
+    client = TestClient(app)
+    headers = {
+        "Authorization": f"Bearer {_token(app, user)}",
+        "Origin": "https://app.example.com",
+    }
+    for prompt in ("Solar", "Wind"):
+        client.post(SESSIONS, json={"prompt": prompt}, headers=headers)
+
+    page = client.get(SESSIONS, params={"limit": 1}, headers=headers)
+
+    assert page.headers["X-Next-Cursor"]
+    assert "X-Next-Cursor" in page.headers["Access-Control-Expose-Headers"]
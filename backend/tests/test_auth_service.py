@@ -0,0 +1,116 @@
+"""Tests for concurrent sign-ins in AuthService."""
+
+from __future__ import annotations
+
+import asyncio
+
+import jwt
+import pytest
+
+from infograph.core.schemas import User
+from infograph.services.auth_service import USER_SNAPSHOT_CLAIM, AuthService, AuthSettings
+from infograph.stores.abstract_user_store import AbstractUserStore
+from infograph.stores.memory.user_store_memory import UserStoreMemory
+
+
+class SlowUserStore(UserStoreMemory):
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_by_google_id(self, google_id: str) -> User | None:
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        return await super().get_by_google_id(google_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sign_ins_share_one_lookup_and_one_user():
+    def fake_token_verifier(credential: str, audience: str) -> dict[str, str]:
+        return {"email": "user@example.com", "name": "User", "sub": f"google-{credential}"}
+
+    user_store = SlowUserStore()
+    auth_service = AuthService(
+        user_store,
+        token_verifier=fake_token_verifier,
+        settings=AuthSettings(jwt_secret="test-secret", google_client_id="test-client"),
+    )
+
+    results = await asyncio.gather(
+        *(auth_service.authenticate("a") for _ in range(5)), auth_service.authenticate("b")
+    )
+
+    assert len({user.user_id for user, _ in results[:5]}) == 1
+    assert len(await user_store.list()) == 2
+    # One lookup per account, plus one by upsert_by_google_id for each new user.
+    assert user_store.lookups == 4
+    await auth_service.authenticate("a")
+    assert user_store.lookups == 5
+
+
+def _snapshot_auth_service(user_store: AbstractUserStore) -> AuthService:
+    def fake_token_verifier(credential: str, audience: str) -> dict[str, str]:
+        return {"email": "user@example.com", "name": "User", "sub": "google-123"}
+
+    return AuthService(
+        user_store,
+        token_verifier=fake_token_verifier,
+        settings=AuthSettings(
+            jwt_secret="test-secret", google_client_id="test-client", user_snapshot_claims=True
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokens_with_a_user_snapshot_skip_the_store_until_it_is_stale(
+    monkeypatch, counting_user_store
+):
+    monkeypatch.setenv("INFOGRAPH_TOKEN_CACHE_SIZE", "0")
+    user_store = counting_user_store
+    auth_service = _snapshot_auth_service(user_store)
+    user, token = await auth_service.authenticate("credential")
+
+    snapshot = jwt.decode(token, options={"verify_signature": False})[USER_SNAPSHOT_CLAIM]
+    assert set(snapshot) == {"v", "email", "name", "profile_version"}
+    resolved = await auth_service.get_user_from_token(token)
+    assert (resolved.user_id, resolved.name) == (user.user_id, user.name)
+    assert user_store.gets == 0
+
+    # Without a version, the next request reads the store and trusts snapshots again.
+    auth_service.invalidate_user(user.user_id)
+    await auth_service.get_user_from_token(token)
+    await auth_service.get_user_from_token(token)
+    assert user_store.gets == 1
+
+    # An update through the store makes older snapshots stale, with no manual invalidation.
+    await auth_service.user_store.update(user.model_copy(update={"name": "Renamed"}))
+    assert (await auth_service.get_user_from_token(token)).name == "Renamed"
+    assert user_store.gets == 2
+
+    _, fresh_token = await auth_service.authenticate("credential")
+    assert (await auth_service.get_user_from_token(fresh_token)).name == "Renamed"
+    assert user_store.gets == 2
+
+    await auth_service.user_store.delete(user.user_id)
+    with pytest.raises(ValueError):
+        await auth_service.get_user_from_token(fresh_token)
+
+
+@pytest.mark.asyncio
+async def test_other_processes_check_snapshots_against_the_stored_version(
+    monkeypatch, counting_user_store
+):
+    monkeypatch.setenv("INFOGRAPH_TOKEN_CACHE_SIZE", "0")
+    user_store = counting_user_store
+    user, token = await _snapshot_auth_service(user_store).authenticate("credential")
+    await user_store.update(user.model_copy(update={"name": "Renamed"}))
+
+    # A restarted or second worker has never seen the update.
+    other_worker = _snapshot_auth_service(user_store)
+    assert (await other_worker.get_user_from_token(token)).name == "Renamed"
+    assert (await other_worker.get_user_from_token(token)).name == "Renamed"
+    assert user_store.gets == 2
+
+    await user_store.delete(user.user_id)
+    with pytest.raises(ValueError):
+        await _snapshot_auth_service(user_store).get_user_from_token(token)
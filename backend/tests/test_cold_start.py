@@ -0,0 +1,49 @@
+"""Cold-start guards: lazy imports and the tracked startup budget."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+BENCH = ROOT_DIR / "benchmarks" / "bench_cold_start.py"
+
+HEAVY_MODULES = ["jwt", "google.auth", "PIL", "uvicorn", "duckdb"]
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT_DIR / "src"), env.get("PYTHONPATH")])
+    )
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+
+
+def test_importing_the_app_skips_heavy_dependencies() -> None:
+    result = _python(
+        "-c",
+        "import json, sys; import infograph.svc.api_service; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))",
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+# Wall-clock timings depend on the machine and its load, so the budget check
+# only runs when asked for, e.g. on the benchmark CI job.
+@pytest.mark.skipif(
+    os.environ.get("INFOGRAPH_BENCH_COLD_START") != "1",
+    reason="set INFOGRAPH_BENCH_COLD_START=1 to check the cold-start budget",
+)
+def test_cold_start_is_within_budget() -> None:
+    result = _python(str(BENCH), "--runs", "3", "--check")
+
+    assert result.returncode == 0, result.stdout + result.stderr
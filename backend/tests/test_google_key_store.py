@@ -0,0 +1,166 @@
+"""Tests for local verification of Google ID tokens against cached signing keys."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+import pytest
+
+from infograph.services.auth_service import AuthService, AuthSettings
+from infograph.services.google_key_store import GoogleKeyStore, SigningKeys, cache_max_age
+from infograph.stores.memory.user_store_memory import UserStoreMemory
+
+AUDIENCE = "test-client"
+
+
+class SigningKey:
+    def __init__(self, key_id: str) -> None:
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.key_id = key_id
+        self.public_pem = (
+            private_key.public_key()
+            .public_bytes(
+                serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+            .decode()
+        )
+        self.signer = crypt.RSASigner.from_string(
+            private_key.private_bytes(
+                serialization.Encoding.PEM,
+                serialization.PrivateFormat.PKCS8,
+                serialization.NoEncryption(),
+            ),
+            key_id,
+        )
+
+    def sign(self, **claims: object) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": AUDIENCE,
+            "sub": "google-123",
+            "email": "user@example.com",
+            "name": "User",
+            "iat": now,
+            "exp": now + 3600,
+            **claims,
+        }
+        return google_jwt.encode(self.signer, payload).decode()
+
+
+class LocalKeySource:
+    def __init__(self, *keys: SigningKey, max_age_seconds: float = 1000.0) -> None:
+        self.keys = list(keys)
+        self.max_age_seconds = max_age_seconds
+        self.fetches = 0
+        self.fail = False
+
+    def fetch(self) -> SigningKeys:
+        self.fetches += 1
+        if self.fail:
+            raise OSError("certificate endpoint unreachable")
+        return SigningKeys({key.key_id: key.public_pem for key in self.keys}, self.max_age_seconds)
+
+
+@pytest.fixture(scope="module")
+def signing_key() -> SigningKey:
+    return SigningKey("key-1")
+
+
+@pytest.mark.asyncio
+async def test_sign_ins_are_verified_with_keys_fetched_once(signing_key):
+    source = LocalKeySource(signing_key)
+    auth_service = AuthService(
+        UserStoreMemory(),
+        settings=AuthSettings(jwt_secret="test-secret", google_client_id=AUDIENCE),
+        key_store=GoogleKeyStore(source),
+    )
+
+    for _ in range(3):
+        user, token = await auth_service.authenticate(signing_key.sign())
+        assert user.google_id == "google-123" and token
+
+    assert source.fetches == 1
+    with pytest.raises(ValueError):
+        await auth_service.authenticate(signing_key.sign(aud="another-client"))
+    with pytest.raises(ValueError):
+        await auth_service.authenticate(signing_key.sign(iss="https://evil.example.com"))
+    with pytest.raises(ValueError):
+        await auth_service.authenticate(SigningKey("key-1").sign())
+
+
+@pytest.mark.asyncio
+async def test_keys_refresh_in_the_background_before_they_expire(signing_key, fake_clock):
+    clock = fake_clock()
+    source = LocalKeySource(signing_key)
+    key_store = GoogleKeyStore(source, clock=clock)
+    await key_store.verify(signing_key.sign(), AUDIENCE)
+
+    clock.now = 850.0
+    await key_store.verify(signing_key.sign(), AUDIENCE)
+    await key_store._background
+    assert source.fetches == 2
+    assert key_store.stats().expires_in_seconds == 1000.0
+
+    source.fail = True
+    clock.now = 2000.0
+    await key_store.verify(signing_key.sign(), AUDIENCE)
+    await key_store.verify(signing_key.sign(), AUDIENCE)
+    assert (source.fetches, key_store.stats().failures) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_unknown_key_ids_pick_up_rotated_keys(signing_key, fake_clock):
+    clock = fake_clock()
+    source = LocalKeySource(signing_key)
+    key_store = GoogleKeyStore(source, clock=clock, min_refresh_interval_seconds=60.0)
+    await key_store.verify(signing_key.sign(), AUDIENCE)
+
+    rotated = SigningKey("key-2")
+    source.keys.append(rotated)
+    with pytest.raises(ValueError):
+        await key_store.verify(rotated.sign(), AUDIENCE)
+    assert source.fetches == 1
+
+    clock.now = 60.0
+    assert (await key_store.verify(rotated.sign(), AUDIENCE))["sub"] == "google-123"
+    assert source.fetches == 2
+
+
+def test_cache_max_age_follows_the_response_headers():
+    assert cache_max_age("public, max-age=19137, must-revalidate, no-transform") == 19137
+    assert cache_max_age("public, max-age=19137", age="137") == 19000
+    assert cache_max_age("no-cache, no-store") == 0
+
+
+@pytest.mark.asyncio
+async def test_started_key_stores_prefetch_and_refresh_on_a_schedule(signing_key, fake_clock):
+    clock = fake_clock()
+    source = LocalKeySource(signing_key)
+    source.fail = True
+    delays: list[float] = []
+    parked = asyncio.Event()
+
+    async def sleep(seconds: float) -> None:
+        delays.append(seconds)
+        clock.now += seconds
+        source.fail = False
+        if len(delays) == 3:
+            parked.set()
+            await asyncio.Event().wait()
+
+    key_store = GoogleKeyStore(source, clock=clock, sleep=sleep)
+    await key_store.start()
+    await asyncio.wait_for(parked.wait(), timeout=5)
+    await key_store.aclose()
+
+    # A failed prefetch is retried after the minimum interval, then keys are
+    # refreshed once refresh_ahead of their max-age has passed.
+    assert source.fetches == 3
+    assert delays == [60.0, 800.0, 800.0]
+    assert key_store.stats().key_count == 1
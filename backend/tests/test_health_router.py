@@ -12,3 +12,11 @@ def test_health_endpoint_returns_ok() -> None:
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok", "version": "1.0.0"}
+
+
+def test_memory_backend_app_serves_health_without_duckdb() -> None:
+    with TestClient(create_app(store_backend="memory")) as memory_client:
+        response = memory_client.get("/api/v1/health/db")
+
+    assert response.status_code == 200
+    assert response.json() == {"executors": {}, "caches": {}}
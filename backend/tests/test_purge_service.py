@@ -0,0 +1,108 @@
+"""Tests for the retention purge."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from infograph.core.schemas import (
+    InfographicCreate,
+    MessageCreate,
+    ResearchSessionCreate,
+    SourceCreate,
+)
+from infograph.services.purge_service import DAY_MS, PurgeService, RetentionPolicy
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+from infograph.stores.duckdb.store_registry_sharded_duckdb import StoreRegistryShardedDuckDB
+
+
+async def _populate(stores: StoreRegistryDuckDB, prompt: str, image_path: str) -> str:
+    session = await stores.session_store.create(ResearchSessionCreate(prompt=prompt), "user-1")
+    await stores.source_store.create(
+        SourceCreate(
+            session_id=session.session_id,
+            title="Source",
+            url="https://example.com",
+            snippet="Snippet",
+            confidence=0.9,
+        )
+    )
+    await stores.message_store.create(
+        MessageCreate(session_id=session.session_id, role="user", content="Hi")
+    )
+    await stores.infographic_store.create(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            image_path=image_path,
+            layout_data={},
+        )
+    )
+    return session.session_id
+
+
+@pytest.mark.asyncio
+async def test_purge_removes_deleted_sessions_and_orphaned_files(duckdb_settings, tmp_path):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    output_dir = tmp_path / "infographics"
+    output_dir.mkdir()
+    kept_image = output_dir / "infographic-1.png"
+    orphan_image = output_dir / "infographic-2.png"
+    for path in (kept_image, orphan_image):
+        path.write_bytes(b"png")
+        os.utime(path, (0, 0))
+
+    kept_id = await _populate(stores, "kept", str(kept_image))
+    deleted_id = await _populate(stores, "deleted", str(orphan_image))
+    await stores.session_store.delete(deleted_id)
+
+    service = PurgeService(
+        stores.maintenance_store, output_dir, RetentionPolicy(batch_size=1)
+    )
+    report = await service.run()
+
+    assert report.orphaned_sessions == 1
+    assert report.expired_sessions == 0
+    assert report.files_deleted == 1
+    assert kept_image.exists()
+    assert not orphan_image.exists()
+    assert await stores.source_store.list_for_session(deleted_id) == []
+    assert await stores.message_store.list_for_session(deleted_id) == []
+    assert await stores.infographic_store.get_for_session(deleted_id) is None
+    assert len(await stores.source_store.list_for_session(kept_id)) == 1
+
+    future = (await stores.session_store.get(kept_id)).created_at + 2 * DAY_MS
+    expired = await PurgeService(
+        stores.maintenance_store, output_dir, RetentionPolicy(retention_days=1)
+    ).run(now_ms=future)
+
+    assert expired.expired_sessions == 1
+    assert await stores.session_store.get(kept_id) is None
+    assert await stores.message_store.list_for_session(kept_id) == []
+    assert not kept_image.exists()
+
+
+@pytest.mark.asyncio
+async def test_sharded_purge_removes_expired_sessions_from_the_directory(
+    duckdb_settings, tmp_path
+):
+    stores = StoreRegistryShardedDuckDB(duckdb_settings, shard_count=2)
+    try:
+        session = await stores.session_store.create(ResearchSessionCreate(prompt="old"), "user-1")
+        # Warm the directory cache, as routing any request for the session would.
+        assert await stores.directory.user_for_session(session.session_id) == "user-1"
+
+        report = await PurgeService(
+            [shard.maintenance_store for shard in stores.shards],
+            tmp_path,
+            RetentionPolicy(retention_days=1),
+            directory=stores.directory,
+        ).run(now_ms=session.created_at + 2 * DAY_MS)
+
+        assert report.expired_sessions == 1
+        assert await stores.directory.user_for_session(session.session_id) is None
+        assert await stores.directory.sessions.find_all(trusted=True) == []
+        assert await stores.session_store.get(session.session_id) is None
+    finally:
+        await stores.aclose()
@@ -172,3 +172,88 @@ def test_delete_session_removes_session(session_context):
 
     assert get_response.status_code == 404
     assert get_response.json()["detail"] == "Session not found"
+
+
+def test_list_sessions_cursor_pagination(session_context):
+    client = session_context["client"]
+    token = session_context["token"]
+
+    for idx in range(3):
+        client.post(
+            "/api/v1/sessions",
+            json={"prompt": f"Topic {idx}"},
+            headers=_auth_headers(token),
+        )
+
+    first = client.get("/api/v1/sessions?limit=2", headers=_auth_headers(token))
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    next_cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get(
+        "/api/v1/sessions",
+        params={"limit": 2, "cursor": next_cursor},
+        headers=_auth_headers(token),
+    )
+    assert second.status_code == 200
+    assert len(second.json()) == 1
+    assert "X-Next-Cursor" not in second.headers
+
+    ids = {session["session_id"] for session in first.json() + second.json()}
+    assert len(ids) == 3
+
+    invalid = client.get(
+        "/api/v1/sessions",
+        params={"cursor": "garbage"},
+        headers=_auth_headers(token),
+    )
+    assert invalid.status_code == 400
+
+
+def test_search_sessions_ranks_matching_sessions(session_context):
+    client = session_context["client"]
+    token = session_context["token"]
+
+    for prompt in ["Ocean acidification", "Coral reef ocean health", "Mars rovers"]:
+        client.post("/api/v1/sessions", json={"prompt": prompt}, headers=_auth_headers(token))
+
+    response = client.get(
+        "/api/v1/sessions/search",
+        params={"q": "ocean"},
+        headers=_auth_headers(token),
+    )
+
+    assert response.status_code == 200
+    prompts = [result["session"]["prompt"] for result in response.json()]
+    assert sorted(prompts) == ["Coral reef ocean health", "Ocean acidification"]
+
+
+def test_get_session_detail_returns_session_with_children(session_context):
+    client = session_context["client"]
+    token = session_context["token"]
+
+    session = client.post(
+        "/api/v1/sessions",
+        json={"prompt": "Ocean currents"},
+        headers=_auth_headers(token),
+    ).json()
+    client.post(
+        f"/api/v1/sessions/{session['session_id']}/messages",
+        json={"session_id": session["session_id"], "role": "user", "content": "Hello"},
+        headers=_auth_headers(token),
+    )
+
+    response = client.get(
+        f"/api/v1/sessions/{session['session_id']}/full",
+        headers=_auth_headers(token),
+    )
+
+    assert response.status_code == 200
+    detail = response.json()
+    assert detail["session"]["session_id"] == session["session_id"]
+    assert [message["content"] for message in detail["messages"]] == ["Hello"]
+    assert detail["sources"] == []
+    assert detail["infographic"] is None
+
+    missing = client.get("/api/v1/sessions/missing/full", headers=_auth_headers(token))
+    assert missing.status_code == 404
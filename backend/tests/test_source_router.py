@@ -3,6 +3,7 @@
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import asyncio
+import json
 import pytest
 
 from infograph.core.schemas import ResearchSessionCreate, SourceCreate
@@ -105,3 +106,20 @@ def test_list_sources_returns_sources(source_context):
     assert len(payload) == 2
     assert payload[0]["session_id"] == session_id
     assert payload[0]["confidence"] >= 0.5
+
+
+def test_list_sources_streams_ndjson(source_context):
+    client = source_context["client"]
+    session_id = source_context["session_id"]
+    token = source_context["token"]
+
+    response = client.get(
+        f"/api/v1/sessions/{session_id}/sources",
+        headers={"Authorization": f"Bearer {token}", "Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 2
+    assert {line["session_id"] for line in lines} == {session_id}
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from infograph.core.schemas import MessageCreate
+from infograph.stores.duckdb.buffered_message_store_duckdb import BufferedMessageStoreDuckDB
+from infograph.stores.duckdb.message_store_duckdb import MessageStoreDuckDB
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+def _message(content: str) -> MessageCreate:
+    return MessageCreate(session_id="session-1", role="user", content=content)
+
+
+@pytest.mark.asyncio
+async def test_buffered_messages_are_readable_before_and_after_group_commit(duckdb_settings):
+    inner = MessageStoreDuckDB(duckdb_settings)
+    store = BufferedMessageStoreDuckDB(inner, batch_size=3, flush_interval_ms=60_000)
+
+    await store.create(_message("one"))
+    await store.create(_message("two"))
+
+    assert [m.content for m in await store.list_for_session("session-1")] == ["one", "two"]
+    assert await inner.list_for_session("session-1") == []
+
+    await store.create(_message("three"))
+
+    assert store.pending_count == 0
+    assert len(await inner.list_for_session("session-1")) == 3
+    assert len(await store.list_for_session("session-1")) == 3
+
+
+class FlushDuringReadMessageStore(MessageStoreDuckDB):
+    """Inner store that lets the buffer flush after its read, before it returns."""
+
+    def __init__(self, settings) -> None:
+        super().__init__(settings)
+        self.during_read = None
+
+    async def list_for_session(self, session_id: str):
+        messages = await super().list_for_session(session_id)
+        if self.during_read is not None:
+            during_read, self.during_read = self.during_read, None
+            await during_read()
+        return messages
+
+
+@pytest.mark.asyncio
+async def test_messages_flushed_during_a_read_are_still_listed(duckdb_settings):
+    inner = FlushDuringReadMessageStore(duckdb_settings)
+    store = BufferedMessageStoreDuckDB(inner, batch_size=100, flush_interval_ms=60_000)
+    await store.create(_message("in flight"))
+
+    inner.during_read = store.flush
+    assert [m.content for m in await store.list_for_session("session-1")] == ["in flight"]
+    assert store.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_buffered_messages_flush_on_interval_and_delete(duckdb_settings):
+    inner = MessageStoreDuckDB(duckdb_settings)
+    store = BufferedMessageStoreDuckDB(inner, batch_size=100, flush_interval_ms=10)
+
+    await store.create(_message("timed"))
+    await asyncio.sleep(0.2)
+    assert len(await inner.list_for_session("session-1")) == 1
+
+    await store.create(_message("discarded"))
+    await store.delete_for_session("session-1")
+    await store.flush()
+    assert await store.list_for_session("session-1") == []
+
+
+@pytest.mark.asyncio
+async def test_registry_aclose_flushes_pending_messages(duckdb_settings, monkeypatch):
+    monkeypatch.setenv("INFOGRAPH_MESSAGE_WRITE_BEHIND", "1")
+    monkeypatch.setenv("INFOGRAPH_MESSAGE_FLUSH_MS", "60000")
+    registry = StoreRegistryDuckDB(duckdb_settings)
+    await registry.message_store.create(_message("pending"))
+
+    await registry.aclose()
+
+    reopened = StoreRegistryDuckDB(duckdb_settings)
+    assert [m.content for m in await reopened.message_store.list_for_session("session-1")] == [
+        "pending"
+    ]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import ResearchSessionCreate, ResearchSessionUpdate, UserCreate
+from infograph.stores.cached_stores import CachedSessionStore
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+from infograph.stores.memory.session_store_memory import SessionStoreMemory
+from infograph.stores.ttl_cache import TTLCache
+
+
+@pytest.mark.asyncio
+async def test_cached_stores_serve_repeat_lookups_and_invalidate(duckdb_settings):
+    registry = StoreRegistryDuckDB(duckdb_settings)
+    user = await registry.user_store.create(
+        UserCreate(email="a@b.com", name="Test", google_id="google-123")
+    )
+    session = await registry.session_store.create(
+        ResearchSessionCreate(prompt="cached"), user.user_id
+    )
+
+    for _ in range(3):
+        assert (await registry.user_store.get(user.user_id)).user_id == user.user_id
+        assert (await registry.session_store.get(session.session_id)).status == "pending"
+
+    stats = registry.cache_stats()
+    assert (stats["users"].hits, stats["users"].misses) == (2, 1)
+    assert (stats["sessions"].hits, stats["sessions"].misses) == (2, 1)
+
+    await registry.session_store.update(session.session_id, ResearchSessionUpdate(status="failed"))
+    assert (await registry.session_store.get(session.session_id)).status == "failed"
+
+    renamed = await registry.user_store.update(user.model_copy(update={"name": "Renamed"}))
+    assert (await registry.user_store.get(user.user_id)).name == renamed.name
+
+    await registry.session_store.delete(session.session_id)
+    assert await registry.session_store.get(session.session_id) is None
+
+
+def test_cache_can_be_disabled(duckdb_settings, monkeypatch):
+    monkeypatch.setenv("INFOGRAPH_CACHE_TTL_SECONDS", "0")
+    registry = StoreRegistryDuckDB(duckdb_settings)
+
+    assert registry.session_store is registry.maintenance_store.session_store
+    assert registry.cache_stats() == {}
+
+
+class RacingSessionStore(SessionStoreMemory):
+    """Memory store whose ``get`` lets an update land between its read and its return."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.during_get = None
+
+    async def get(self, session_id: str):
+        session = await super().get(session_id)
+        if self.during_get is not None:
+            during_get, self.during_get = self.during_get, None
+            await during_get()
+        return session
+
+
+@pytest.mark.asyncio
+async def test_a_read_that_raced_a_write_is_not_cached():
+    inner = RacingSessionStore()
+    store = CachedSessionStore(inner, TTLCache(max_size=10, ttl_seconds=60))
+    session = await store.create(ResearchSessionCreate(prompt="racing"), "user-1")
+
+    async def fail_session() -> None:
+        await store.update(session.session_id, ResearchSessionUpdate(status="failed"))
+
+    inner.during_get = fail_session
+    assert (await store.get(session.session_id)).status == "pending"
+    assert (await store.get(session.session_id)).status == "failed"
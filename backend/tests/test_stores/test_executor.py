@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from infograph.core.schemas import MessageCreate
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+@pytest.mark.asyncio
+async def test_store_calls_run_on_shared_executor(duckdb_settings):
+    registry = StoreRegistryDuckDB(duckdb_settings)
+    store = registry.message_store
+    assert store.store.executor is registry.executor()
+
+    await asyncio.gather(
+        *[
+            store.create(
+                MessageCreate(session_id="session-1", role="user", content=f"msg {idx}")
+            )
+            for idx in range(10)
+        ]
+    )
+    messages = await store.list_for_session("session-1")
+    assert len(messages) == 10
+
+    stats = registry.executor_stats()[duckdb_settings.DB_CORE]
+    assert stats.queue_depth == 0
+    assert stats.running == 0
+    assert stats.completed >= 11
+    assert stats.max_wait_ms >= stats.avg_wait_ms >= 0
+
+    registry.close()
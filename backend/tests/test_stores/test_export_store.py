@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import duckdb
+import pytest
+
+from infograph.core.schemas import (
+    InfographicCreate,
+    MessageCreate,
+    ResearchSessionCreate,
+    SourceCreate,
+)
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+async def _populate(stores: StoreRegistryDuckDB, user_id: str) -> None:
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="export"), user_id)
+    await stores.source_store.create(
+        SourceCreate(
+            session_id=session.session_id,
+            title="Source",
+            url="https://example.com",
+            snippet="Snippet",
+            confidence=0.9,
+        )
+    )
+    await stores.message_store.create_many(
+        [
+            MessageCreate(session_id=session.session_id, role="user", content=f"m{idx}")
+            for idx in range(5)
+        ]
+    )
+    await stores.infographic_store.create(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            image_path="/tmp/infographic.png",
+            layout_data={"title": "Export"},
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_streams_only_the_users_rows(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    await _populate(stores, "user-1")
+    await _populate(stores, "user-2")
+
+    chunks = [chunk async for chunk in stores.export_store.iter_ndjson("user-1", chunk_rows=2)]
+    records = [json.loads(line) for chunk in chunks for line in chunk.decode().splitlines()]
+
+    kinds = [record["kind"] for record in records]
+    assert kinds.count("sessions") == 1
+    assert kinds.count("sources") == 1
+    assert kinds.count("messages") == 5
+    assert kinds.count("infographics") == 1
+    assert len(chunks) > 4
+    infographic = next(r for r in records if r["kind"] == "infographics")
+    assert infographic["data"]["layout_data"] == {"title": "Export"}
+
+
+@pytest.mark.asyncio
+async def test_copy_to_writes_parquet_per_table(duckdb_settings, tmp_path):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    await _populate(stores, "user-1")
+    await _populate(stores, "user-2")
+
+    paths = await stores.export_store.copy_to("user-1", tmp_path / "export", "parquet")
+
+    counts = {
+        path.stem: duckdb.sql(f"SELECT count(*) FROM '{path}'").fetchone()[0] for path in paths
+    }
+    assert counts == {"sessions": 1, "sources": 1, "messages": 5, "infographics": 1}
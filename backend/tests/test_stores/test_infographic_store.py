@@ -29,3 +29,30 @@ async def test_infographic_store_operations(duckdb_settings):
 
     recent = await store.list_recent(limit=1)
     assert len(recent) == 1
+
+
+@pytest.mark.asyncio
+async def test_trusted_bulk_read_matches_validated_read(duckdb_settings):
+    store = InfographicStoreDuckDB(duckdb_settings)
+    for idx in range(3):
+        await store.create(_create_payload(f'session-{idx}'))
+
+    validated = await store.store.fetch_all('ORDER BY session_id')
+    trusted = await store.store.fetch_all_trusted('ORDER BY session_id')
+
+    assert trusted == validated
+    assert trusted[0].layout_data == {'title': 'Sample', 'bullets': ['Point A', 'Point B']}
+
+
+@pytest.mark.asyncio
+async def test_list_recent_binds_limit_and_reuses_query_shape(duckdb_settings):
+    store = InfographicStoreDuckDB(duckdb_settings)
+    for idx in range(3):
+        await store.create(_create_payload(f'session-{idx}'))
+
+    assert len(await store.list_recent(limit=2)) == 2
+    assert len(await store.list_recent(limit=5)) == 3
+
+    sql = store.store.select_sql(order_by=['created_at DESC'], limit=True)
+    assert sql.endswith('ORDER BY created_at DESC LIMIT ?')
+    assert store.store.select_sql(order_by=('created_at DESC',), limit=True) is sql
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import (
+    InfographicCreate,
+    MessageCreate,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SearchDocument,
+    SourceCreate,
+    UserCreate,
+)
+from infograph.stores.memory.store_registry_memory import StoreRegistryMemory
+from infograph.stores.pagination import SessionCursor
+from infograph.stores.store_registry import create_store_registry
+
+
+@pytest.mark.asyncio
+async def test_memory_user_and_session_crud():
+    stores = StoreRegistryMemory()
+    user = await stores.user_store.create(
+        UserCreate(email="a@b.com", name="Test", google_id="google-123")
+    )
+    assert (await stores.user_store.get_by_google_id("google-123")).user_id == user.user_id
+
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="p"), user.user_id)
+    updated = await stores.session_store.update(
+        session.session_id, ResearchSessionUpdate(status="searching")
+    )
+    assert updated.status == "searching"
+    assert await stores.session_store.transition(session.session_id, ["pending"], "failed") is None
+    moved = await stores.session_store.transition(
+        session.session_id, ["searching"], "generating"
+    )
+    assert moved.status == "generating"
+
+    await stores.session_store.delete(session.session_id)
+    assert await stores.session_store.get(session.session_id) is None
+    assert list(await stores.session_store.list_for_user(user.user_id)) == []
+
+
+@pytest.mark.asyncio
+async def test_memory_session_listing_matches_duckdb_ordering_and_filters():
+    store = StoreRegistryMemory().session_store
+    created = [
+        await store.create(ResearchSessionCreate(prompt=f"Topic {idx % 2} item {idx}"), "user-1")
+        for idx in range(7)
+    ]
+    expected = sorted(created, key=lambda s: (s.created_at, s.session_id), reverse=True)
+
+    first = list(await store.list_for_user("user-1", limit=3))
+    assert first == expected[:3]
+    second = list(
+        await store.list_for_user(
+            "user-1", limit=3, cursor=SessionCursor.after(first[-1]).encode()
+        )
+    )
+    assert second == expected[3:6]
+    assert list(await store.list_for_user("user-1", limit=3, offset=6)) == expected[6:]
+
+    matches = list(await store.list_for_user("user-1", search="TOPIC 1"))
+    assert [s.session_id for s in matches] == [
+        s.session_id for s in expected if "Topic 1" in s.prompt
+    ]
+
+    newest = expected[0].created_at
+    window = list(
+        await store.list_for_user("user-1", start_timestamp=newest, end_timestamp=newest)
+    )
+    assert window == [s for s in expected if s.created_at == newest]
+
+    with pytest.raises(ValueError):
+        await store.list_for_user("user-1", cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_memory_children_detail_and_search():
+    stores = create_store_registry("memory")
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="Solar"), "user-1")
+    await stores.source_store.create_many(
+        [
+            SourceCreate(
+                session_id=session.session_id,
+                title=f"Source {idx}",
+                url="https://example.com",
+                snippet="Snippet",
+                confidence=0.5,
+            )
+            for idx in range(2)
+        ]
+    )
+    await stores.message_store.create(
+        MessageCreate(session_id=session.session_id, role="user", content="Hi")
+    )
+    await stores.infographic_store.create(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            image_path="/tmp/infographic.png",
+            layout_data={},
+        )
+    )
+
+    detail = await stores.session_detail_store.get_for_user(session.session_id, "user-1")
+    assert len(detail.sources) == 2
+    assert [m.content for m in detail.messages] == ["Hi"]
+    assert detail.infographic is not None
+    assert await stores.session_detail_store.get_for_user(session.session_id, "user-2") is None
+    assert len(await stores.infographic_store.list_recent(limit=5)) == 1
+
+    index = stores.search_index_store
+    await index.index_documents(
+        [
+            SearchDocument(
+                doc_id="prompt:a", user_id="user-1", session_id="a", kind="prompt",
+                text="solar panels and solar farms",
+            ),
+            SearchDocument(
+                doc_id="prompt:b", user_id="user-1", session_id="b", kind="prompt",
+                text="wind turbines with a solar backup",
+            ),
+            SearchDocument(
+                doc_id="prompt:c", user_id="user-2", session_id="c", kind="prompt",
+                text="solar",
+            ),
+        ]
+    )
+    hits = await index.search("user-1", "solar")
+    assert [hit.session_id for hit in hits] == ["a", "b"]
+    assert hits[0].score > hits[1].score > 0
+
+    await index.delete_for_session("a")
+    assert [hit.session_id for hit in await index.search("user-1", "solar")] == ["b"]
@@ -25,3 +25,51 @@ async def test_message_store_operations(duckdb_settings):
 
     await store.delete_for_session('session-xyz')
     assert await store.list_for_session('session-xyz') == []
+
+
+@pytest.mark.asyncio
+async def test_message_store_create_many(duckdb_settings):
+    store = MessageStoreDuckDB(duckdb_settings)
+
+    messages = await store.create_many(
+        [
+            MessageCreate(session_id='session-bulk', role='user', content=f'Message {idx}')
+            for idx in range(5)
+        ]
+    )
+    assert [message.content for message in messages] == [f'Message {idx}' for idx in range(5)]
+
+    more = await store.create_many(
+        [MessageCreate(session_id='session-bulk', role='assistant', content='Message 5')]
+    )
+    created_at = [message.created_at for message in [*messages, *more]]
+    assert created_at == sorted(set(created_at))
+
+    # Messages written together, or in the same millisecond, keep their order.
+    stored = await store.list_for_session('session-bulk')
+    assert [message.content for message in stored] == [f'Message {idx}' for idx in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_message_store_iter_for_session_yields_chunks_in_order(duckdb_settings):
+    store = MessageStoreDuckDB(duckdb_settings)
+    created = await store.create_many(
+        [
+            MessageCreate(session_id="session-iter", role="user", content=f"m{idx}")
+            for idx in range(5)
+        ]
+    )
+
+    chunks = []
+    async for chunk in store.store.iter_all(
+        ["session_id"], ["session-iter"], order_by=["created_at ASC"], chunk_rows=2
+    ):
+        chunks.append(chunk)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    streamed = [
+        message
+        async for chunk in store.iter_for_session("session-iter")
+        for message in chunk
+    ]
+    assert [m.message_id for m in streamed] == [m.message_id for m in created]
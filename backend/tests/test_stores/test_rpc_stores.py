@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from infograph.core.schemas import (
+    MessageCreate,
+    ResearchSessionCreate,
+    ResearchSessionUpdate,
+    SourceCreate,
+    UserCreate,
+)
+from infograph.stores.memory.store_registry_memory import StoreRegistryMemory
+from infograph.stores.rpc.protocol import StoreRPCError
+from infograph.stores.rpc.store_registry_rpc import StoreRegistryRPC
+from infograph.stores.rpc.store_server import StoreServer, wait_for_socket
+
+
+@pytest.mark.asyncio
+async def test_rpc_stores_round_trip_through_store_server(tmp_path):
+    socket_path = tmp_path / "stores.sock"
+    server = StoreServer(StoreRegistryMemory(), socket_path)
+    await server.start()
+    stores = StoreRegistryRPC(socket_path)
+    try:
+        user = await stores.user_store.create(
+            UserCreate(email="a@b.com", name="Test", google_id="google-123")
+        )
+        assert await stores.user_store.get_by_google_id("google-123") == user
+
+        session = await stores.session_store.create(
+            ResearchSessionCreate(prompt="p"), user.user_id
+        )
+        moved = await stores.session_store.transition(
+            session.session_id, ["pending"], "searching"
+        )
+        assert moved.status == "searching"
+        with pytest.raises(ValueError):
+            await stores.session_store.update("missing", ResearchSessionUpdate(status="failed"))
+
+        # Concurrent calls are pipelined over the one connection.
+        await asyncio.gather(
+            *(
+                stores.message_store.create(
+                    MessageCreate(session_id=session.session_id, role="user", content=str(i))
+                )
+                for i in range(20)
+            )
+        )
+        await stores.source_store.create(
+            SourceCreate(
+                session_id=session.session_id,
+                title="Source",
+                url="https://example.com",
+                snippet="Snippet",
+                confidence=0.9,
+            )
+        )
+
+        detail = await stores.session_detail_store.get_for_user(
+            session.session_id, user.user_id
+        )
+        assert detail.session == moved
+        assert len(detail.messages) == 20
+        assert [source.title for source in detail.sources] == ["Source"]
+        assert await stores.session_detail_store.get_for_user(session.session_id, "other") is None
+        assert [
+            len(chunk) async for chunk in stores.message_store.iter_for_session(session.session_id)
+        ] == [20]
+
+        with pytest.raises(StoreRPCError):
+            await stores.client.call("user_store", "__init__")
+    finally:
+        await stores.aclose()
+        await server.close()
+
+    assert not socket_path.exists()
+    with pytest.raises(StoreRPCError):
+        await StoreRegistryRPC(socket_path).user_store.get(user.user_id)
+
+
+def test_waiting_for_the_socket_reports_a_crashed_store_server(tmp_path):
+    server = multiprocessing.get_context("fork").Process(target=os._exit, args=(3,))
+    server.start()
+    started = time.monotonic()
+
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        wait_for_socket(tmp_path / "stores.sock", timeout=30.0, process=server)
+    assert time.monotonic() - started < 5.0
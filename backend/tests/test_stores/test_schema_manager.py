@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+from leettools.common.duckdb.duckdb_client import DuckDBClient
+from pydantic import BaseModel, Field
+
+from infograph.stores.duckdb.schema_manager import CORE_TABLES, SchemaManager, TableSpec
+from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+class WidgetV1(BaseModel):
+    widget_id: str = Field(..., json_schema_extra={"primary_key": True})
+    name: str
+
+
+class WidgetV2(WidgetV1):
+    color: str | None = None
+
+
+class WidgetV3(WidgetV1):
+    label: str = Field(..., json_schema_extra={"backfill": "'widget:' || name"})
+
+
+def test_stores_attach_to_bootstrapped_tables_without_ddl(duckdb_settings, monkeypatch):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    client = stores.client()
+    assert set(stores.schemas().versions()) >= {spec.table_name for spec in CORE_TABLES}
+
+    calls: list[str] = []
+    original = DuckDBClient.create_table_if_not_exists
+
+    def counting(self, *args, **kwargs):
+        calls.append(kwargs.get("table_name", ""))
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(DuckDBClient, "create_table_if_not_exists", counting)
+
+    for _ in range(3):
+        SessionStoreDuckDB(duckdb_settings, client, stores.executor())
+    assert stores.user_store is not None
+    assert stores.maintenance_store is not None
+    assert calls == []
+
+    # A restart finds every table at its recorded version and creates nothing.
+    reopened = StoreRegistryDuckDB(duckdb_settings)
+    assert reopened.maintenance_store is not None
+    assert calls == ["schema_versions"]
+    assert all(version == 1 for version in reopened.schemas().versions().values())
+    stores.close()
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_model_changes_are_migrated_additively(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    client = stores.client()
+    qualified = stores.schemas().ensure(WidgetV1, "widgets")
+    await stores.executor().execute(
+        f"INSERT INTO {qualified} (widget_id, name) VALUES (?, ?)", ["w1", "gear"]
+    )
+
+    manager = SchemaManager(client, duckdb_settings)
+    manager.bootstrap([TableSpec(WidgetV2, "widgets")])
+
+    assert manager.versions()["widgets"] == 2
+    row = await stores.executor().fetch_one(f"SELECT * FROM {qualified}")
+    assert row == {"widget_id": "w1", "name": "gear", "color": None}
+    stores.close()
+
+
+@pytest.mark.asyncio
+async def test_added_columns_are_backfilled_from_their_expression(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    qualified = stores.schemas().ensure(WidgetV1, "widgets")
+    await stores.executor().execute(
+        f"INSERT INTO {qualified} (widget_id, name) VALUES (?, ?)", ["w1", "gear"]
+    )
+
+    SchemaManager(stores.client(), duckdb_settings).bootstrap([TableSpec(WidgetV3, "widgets")])
+
+    row = await stores.executor().fetch_one(f"SELECT * FROM {qualified}")
+    assert row == {"widget_id": "w1", "name": "gear", "label": "widget:gear"}
+    stores.close()
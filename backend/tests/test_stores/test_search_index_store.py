@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import SearchDocument
+from infograph.stores.duckdb.search_index_store_duckdb import SearchIndexStoreDuckDB
+
+
+def _doc(doc_id: str, session_id: str, text: str, user_id: str = "user-1") -> SearchDocument:
+    return SearchDocument(
+        doc_id=doc_id,
+        user_id=user_id,
+        session_id=session_id,
+        kind="prompt",
+        text=text,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_index_ranks_and_deletes(duckdb_settings):
+    store = SearchIndexStoreDuckDB(duckdb_settings)
+
+    await store.index_documents(
+        [
+            _doc("prompt:s1", "s1", "Battery chemistry for electric vehicles"),
+            _doc("source:a", "s1", "Battery battery battery recycling"),
+            _doc("prompt:s2", "s2", "Quantum computing roadmap"),
+            _doc("prompt:s3", "s3", "Solid state battery startups"),
+            _doc("prompt:other", "s4", "Battery news", user_id="user-2"),
+        ]
+    )
+
+    hits = await store.search("user-1", "battery")
+    assert [hit.session_id for hit in hits][0] == "s1"
+    assert {hit.session_id for hit in hits} == {"s1", "s3"}
+    assert all(hit.score > 0 for hit in hits)
+
+    assert [hit.session_id for hit in await store.search("user-1", "quantum")] == ["s2"]
+    assert await store.search("user-1", "the and") == []
+
+    await store.delete_for_session("s1")
+    hits = await store.search("user-1", "battery")
+    assert [hit.session_id for hit in hits] == ["s3"]
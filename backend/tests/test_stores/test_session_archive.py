@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from infograph.core.schemas import (
+    InfographicCreate,
+    MessageCreate,
+    ResearchSessionCreate,
+    SourceCreate,
+)
+from infograph.services.archive_service import ArchivePolicy, ArchiveService
+from infograph.services.history_search_service import HistorySearchService
+from infograph.services.purge_service import DAY_MS, PurgeService, RetentionPolicy
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+async def _populate(stores: StoreRegistryDuckDB, prompt: str, image_path: str) -> str:
+    session = await stores.session_store.create(ResearchSessionCreate(prompt=prompt), "user-1")
+    await stores.source_store.create(
+        SourceCreate(
+            session_id=session.session_id,
+            title="Source",
+            url="https://example.com",
+            snippet="Snippet",
+            confidence=0.9,
+        )
+    )
+    await stores.message_store.create_many(
+        [
+            MessageCreate(session_id=session.session_id, role="user", content=f"m{idx}")
+            for idx in range(3)
+        ]
+    )
+    await stores.infographic_store.create(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            image_path=image_path,
+            layout_data={"title": prompt},
+        )
+    )
+    await HistorySearchService(stores.search_index_store).index_session(session)
+    return session.session_id
+
+
+async def _archive_all(stores: StoreRegistryDuckDB) -> None:
+    session = (await stores.session_store.list_for_user("user-1", limit=1))[0]
+    report = await ArchiveService(
+        stores.maintenance_store, ArchivePolicy(archive_after_days=1)
+    ).run(now_ms=session.created_at + 2 * DAY_MS)
+    assert report.sessions_archived == 2
+    assert report.batches_written == 1
+
+
+@pytest.mark.asyncio
+async def test_archived_sessions_leave_hot_tables_and_stay_readable(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    first = await _populate(stores, "first", "/tmp/first.png")
+    second = await _populate(stores, "second", "/tmp/second.png")
+
+    await _archive_all(stores)
+
+    for table in [
+        stores._session_store_duckdb.store.table_name,
+        stores.source_store.store.table_name,
+        stores._message_store_duckdb.store.table_name,
+        stores.infographic_store.store.table_name,
+    ]:
+        row = await stores.executor().fetch_one(f"SELECT COUNT(*) AS n FROM {table}")
+        assert row["n"] == 0
+
+    session = await stores._session_store_duckdb.get(first)
+    assert session is not None and session.prompt == "first"
+    listed = await stores.session_store.list_for_user("user-1")
+    assert {s.session_id for s in listed} == {first, second}
+    assert len(await stores.source_store.list_for_session(first)) == 1
+    messages = await stores.message_store.list_for_session(first)
+    assert [m.content for m in messages] == ["m0", "m1", "m2"]
+    infographic = await stores.infographic_store.get_for_session(second)
+    assert infographic is not None and infographic.layout_data == {"title": "second"}
+
+    detail = await stores.session_detail_store.get_for_user(first, "user-1")
+    assert detail is not None
+    assert len(detail.sources) == 1 and len(detail.messages) == 3
+    assert await stores.session_detail_store.get_for_user(first, "user-2") is None
+
+    chunks = [chunk async for chunk in stores.export_store.iter_ndjson("user-1")]
+    kinds = [json.loads(line)["kind"] for c in chunks for line in c.decode().splitlines()]
+    assert kinds.count("sessions") == 2
+    assert kinds.count("messages") == 6
+
+
+@pytest.mark.asyncio
+async def test_new_messages_merge_with_archived_ones(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    first = await _populate(stores, "first", "/tmp/first.png")
+    await _populate(stores, "second", "/tmp/second.png")
+    await _archive_all(stores)
+
+    await stores.message_store.create(MessageCreate(session_id=first, role="user", content="m3"))
+
+    messages = await stores.message_store.list_for_session(first)
+    assert [m.content for m in messages] == ["m0", "m1", "m2", "m3"]
+
+
+@pytest.mark.asyncio
+async def test_purge_keeps_archived_sessions_and_their_images(duckdb_settings, tmp_path):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    output_dir = tmp_path / "infographics"
+    output_dir.mkdir()
+    images = [output_dir / "first.png", output_dir / "second.png"]
+    for path in images:
+        path.write_bytes(b"png")
+        os.utime(path, (0, 0))
+    first = await _populate(stores, "first", str(images[0]))
+    await _populate(stores, "second", str(images[1]))
+    await _archive_all(stores)
+
+    report = await PurgeService(
+        stores.maintenance_store, output_dir, RetentionPolicy()
+    ).run()
+
+    assert report.orphaned_sessions == 0
+    assert report.files_deleted == 0
+    assert all(path.exists() for path in images)
+    hits = await stores.search_index_store.search("user-1", "first", limit=5)
+    assert [hit.session_id for hit in hits] == [first]
+
+
+@pytest.mark.asyncio
+async def test_purge_expires_archived_sessions_and_drops_their_batches(
+    duckdb_settings, tmp_path
+):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    output_dir = tmp_path / "infographics"
+    output_dir.mkdir()
+    image = output_dir / "infographic-1.png"
+    image.write_bytes(b"png")
+    os.utime(image, (0, 0))
+    first = await _populate(stores, "first", str(image))
+    await _populate(stores, "second", "/tmp/second.png")
+    await _archive_all(stores)
+    archive = stores.maintenance_store.archive
+    assert list(archive.archive_dir.glob("*/batch=*"))
+
+    created_at = (await stores.session_store.get(first)).created_at
+    report = await PurgeService(
+        stores.maintenance_store,
+        output_dir,
+        RetentionPolicy(retention_days=1, file_grace_seconds=0),
+    ).run(now_ms=created_at + 2 * DAY_MS)
+
+    assert report.expired_sessions == 2
+    assert report.batches_deleted == 1
+    assert report.files_deleted == 1
+    assert await stores.session_store.get(first) is None
+    assert await stores.search_index_store.search("user-1", "first", limit=5) == []
+    assert not await archive.has_entries()
+    assert list(archive.archive_dir.glob("*/batch=*")) == []
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import (
+    InfographicCreate,
+    MessageCreate,
+    ResearchSessionCreate,
+    SourceCreate,
+)
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+@pytest.mark.asyncio
+async def test_session_detail_loads_children_and_checks_ownership(duckdb_settings):
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="detail"), "user-1")
+    await stores.source_store.create(
+        SourceCreate(
+            session_id=session.session_id,
+            title="Source",
+            url="https://example.com",
+            snippet="Snippet",
+            confidence=0.9,
+        )
+    )
+    await stores.message_store.create_many(
+        [
+            MessageCreate(session_id=session.session_id, role="user", content="Hi"),
+            MessageCreate(session_id=session.session_id, role="assistant", content="Hello"),
+        ]
+    )
+    await stores.infographic_store.create(
+        InfographicCreate(
+            session_id=session.session_id,
+            template_type="basic",
+            image_path="/tmp/infographic.png",
+            layout_data={"title": "Detail"},
+        )
+    )
+
+    detail = await stores.session_detail_store.get_for_user(session.session_id, "user-1")
+
+    assert detail is not None
+    assert detail.session.session_id == session.session_id
+    assert [source.title for source in detail.sources] == ["Source"]
+    assert len(detail.messages) == 2
+    assert detail.infographic.layout_data == {"title": "Detail"}
+
+    assert await stores.session_detail_store.get_for_user(session.session_id, "user-2") is None
+    assert await stores.session_detail_store.get_for_user("missing", "user-1") is None
+
+
+class FlushAfterRead:
+    """Executor wrapper that flushes the message buffer once a read has run."""
+
+    def __init__(self, executor, flush) -> None:
+        self.executor = executor
+        self.flush = flush
+
+    async def run(self, fn):
+        result = await self.executor.run(fn)
+        await self.flush()
+        return result
+
+
+@pytest.mark.asyncio
+async def test_session_detail_keeps_messages_flushed_during_the_read(
+    duckdb_settings, monkeypatch
+):
+    monkeypatch.setenv("INFOGRAPH_MESSAGE_WRITE_BEHIND", "1")
+    monkeypatch.setenv("INFOGRAPH_MESSAGE_FLUSH_MS", "60000")
+    stores = StoreRegistryDuckDB(duckdb_settings)
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="detail"), "user-1")
+    await stores.message_store.create(
+        MessageCreate(session_id=session.session_id, role="user", content="Hi")
+    )
+    detail_store = stores.session_detail_store
+    detail_store.executor = FlushAfterRead(detail_store.executor, stores.message_store.flush)
+
+    detail = await detail_store.get_for_user(session.session_id, "user-1")
+
+    assert [message.content for message in detail.messages] == ["Hi"]
+    assert stores.message_store.pending_count == 0
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from infograph.core.schemas import ResearchSessionCreate, ResearchSessionUpdate, UserCreate
 from infograph.stores.duckdb.session_store_duckdb import SessionStoreDuckDB
 from infograph.stores.duckdb.user_store_duckdb import UserStoreDuckDB
+from infograph.stores.pagination import SessionCursor
 
 
 @pytest.mark.asyncio
@@ -24,8 +27,65 @@ async def test_session_store_crud(duckdb_settings):
     sessions = await session_store.list_for_user(user.user_id)
     assert len(sessions) == 1
 
+    other = await session_store.create(ResearchSessionCreate(prompt="other"), "someone-else")
+    found = await session_store.get_many(
+        user.user_id, [session.session_id, other.session_id, "missing"]
+    )
+    assert [found_session.session_id for found_session in found] == [session.session_id]
+
     updated = await session_store.update(session.session_id, ResearchSessionUpdate(status="completed"))
     assert updated.status == "completed"
 
     await session_store.delete(session.session_id)
     assert await session_store.get(session.session_id) is None
+
+
+@pytest.mark.asyncio
+async def test_session_store_cursor_pagination(duckdb_settings):
+    session_store = SessionStoreDuckDB(duckdb_settings)
+
+    created = [
+        await session_store.create(ResearchSessionCreate(prompt=f"prompt {idx}"), "user-1")
+        for idx in range(7)
+    ]
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page = list(await session_store.list_for_user("user-1", limit=3, cursor=cursor))
+        seen.extend(session.session_id for session in page)
+        if len(page) < 3:
+            break
+        cursor = SessionCursor.after(page[-1]).encode()
+
+    assert sorted(seen) == sorted(session.session_id for session in created)
+    assert len(seen) == len(set(seen))
+
+    with pytest.raises(ValueError):
+        await session_store.list_for_user("user-1", cursor="not-a-cursor")
+
+
+@pytest.mark.asyncio
+async def test_session_store_transition_is_compare_and_set(duckdb_settings):
+    session_store = SessionStoreDuckDB(duckdb_settings)
+    session = await session_store.create(ResearchSessionCreate(prompt="prompt"), "user-1")
+
+    moved = await session_store.transition(session.session_id, ["pending"], "searching")
+    assert moved is not None
+    assert moved.status == "searching"
+    assert moved.prompt == "prompt"
+
+    assert await session_store.transition(session.session_id, ["pending"], "failed") is None
+    assert (await session_store.get(session.session_id)).status == "searching"
+
+    results = await asyncio.gather(
+        *(
+            session_store.transition(session.session_id, ["searching"], "generating")
+            for _ in range(5)
+        )
+    )
+    assert sum(result is not None for result in results) == 1
+
+    assert await session_store.transition("missing", ["pending"], "searching") is None
+    with pytest.raises(ValueError):
+        await session_store.update("missing", ResearchSessionUpdate(status="failed"))
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import MessageCreate, ResearchSessionCreate, SearchDocument
+from infograph.services.purge_service import PurgeService, RetentionPolicy
+from infograph.services.shard_rebalance_service import ShardRebalanceService
+from infograph.stores.duckdb.shard_directory_duckdb import hash_shard
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+from infograph.stores.duckdb.store_registry_sharded_duckdb import StoreRegistryShardedDuckDB
+
+
+async def _session_with_message(stores: StoreRegistryShardedDuckDB, user_id: str) -> str:
+    session = await stores.session_store.create(ResearchSessionCreate(prompt="p"), user_id)
+    await stores.message_store.create(
+        MessageCreate(session_id=session.session_id, role="user", content="hello")
+    )
+    await stores.search_index_store.index_documents(
+        [
+            SearchDocument(
+                doc_id=f"prompt:{session.session_id}",
+                user_id=user_id,
+                session_id=session.session_id,
+                kind="prompt",
+                text="solar panels",
+            )
+        ]
+    )
+    return session.session_id
+
+
+@pytest.mark.asyncio
+async def test_sharded_registry_routes_by_user_and_session(duckdb_settings):
+    stores = StoreRegistryShardedDuckDB(duckdb_settings, shard_count=3)
+    try:
+        session_id = await _session_with_message(stores, "user-1")
+        home = stores.shards[hash_shard("user-1", 3)]
+
+        assert (await home.session_store.get(session_id)).user_id == "user-1"
+        assert (await stores.session_store.get(session_id)).session_id == session_id
+        assert len(await stores.message_store.list_for_session(session_id)) == 1
+        hits = await stores.search_index_store.search("user-1", "solar")
+        assert [hit.session_id for hit in hits] == [session_id]
+        detail = await stores.session_detail_store.get_for_user(session_id, "user-1")
+        assert len(detail.messages) == 1
+
+        await stores.session_store.delete(session_id)
+        assert await stores.session_store.get(session_id) is None
+        assert await stores.message_store.list_for_session(session_id) == []
+    finally:
+        await stores.aclose()
+
+
+@pytest.mark.asyncio
+async def test_rebalance_moves_user_data_between_shards(duckdb_settings):
+    stores = StoreRegistryShardedDuckDB(duckdb_settings, shard_count=2)
+    try:
+        session_id = await _session_with_message(stores, "user-1")
+        source = hash_shard("user-1", 2)
+        target = 1 - source
+        service = ShardRebalanceService(stores)
+
+        assert await service.move_user("user-1", target) > 0
+        assert await stores.shards[source].session_store.get(session_id) is None
+        assert (await stores.session_store.get(session_id)).user_id == "user-1"
+        assert len(await stores.message_store.list_for_session(session_id)) == 1
+        assert await stores.search_index_store.search("user-1", "solar")
+
+        report = await service.run()
+        assert report.users_moved == 1
+        assert await stores.directory.placed_shard("user-1") == source
+        assert len(await stores.message_store.list_for_session(session_id)) == 1
+    finally:
+        await stores.aclose()
+
+
+@pytest.mark.asyncio
+async def test_purge_keeps_archive_batches_another_shard_still_uses(duckdb_settings, tmp_path):
+    stores = StoreRegistryShardedDuckDB(duckdb_settings, shard_count=2)
+    try:
+        # user-1 and user-2 both hash to shard 0, so they are archived in one batch.
+        kept = await _session_with_message(stores, "user-1")
+        moved = await _session_with_message(stores, "user-2")
+        shard = stores.shards[0]
+        await shard.maintenance_store.archive_sessions([kept, moved])
+        await ShardRebalanceService(stores).move_user("user-2", 1)
+
+        await stores.shards[1].maintenance_store.purge_sessions([moved])
+        policy = RetentionPolicy(file_grace_seconds=0)
+        shards = [s.maintenance_store for s in stores.shards]
+        report = await PurgeService(shards, tmp_path, policy).run()
+
+        assert report.batches_deleted == 0
+        assert (await stores.session_store.get(kept)).user_id == "user-1"
+        assert len(await stores.message_store.list_for_session(kept)) == 1
+
+        await shard.maintenance_store.purge_sessions([kept])
+        report = await PurgeService(shards, tmp_path, policy).run()
+        assert report.batches_deleted == 1
+        assert list(shard.archive.archive_dir.glob("*/batch=*")) == []
+    finally:
+        await stores.aclose()
+
+
+@pytest.mark.asyncio
+async def test_import_unsharded_moves_archived_sessions_into_the_shards(duckdb_settings):
+    unsharded = StoreRegistryDuckDB(duckdb_settings)
+    hot = await unsharded.session_store.create(ResearchSessionCreate(prompt="hot"), "user-1")
+    archived = await unsharded.session_store.create(ResearchSessionCreate(prompt="old"), "user-3")
+    await unsharded.message_store.create(
+        MessageCreate(session_id=archived.session_id, role="user", content="hello")
+    )
+    await unsharded.maintenance_store.archive_sessions([archived.session_id])
+    await unsharded.aclose()
+
+    stores = StoreRegistryShardedDuckDB(duckdb_settings, shard_count=2)
+    try:
+        report = await ShardRebalanceService(stores).import_unsharded()
+
+        assert report.users_imported == 2
+        assert await stores.home.maintenance_store.user_ids() == []
+        assert (await stores.session_store.get(hot.session_id)).prompt == "hot"
+        assert (await stores.session_store.get(archived.session_id)).prompt == "old"
+        messages = await stores.message_store.list_for_session(archived.session_id)
+        assert [m.content for m in messages] == ["hello"]
+        listed = await stores.session_store.list_for_user("user-3")
+        assert [s.session_id for s in listed] == [archived.session_id]
+    finally:
+        await stores.aclose()
@@ -27,3 +27,27 @@ async def test_source_store_crud(duckdb_settings):
 
     await store.delete_for_session('session-123')
     assert await store.list_for_session('session-123') == []
+
+
+@pytest.mark.asyncio
+async def test_source_store_create_many(duckdb_settings):
+    store = SourceStoreDuckDB(duckdb_settings)
+
+    creates = [
+        SourceCreate(
+            session_id='session-bulk',
+            title=f'Source {idx}',
+            url=f'https://example.com/{idx}',
+            snippet=f'Snippet {idx}',
+            confidence=0.5,
+        )
+        for idx in range(120)
+    ]
+    sources = await store.create_many(creates)
+    assert len(sources) == 120
+    assert len({source.source_id for source in sources}) == 120
+
+    results = await store.list_for_session('session-bulk')
+    assert {source.title for source in results} == {create.title for create in creates}
+
+    assert await store.create_many([]) == []
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import ResearchSessionCreate, UserCreate
+from infograph.stores.duckdb.store_registry_duckdb import StoreRegistryDuckDB
+
+
+@pytest.mark.asyncio
+async def test_registry_shares_one_client_across_stores(duckdb_settings):
+    registry = StoreRegistryDuckDB(duckdb_settings)
+
+    assert registry.user_store is registry.user_store
+    assert registry.session_store is registry.session_store
+
+    stores = [
+        registry.user_store,
+        registry.session_store,
+        registry.source_store,
+        registry.message_store,
+        registry.infographic_store,
+    ]
+    assert all(store.store.client is registry.client() for store in stores)
+    assert registry.client_count == 1
+
+    user = await registry.user_store.create(
+        UserCreate(email="a@b.com", name="Test", google_id="google-123")
+    )
+    session = await registry.session_store.create(
+        ResearchSessionCreate(prompt="shared client"), user.user_id
+    )
+    assert (await registry.session_store.get(session.session_id)) is not None
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from infograph.stores.ttl_cache import TTLCache
+
+
+def test_ttl_cache_expires_entries_and_counts_lookups(fake_clock):
+    clock = fake_clock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+
+    assert cache.get("a") is None
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    clock.now = 5
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 0)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_skips_sets_for_keys_invalidated_since_the_generation_was_read():
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=60)
+    generation = cache.generation("a")
+    cache.invalidate("a")
+    cache.set("a", 1, generation=generation)
+    assert cache.get("a") is None
+
+    cache.set("a", 2, generation=cache.generation("a"))
+    assert cache.get("a") == 2
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+
+import duckdb
 import pytest
 
 from infograph.core.schemas import UserCreate
@@ -19,9 +22,24 @@ async def test_user_store_crud(duckdb_settings):
 
     updated = await store.update(fetched.model_copy(update={"name": "Updated"}))
     assert updated.name == "Updated"
+    assert updated.profile_version == 1
+    assert (await store.update(updated)).profile_version == 2
 
     all_users = await store.list()
     assert any(u.user_id == user.user_id for u in all_users)
 
     await store.delete(user.user_id)
     assert await store.get(user.user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_upserts_store_one_user_per_google_id(duckdb_settings):
+    store = UserStoreDuckDB(duckdb_settings)
+    create = UserCreate(email="user@example.com", name="Tester", google_id="google-123")
+
+    users = await asyncio.gather(*(store.upsert_by_google_id(create) for _ in range(8)))
+
+    assert len({user.user_id for user in users}) == 1
+    assert len(await store.list()) == 1
+    with pytest.raises(duckdb.ConstraintException):
+        await store.create(create)
@@ -0,0 +1,95 @@
+"""Tests for the verified-token cache in AuthService."""
+
+from __future__ import annotations
+
+import pytest
+
+from infograph.core.schemas import User
+from infograph.services.auth_service import AuthService, AuthSettings
+from infograph.services.token_cache import VerifiedTokenCache
+from infograph.stores.abstract_user_store import AbstractUserStore
+
+
+def _auth_service(user_store: AbstractUserStore, cache: VerifiedTokenCache) -> AuthService:
+    def fake_token_verifier(credential: str, audience: str) -> dict[str, str]:
+        return {"email": "user@example.com", "name": "User", "sub": "google-123"}
+
+    return AuthService(
+        user_store,
+        token_verifier=fake_token_verifier,
+        settings=AuthSettings(jwt_secret="test-secret", google_client_id="test-client"),
+        token_cache=cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_tokens_skip_the_user_store_until_invalidated(counting_user_store):
+    user_store = counting_user_store
+    cache = VerifiedTokenCache(max_size=10)
+    auth_service = _auth_service(user_store, cache)
+    user, token = await auth_service.authenticate("credential")
+
+    for _ in range(3):
+        assert (await auth_service.get_user_from_token(token)).user_id == user.user_id
+    assert user_store.gets == 1
+
+    auth_service.invalidate_user(user.user_id)
+    await auth_service.get_user_from_token(token)
+    assert user_store.gets == 2
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_cached_tokens_expire_with_the_token_or_the_ttl(fake_clock):
+    clock = fake_clock()
+    wall_clock = fake_clock(1_000.0)
+    cache = VerifiedTokenCache(max_size=10, clock=clock, wall_clock=wall_clock, ttl_seconds=90)
+    user = User(
+        user_id="user-1",
+        email="user@example.com",
+        name="User",
+        google_id="google-1",
+        created_at=0,
+        updated_at=0,
+    )
+
+    cache.put("token", {"user_id": "user-1", "exp": 1_060}, user, cache.generation("user-1"))
+    cache.put("expired", {"user_id": "user-1", "exp": 999}, user, 0)
+    cache.put("long-lived", {"user_id": "user-1", "exp": 1_000 + 86_400}, user, 0)
+
+    assert cache.get("token") is not None
+    assert cache.get("expired") is None
+    clock.now = 60.0
+    assert cache.get("token") is None
+    assert cache.get("long-lived") is not None
+    clock.now = 90.0
+    assert cache.get("long-lived") is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_tokens_are_not_cached(counting_user_store):
+    auth_service = _auth_service(counting_user_store, VerifiedTokenCache(max_size=10))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await auth_service.get_user_from_token("not-a-jwt")
+    assert auth_service.token_cache.stats().size == 0
+
+
+@pytest.mark.asyncio
+async def test_users_changed_through_the_store_stop_resolving_from_the_cache(
+    counting_user_store,
+):
+    user_store = counting_user_store
+    auth_service = _auth_service(user_store, VerifiedTokenCache(max_size=10))
+    user, token = await auth_service.authenticate("credential")
+    await auth_service.get_user_from_token(token)
+
+    await auth_service.user_store.update(user.model_copy(update={"name": "Renamed"}))
+    assert (await auth_service.get_user_from_token(token)).name == "Renamed"
+
+    await auth_service.user_store.delete(user.user_id)
+    with pytest.raises(ValueError):
+        await auth_service.get_user_from_token(token)